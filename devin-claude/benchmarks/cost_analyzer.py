@@ -13,8 +13,9 @@ Usage:
 import argparse
 import json
 import sys
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Deque, Dict, List, Any
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
@@ -68,9 +69,34 @@ class CostSummary:
 class CostAnalyzer:
     """Cost analysis tool."""
 
-    def __init__(self):
-        """Initialize cost analyzer."""
-        self.calls: List[APICall] = []
+    def __init__(self, history: int = 10_000):
+        """
+        Initialize cost analyzer.
+
+        Args:
+            history: Maximum number of calls kept for detailed views.
+                Older calls are evicted but stay counted in the summary.
+        """
+        # Only the last `history` calls are retained (print_detailed_calls
+        # and save_report only need recent calls); summary stats are kept
+        # as running totals so memory stays bounded in long-running monitors.
+        self.calls: Deque[APICall] = deque(maxlen=history)
+        self._total_calls = 0
+        self._total_in = 0
+        self._total_out = 0
+        self._total_cost = 0.0
+        self._by_model: Dict[str, float] = {}
+        self._by_task: Dict[str, float] = {}
+
+    def _record(self, call: APICall):
+        """Append a call and update running totals."""
+        self.calls.append(call)
+        self._total_calls += 1
+        self._total_in += call.input_tokens
+        self._total_out += call.output_tokens
+        self._total_cost += call.cost
+        self._by_model[call.model] = self._by_model.get(call.model, 0) + call.cost
+        self._by_task[call.task_type] = self._by_task.get(call.task_type, 0) + call.cost
 
     def add_call(
         self,
@@ -116,7 +142,7 @@ class CostAnalyzer:
             cached_tokens=cached_tokens
         )
 
-        self.calls.append(call)
+        self._record(call)
 
     def estimate_cost(
         self,
@@ -154,7 +180,7 @@ class CostAnalyzer:
         Returns:
             CostSummary
         """
-        if not self.calls:
+        if not self._total_calls:
             return CostSummary(
                 total_calls=0,
                 total_input_tokens=0,
@@ -167,30 +193,18 @@ class CostAnalyzer:
                 cost_by_task_type={}
             )
 
-        total_input = sum(c.input_tokens for c in self.calls)
-        total_output = sum(c.output_tokens for c in self.calls)
-        total_cost = sum(c.cost for c in self.calls)
-
-        # Group by model
-        cost_by_model = {}
-        for call in self.calls:
-            cost_by_model[call.model] = cost_by_model.get(call.model, 0) + call.cost
-
-        # Group by task type
-        cost_by_task = {}
-        for call in self.calls:
-            cost_by_task[call.task_type] = cost_by_task.get(call.task_type, 0) + call.cost
+        total_tokens = self._total_in + self._total_out
 
         return CostSummary(
-            total_calls=len(self.calls),
-            total_input_tokens=total_input,
-            total_output_tokens=total_output,
-            total_tokens=total_input + total_output,
-            total_cost=total_cost,
-            avg_cost_per_call=total_cost / len(self.calls),
-            avg_tokens_per_call=(total_input + total_output) / len(self.calls),
-            cost_by_model=cost_by_model,
-            cost_by_task_type=cost_by_task
+            total_calls=self._total_calls,
+            total_input_tokens=self._total_in,
+            total_output_tokens=self._total_out,
+            total_tokens=total_tokens,
+            total_cost=self._total_cost,
+            avg_cost_per_call=self._total_cost / self._total_calls,
+            avg_tokens_per_call=total_tokens / self._total_calls,
+            cost_by_model=dict(self._by_model),
+            cost_by_task_type=dict(self._by_task)
         )
 
     def print_summary(self):
@@ -232,7 +246,7 @@ class CostAnalyzer:
         print(f"\nDetailed Calls (showing last {limit}):")
         print("-" * 100)
 
-        calls_to_show = self.calls[-limit:] if len(self.calls) > limit else self.calls
+        calls_to_show = list(self.calls)[-limit:]
 
         for i, call in enumerate(calls_to_show, 1):
             print(f"{i}. {call.timestamp}")
@@ -287,7 +301,7 @@ class CostAnalyzer:
         if "calls" in data:
             for call_data in data["calls"]:
                 call = APICall(**call_data)
-                self.calls.append(call)
+                self._record(call)
 
         print(f"Loaded {len(self.calls)} API calls from {log_file}")
 
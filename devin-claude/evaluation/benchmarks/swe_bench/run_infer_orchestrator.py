@@ -22,9 +22,11 @@ Usage:
 
 import asyncio
 import copy
+import functools
 import json
+import logging
 import os
-import tempfile
+import time
 from typing import Any, Literal
 
 import pandas as pd
@@ -59,7 +61,6 @@ from evaluation.utils.shared import (
     make_metadata,
     prepare_dataset,
     reset_logger_for_multiprocessing,
-    run_evaluation,
     update_llm_config_for_completions_logging,
 )
 from openhands.controller.state.state import State
@@ -125,12 +126,40 @@ def _get_swebench_workspace_dir_name(instance: pd.Series) -> str:
         return f'{instance.repo}__{instance.version}'.replace('/', '__')
 
 
+@functools.lru_cache(maxsize=None)
+def _first_test_framework(repo: str) -> str:
+    """Get the first verbose test framework command for a repo."""
+    return next(iter(MAP_REPO_TO_TEST_FRAMEWORK_VERBOSE[repo].values()))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_template_env(prompts_dir: str) -> Environment:
+    """Build the Jinja2 environment once; compiled templates are cached."""
+    return Environment(
+        loader=FileSystemLoader(prompts_dir), auto_reload=False, cache_size=50
+    )
+
+
+# Rendered instructions keyed by (instance_id, template_name): the same
+# instance is rendered twice per evaluation (orchestrator run + EvalOutput).
+_instruction_cache: dict[tuple[str, str], str] = {}
+
+# Single source of truth for (mode, model_family) -> template routing.
+_TEMPLATE_MAP = {
+    ('swe', 'gpt-4.1'): 'swe_gpt4.j2',
+    ('swe', 'default'): 'swe_default.j2',
+    ('swt', '*'): 'swt.j2',
+    ('swt-ci', '*'): 'swt.j2',
+}
+
+
 def get_instruction(instance: pd.Series, metadata: EvalMetadata) -> str:
     """
     Get instruction for the task.
 
     Returns the instruction text instead of MessageAction for easier
-    processing by TaskOrchestrator.
+    processing by TaskOrchestrator. Rendered output is memoized per
+    (instance_id, template_name) so repeat calls skip file I/O entirely.
 
     Args:
         instance: SWE-bench instance
@@ -143,25 +172,26 @@ def get_instruction(instance: pd.Series, metadata: EvalMetadata) -> str:
     mode = metadata.details['mode']
     llm_model = metadata.llm_config.model
 
-    # Determine the template file based on mode and LLM
-    if metadata.instruction_template_name:
-        template_name = metadata.instruction_template_name
-    elif mode.startswith('swt'):
-        template_name = 'swt.j2'
-    elif mode == 'swe':
-        if 'gpt-4.1' in llm_model:
-            template_name = 'swe_gpt4.j2'
-        else:
-            template_name = 'swe_default.j2'
-    else:
+    # Determine the template file based on mode and LLM via the routing table
+    model_family = 'gpt-4.1' if 'gpt-4.1' in llm_model else 'default'
+    template_name = (
+        metadata.instruction_template_name
+        or _TEMPLATE_MAP.get((mode, model_family))
+        or _TEMPLATE_MAP.get((mode, '*'))
+    )
+    if template_name is None:
         logger.error(f'Unexpected evaluation mode: {mode}. Falling back to default.')
         template_name = 'swe_default.j2'
 
     logger.debug(f'Using instruction template file: {template_name}')
 
-    # Set up Jinja2 environment
+    cache_key = (instance.instance_id, template_name)
+    if cache_key in _instruction_cache:
+        return _instruction_cache[cache_key]
+
+    # Set up Jinja2 environment (shared; templates compiled once)
     prompts_dir = os.path.join(os.path.dirname(__file__), 'prompts')
-    env = Environment(loader=FileSystemLoader(prompts_dir))
+    env = _get_template_env(prompts_dir)
     template = env.get_template(template_name)
 
     # Prepare context for rendering
@@ -174,11 +204,12 @@ def get_instruction(instance: pd.Series, metadata: EvalMetadata) -> str:
     # Add specific context for swt-ci mode if needed
     if mode == 'swt-ci':
         context['test_instructions'] = (
-            f'The following command can be used to run the tests: `{list(MAP_REPO_TO_TEST_FRAMEWORK_VERBOSE[instance.repo].values())[0]}`. Make sure they fail in the expected way.\n'
+            f'The following command can be used to run the tests: `{_first_test_framework(instance.repo)}`. Make sure they fail in the expected way.\n'
         )
 
     # Render the template
     instruction = template.render(context)
+    _instruction_cache[cache_key] = instruction
     return instruction
 
 
@@ -187,7 +218,7 @@ async def run_swe_bench_with_orchestrator(
     metadata: EvalMetadata,
     runtime: Runtime,
     config: OpenHandsConfig,
-) -> State:
+) -> tuple[State, str]:
     """
     Run SWE-bench task using TaskOrchestrator.
 
@@ -200,7 +231,8 @@ async def run_swe_bench_with_orchestrator(
         config: OpenHands configuration
 
     Returns:
-        Final state after execution
+        Tuple of (final state, rendered instruction). The instruction is
+        returned so callers storing it in EvalOutput don't re-render it.
     """
     # Get instruction
     instruction = get_instruction(instance, metadata)
@@ -208,13 +240,6 @@ async def run_swe_bench_with_orchestrator(
     # Create event stream
     event_stream = runtime.event_stream
 
-    # Create orchestrator adapter
-    adapter = OrchestratorAdapter(
-        config=config,
-        event_stream=event_stream,
-        workspace=str(runtime.workspace_root),
-    )
-
     # Extract issue title and body from instruction
     # For SWE-bench, we'll use the problem statement
     issue_title = f"SWE-bench: {instance.instance_id}"
@@ -222,18 +247,21 @@ async def run_swe_bench_with_orchestrator(
 
     logger.info(f"Running SWE-bench task with TaskOrchestrator: {issue_title}")
 
-    try:
+    # The context manager guarantees adapter cleanup (event stream
+    # subscribers, LLM sessions) even when the workflow raises.
+    async with OrchestratorAdapter(
+        config=config,
+        event_stream=event_stream,
+        workspace=str(runtime.workspace_root),
+    ) as adapter:
         # Use GitHub issue workflow for SWE-bench
         state = await adapter.run_github_issue(
             issue_title=issue_title,
             issue_body=issue_body,
             repo_path=str(runtime.workspace_root),
         )
-    finally:
-        # Cleanup
-        adapter.close()
 
-    return state
+    return state, instruction
 
 
 def process_instance(
@@ -274,7 +302,7 @@ def process_instance(
 
     # Run with orchestrator
     try:
-        state: State = asyncio.run(
+        state, instruction = asyncio.run(
             run_swe_bench_with_orchestrator(
                 instance=instance,
                 metadata=metadata,
@@ -292,9 +320,6 @@ def process_instance(
     # Get metrics
     metrics = get_metrics(state)
 
-    # Get instruction
-    instruction = get_instruction(instance, metadata)
-
     # Evaluate the patch
     test_result = evaluate_swe_bench_patch(runtime, instance, metadata)
 
@@ -315,6 +340,163 @@ def process_instance(
     return output
 
 
+async def process_instance_async(
+    instance: pd.Series,
+    metadata: EvalMetadata,
+    reset_logger: bool = True,
+) -> EvalOutput:
+    """
+    Process a single SWE-bench instance on a shared event loop.
+
+    Async variant of process_instance: blocking runtime operations are
+    pushed to worker threads via asyncio.to_thread so that many instances
+    can overlap their Docker startup and LLM wait time.
+
+    Args:
+        instance: SWE-bench instance
+        metadata: Evaluation metadata
+        reset_logger: Whether to reset logger for multiprocessing
+
+    Returns:
+        EvalOutput with results
+    """
+    instance_id = instance.instance_id
+    config = get_config_for_instance(instance, metadata)
+
+    # Concurrent instances share this process and the global openhands
+    # logger, so reset_logger_for_multiprocessing — which swaps handlers
+    # on that shared logger — would clobber other instances mid-run.
+    # Give each instance a child logger with its own file handler instead.
+    log = logger
+    file_handler = None
+    if reset_logger:
+        log_dir = os.path.join(metadata.eval_output_dir, 'infer_logs')
+        os.makedirs(log_dir, exist_ok=True)
+        log_file = os.path.join(log_dir, f'instance_{instance_id}.log')
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(
+            logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        )
+        file_handler.setLevel(logging.INFO)
+        log = logger.getChild(instance_id)
+        log.addHandler(file_handler)
+    log.info(f'Starting evaluation for instance {instance_id}.')
+
+    try:
+        # Create runtime without blocking the loop; Runtime.connect is a
+        # coroutine, so await it directly rather than bouncing it through
+        # call_async_from_sync and a throwaway loop in another thread.
+        runtime = await asyncio.to_thread(create_runtime, config)
+        await runtime.connect()
+
+        # Initialize runtime (clone repo, setup environment, etc.)
+        await asyncio.to_thread(
+            initialize_swe_bench_runtime, runtime, instance, metadata
+        )
+
+        # Run with orchestrator
+        try:
+            state, instruction = await run_swe_bench_with_orchestrator(
+                instance=instance,
+                metadata=metadata,
+                runtime=runtime,
+                config=config,
+            )
+        except Exception as e:
+            log.error(f"Error running instance {instance_id}: {e}")
+            state = None
+
+        if state is None:
+            raise ValueError('State should not be None.')
+
+        # Get metrics
+        metrics = get_metrics(state)
+
+        # Evaluate the patch
+        test_result = await asyncio.to_thread(
+            evaluate_swe_bench_patch, runtime, instance, metadata
+        )
+
+        # Prepare output
+        from evaluation.utils.shared import compatibility_for_eval_history_pairs
+        histories = compatibility_for_eval_history_pairs(state.history)
+
+        output = EvalOutput(
+            instance_id=instance_id,
+            instruction=instruction,
+            metadata=metadata,
+            history=histories,
+            metrics=metrics,
+            error=state.last_error if state and state.last_error else None,
+            test_result=test_result,
+        )
+
+        return output
+    finally:
+        if file_handler is not None:
+            log.removeHandler(file_handler)
+            file_handler.close()
+
+
+async def run_instances_concurrently(
+    instances: pd.DataFrame,
+    metadata: EvalMetadata,
+    output_file: str,
+    num_workers: int,
+    max_retries: int = 5,
+):
+    """
+    Run all instances on one event loop with bounded concurrency.
+
+    Replaces the per-instance asyncio.run calls of the sync path: the
+    orchestrator work is I/O bound (LLM responses, runtime round-trips),
+    so overlapping instances behind a Semaphore scales throughput with
+    num_workers without multiprocessing.
+
+    Args:
+        instances: Prepared instance DataFrame
+        metadata: Evaluation metadata
+        output_file: JSONL output file path
+        num_workers: Maximum number of instances in flight
+        max_retries: Additional attempts per instance after the first
+            failure (matches run_evaluation's default)
+    """
+    semaphore = asyncio.Semaphore(num_workers)
+    output_fp = open(output_file, 'a')
+
+    async def _run_one(instance: pd.Series):
+        async with semaphore:
+            error = None
+            for attempt in range(max_retries + 1):
+                try:
+                    output = await process_instance_async(instance, metadata)
+                    break
+                except Exception as e:
+                    error = str(e)
+                    logger.error(
+                        f'Instance {instance.instance_id} failed '
+                        f'(attempt {attempt + 1}/{max_retries + 1}): {e}'
+                    )
+            else:
+                # Mirror _process_instance_wrapper: a final failure still
+                # writes a line, so failed instances stay distinguishable
+                # from never-run ones and completed-count accounting holds
+                output = EvalOutput(
+                    instance_id=instance.instance_id,
+                    test_result={},
+                    error=error,
+                )
+            output_fp.write(output.model_dump_json() + '\n')
+            output_fp.flush()
+
+    try:
+        await asyncio.gather(
+            *(_run_one(instance) for _, instance in instances.iterrows())
+        )
+    finally:
+        output_fp.close()
+
+
 def get_config_for_instance(
     instance: pd.Series,
     metadata: EvalMetadata,
@@ -368,27 +550,45 @@ def initialize_swe_bench_runtime(
     """
     logger.info(f"Initializing runtime for {instance.instance_id}")
 
-    # Clone repository
-    action = CmdRunAction(
-        command=f"git clone https://github.com/{instance.repo} /workspace/{instance.repo.split('/')[-1]}"
-    )
-    obs = runtime.run_action(action)
-    logger.info(f"Clone output: {obs}")
-
-    # Checkout specific version
     repo_dir = f"/workspace/{instance.repo.split('/')[-1]}"
-    action = CmdRunAction(
-        command=f"cd {repo_dir} && git checkout {instance.base_commit}"
+
+    # Fuse clone, checkout and install into one shell command: each
+    # run_action is a full round-trip through the runtime event stream,
+    # which dominates the cost of short commands. Reruns of a failed
+    # instance skip the clone and only fetch the base commit; shallow
+    # history keeps the transfer small either way.
+    command = (
+        f"set -e && "
+        f"if [ -d {repo_dir}/.git ]; then "
+        f"cd {repo_dir} && "
+        f"git fetch --depth=50 origin {instance.base_commit} && "
+        f"git checkout {instance.base_commit}; "
+        f"else "
+        f"git clone --depth=50 https://github.com/{instance.repo} {repo_dir} && "
+        f"cd {repo_dir} && "
+        # Base commits are rarely within the last 50 commits of the
+        # default branch, so fetch the SHA explicitly (as the rerun
+        # branch does) before checking it out
+        f"git fetch --depth=1 origin {instance.base_commit} && "
+        f"git checkout {instance.base_commit}; "
+        f"fi"
     )
-    obs = runtime.run_action(action)
-    logger.info(f"Checkout output: {obs}")
 
-    # Install dependencies (if specified)
     if hasattr(instance, 'repo') and instance.repo in MAP_REPO_TO_INSTALL:
+        # The install can take minutes; a sentinel file makes it
+        # idempotent so retries of a failed instance skip it entirely.
         install_cmd = MAP_REPO_TO_INSTALL[instance.repo]
-        action = CmdRunAction(command=f"cd {repo_dir} && {install_cmd}")
-        obs = runtime.run_action(action)
-        logger.info(f"Install output: {obs}")
+        command += (
+            f" && cd {repo_dir}"
+            f" && ([ -f .install_done ] || ({install_cmd} && touch .install_done))"
+        )
+
+    action = CmdRunAction(command=command)
+    obs = runtime.run_action(action)
+    # Lazy %s formatting: str(obs) includes the full command stdout, so
+    # only pay for it when INFO is actually emitted.
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Runtime init output: %s", obs)
 
 
 def evaluate_swe_bench_patch(
@@ -413,31 +613,37 @@ def evaluate_swe_bench_patch(
 
     repo_dir = f"/workspace/{instance.repo.split('/')[-1]}"
 
-    # Run tests
-    if hasattr(instance, 'test_patch'):
-        # Apply test patch if available
-        test_patch_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.patch')
-        test_patch_file.write(instance.test_patch)
-        test_patch_file.close()
-
-        # Copy to runtime and apply
-        # (This is simplified - actual implementation would need file transfer)
-
     # Get test command
     test_cmd = "pytest"  # Default, should be instance-specific
 
     if hasattr(instance, 'repo') and instance.repo in MAP_REPO_TO_TEST_FRAMEWORK_VERBOSE:
-        test_framework = list(MAP_REPO_TO_TEST_FRAMEWORK_VERBOSE[instance.repo].values())[0]
-        test_cmd = test_framework
+        test_cmd = _first_test_framework(instance.repo)
+
+    # Stream the test patch into the runtime via a here-doc and run the
+    # tests in the same command: no host tempfile, no file transfer, one
+    # runtime round-trip.
+    if hasattr(instance, 'test_patch') and instance.test_patch:
+        command = (
+            f"cat > /tmp/test.patch <<'PATCH_EOF'\n"
+            f"{instance.test_patch}\n"
+            f"PATCH_EOF\n"
+            f"cd {repo_dir} && git apply /tmp/test.patch && {test_cmd}"
+        )
+    else:
+        command = f"cd {repo_dir} && {test_cmd}"
 
-    # Run tests
-    action = CmdRunAction(command=f"cd {repo_dir} && {test_cmd}")
+    action = CmdRunAction(command=command)
     obs = runtime.run_action(action)
 
-    # Parse results
+    # Parse results. Pass/fail only needs the exit code; keep just the
+    # tail of the (potentially multi-MB) pytest output so output.jsonl
+    # stays small.
+    max_output = 64 * 1024
+    truncated = len(obs.content) > max_output
     test_result = {
         'exit_code': obs.exit_code,
-        'output': obs.content,
+        'output': obs.content[-max_output:] if truncated else obs.content,
+        'output_truncated': truncated,
         'passed': obs.exit_code == 0,
     }
 
@@ -460,8 +666,24 @@ if __name__ == '__main__':
     dataset_name = args.dataset_name or 'princeton-nlp/SWE-bench_Lite'
     set_dataset_type(dataset_name)
 
-    dataset = load_dataset(dataset_name, split='test')
-    dataset = pd.DataFrame(dataset)
+    # Cache the dataset to local parquet so repeat eval runs skip the
+    # HuggingFace network path entirely; refresh weekly.
+    cache_dir = os.path.expanduser('~/.cache/swe-bench-eval')
+    cache_path = os.path.join(
+        cache_dir, dataset_name.replace('/', '__') + '.parquet'
+    )
+    cache_max_age = 7 * 24 * 3600
+    if (
+        os.path.exists(cache_path)
+        and time.time() - os.path.getmtime(cache_path) < cache_max_age
+    ):
+        logger.info(f'Loading dataset from local cache: {cache_path}')
+        dataset = pd.read_parquet(cache_path)
+    else:
+        dataset = pd.DataFrame(load_dataset(dataset_name, split='test'))
+        os.makedirs(cache_dir, exist_ok=True)
+        dataset.to_parquet(cache_path)
+        logger.info(f'Cached dataset to {cache_path}')
 
     # Get LLM config
     llm_config = None
@@ -493,13 +715,14 @@ if __name__ == '__main__':
     logger.info(f"Dataset: {dataset_name}")
     logger.info(f"Instances: {len(instances)}")
 
-    # Run evaluation
-    run_evaluation(
-        instances,
-        metadata,
-        output_file,
-        args.eval_num_workers,
-        process_instance,
+    # Run evaluation on a single shared event loop
+    asyncio.run(
+        run_instances_concurrently(
+            instances,
+            metadata,
+            output_file,
+            args.eval_num_workers,
+        )
     )
 
     logger.info("SWE-bench evaluation with TaskOrchestrator completed!")
@@ -16,6 +16,25 @@ import requests
 import time
 import json
 
+from requests.adapters import HTTPAdapter
+
+# Prefer orjson's C serializer for pretty-printing payloads; fall back
+# to stdlib json when it isn't installed.
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, indent=2)
+
+# Reuse one keep-alive connection across all examples instead of paying
+# a fresh TCP handshake per request.
+session = requests.Session()
+session.headers.update({"Accept": "application/json"})
+session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
 
 def example_simple_task():
     """Example: Execute a simple task via API."""
@@ -24,7 +43,7 @@ def example_simple_task():
     print("=" * 60)
 
     # Submit task
-    response = requests.post(
+    response = session.post(
         "http://localhost:3000/api/orchestrator/task",
         json={
             "task": "Create a Python function to calculate fibonacci numbers",
@@ -42,10 +61,12 @@ def example_simple_task():
     print(f"Task submitted: {task_id}")
     print(f"Status: {result['status']}")
 
-    # Poll for completion
+    # Poll for completion with exponential backoff: short tasks finish in
+    # a few hundred ms, so start small instead of a fixed 2s sleep.
     print("\nWaiting for task to complete...")
+    delay = 0.1
     while True:
-        status_response = requests.get(
+        status_response = session.get(
             f"http://localhost:3000/api/orchestrator/status/{task_id}"
         )
 
@@ -59,11 +80,12 @@ def example_simple_task():
         if status["status"] in ("completed", "failed"):
             break
 
-        time.sleep(2)
+        time.sleep(delay)
+        delay = min(delay * 2, 5.0)
 
     # Get result
     if status["status"] == "completed":
-        result_response = requests.get(
+        result_response = session.get(
             f"http://localhost:3000/api/orchestrator/result/{task_id}"
         )
 
@@ -72,7 +94,7 @@ def example_simple_task():
             print("\nTask completed!")
             print(f"Agent State: {result['agent_state']}")
             print(f"Iterations: {result['iteration']}")
-            print(f"Result: {json.dumps(result['result'], indent=2)}")
+            print(f"Result: {_dumps(result['result'])}")
         else:
             print(f"Error getting result: {result_response.text}")
     else:
@@ -86,7 +108,7 @@ def example_github_issue():
     print("=" * 60)
 
     # Submit GitHub issue task
-    response = requests.post(
+    response = session.post(
         "http://localhost:3000/api/orchestrator/github-issue",
         json={
             "title": "Add error handling to API endpoints",
@@ -120,8 +142,9 @@ def example_github_issue():
     print("\nWaiting for GitHub issue workflow to complete...")
     print("This may take several minutes...")
 
+    delay = 0.5
     while True:
-        status_response = requests.get(
+        status_response = session.get(
             f"http://localhost:3000/api/orchestrator/status/{task_id}"
         )
 
@@ -135,11 +158,12 @@ def example_github_issue():
         if status["status"] in ("completed", "failed"):
             break
 
-        time.sleep(5)
+        time.sleep(delay)
+        delay = min(delay * 2, 10.0)
 
     # Get result
     if status["status"] == "completed":
-        result_response = requests.get(
+        result_response = session.get(
             f"http://localhost:3000/api/orchestrator/result/{task_id}"
         )
 
@@ -160,7 +184,7 @@ def example_health_check():
     print("Example 3: Health Check")
     print("=" * 60)
 
-    response = requests.get("http://localhost:3000/api/orchestrator/health")
+    response = session.get("http://localhost:3000/api/orchestrator/health")
 
     if response.status_code == 200:
         health = response.json()
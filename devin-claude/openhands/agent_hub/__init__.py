@@ -16,6 +16,6 @@ Usage:
         results = await hub.execute_task("code", "Implement feature X")
 """
 
-from .hub import AgentHub, AgentConfig
+from .hub import AgentHub, AgentConfig, AgentPoolConfig
 
-__all__ = ["AgentHub", "AgentConfig"]
+__all__ = ["AgentHub", "AgentConfig", "AgentPoolConfig"]
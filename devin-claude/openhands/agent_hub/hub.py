@@ -25,15 +25,141 @@ Usage:
 from claude_agent_sdk import ClaudeSDKClient, ClaudeAgentOptions
 from typing import Dict, List, Optional, Callable
 import asyncio
+import contextlib
+import functools
 import logging
+import os
+import sys
+import time
+from collections import OrderedDict, defaultdict
 from pathlib import Path
 
-from openhands.mcp_servers.jupyter_mcp import create_jupyter_mcp_server
-from openhands.mcp_servers.browser_mcp import create_browser_mcp_server
-
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=16)
+def _read_prompt_cached(path_str: str, mtime_ns: int) -> str:
+    """Read a prompt file, cached per (path, mtime) across hub instances."""
+    # read_bytes + explicit decode avoids read_text's locale-dependent
+    # encoding lookup; prompts are always UTF-8
+    return Path(path_str).read_bytes().decode("utf-8")
+
+# Placeholder stored in AgentConfig.mcp_servers; resolved to a real MCP
+# server instance at client-creation time so hubs that never request a
+# browser/python agent never pay the import or construction cost.
+_LAZY_MCP = "__lazy__"
+
+
+# Agent types that can share one underlying client: same tool family and
+# no per-type MCP servers, so only the persona prompt differs
+_SHAREABLE_TYPES = frozenset({"code", "analysis", "testing"})
+
+
+# Interned tool names shared by every config, grouped into frozensets so
+# `tool in allowed_tools` checks are O(1) hash lookups instead of list scans
+_TOOL_READ = sys.intern("Read")
+_TOOL_WRITE = sys.intern("Write")
+_TOOL_EDIT = sys.intern("Edit")
+_TOOL_GLOB = sys.intern("Glob")
+_TOOL_GREP = sys.intern("Grep")
+_TOOL_BASH = sys.intern("Bash")
+
+_BASE_RO_TOOLS = frozenset({_TOOL_READ, _TOOL_GREP, _TOOL_GLOB})
+_CODE_TOOLS = _BASE_RO_TOOLS | {_TOOL_WRITE, _TOOL_EDIT, _TOOL_BASH}
+_TESTING_TOOLS = frozenset({_TOOL_READ, _TOOL_BASH})
+_BROWSER_TOOLS = frozenset({
+    _TOOL_READ,
+    "mcp__browser__navigate",
+    "mcp__browser__interact",
+    "mcp__browser__extract_content",
+    "mcp__browser__screenshot",
+    "mcp__browser__get_page_info",
+})
+_PYTHON_TOOLS = frozenset({
+    _TOOL_READ,
+    "mcp__jupyter__execute_python",
+    "mcp__jupyter__kernel_info",
+    "mcp__jupyter__reset_kernel",
+})
+
+
+class _AgentStats:
+    """
+    Per-agent-type counters (pool hits/misses, borrows, task time).
+
+    __slots__ keeps each instance to a handful of machine words so the
+    O(1) updates on every get_agent/execute_task stay allocation-free.
+    """
+
+    __slots__ = ("hits", "misses", "borrows", "total_ms")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.borrows = 0
+        self.total_ms = 0.0
+
+
+class AgentHandle:
+    """
+    Thin per-agent-type view over a shared ClaudeSDKClient.
+
+    Gives a shared subprocess an agent-specific persona by prepending the
+    type's system prompt to each query. The underlying client's lifecycle
+    is owned by the hub, so disconnect() here is a no-op.
+    """
+
+    def __init__(self, client: ClaudeSDKClient, system_prompt: str):
+        self._client = client
+        self._system_prompt = system_prompt
+
+    async def query(self, prompt: str):
+        """Send a query with the agent persona prepended."""
+        return await self._client.query(f"{self._system_prompt}\n\n{prompt}")
+
+    def receive_response(self):
+        """Stream the response from the shared client."""
+        return self._client.receive_response()
+
+    async def disconnect(self):
+        """No-op: the hub owns the shared client's lifecycle."""
+        logger.debug("AgentHandle.disconnect() ignored (shared client)")
+
+
+class AgentPoolConfig:
+    """
+    Configuration for agent pre-warming.
+
+    Each ClaudeSDKClient.connect() pays the Claude CLI subprocess startup
+    cost (tens of seconds), so connecting agents during hub setup moves
+    that latency off the first request.
+    """
+
+    def __init__(
+        self,
+        min_warm: int = 0,
+        max_size: int = 50,
+        idle_ttl: float = 0.0,
+        reap_interval: float = 30.0
+    ):
+        """
+        Initialize pool configuration.
+
+        Args:
+            min_warm: When > 0, connect every configured agent type in
+                parallel on context-manager entry (0 keeps lazy creation)
+            max_size: Maximum number of concurrently connected agents;
+                the least recently used agent is disconnected when full
+            idle_ttl: Seconds an agent may sit idle before the reaper
+                disconnects it (0 disables idle reaping)
+            reap_interval: How often the reaper scans for idle agents
+        """
+        self.min_warm = min_warm
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+        self.reap_interval = reap_interval
+
+
 class AgentConfig:
     """
     Configuration for a specialized agent.
@@ -45,7 +171,7 @@ class AgentConfig:
     def __init__(
         self,
         agent_type: str,
-        allowed_tools: List[str],
+        allowed_tools,
         system_prompt: str,
         mcp_servers: Optional[Dict] = None,
         permission_mode: str = "accept",
@@ -57,8 +183,10 @@ class AgentConfig:
 
         Args:
             agent_type: Type identifier (code, analysis, testing, browser, python)
-            allowed_tools: List of tool names this agent can use
-            system_prompt: System prompt defining agent behavior
+            allowed_tools: Tool names this agent can use (a list or
+                frozenset; frozensets give O(1) membership checks)
+            system_prompt: System prompt defining agent behavior (a string,
+                or a zero-arg callable returning one for lazy loading)
             mcp_servers: Optional dict of MCP servers to enable
             permission_mode: Permission mode (accept, acceptEdits, prompt)
             max_turns: Maximum conversation turns
@@ -72,6 +200,9 @@ class AgentConfig:
         self.max_turns = max_turns
         self.model = model
 
+        # Memoized ClaudeAgentOptions (built on first client creation)
+        self._options = None
+
 
 class AgentHub:
     """
@@ -92,7 +223,9 @@ class AgentHub:
         self,
         workspace: str,
         api_key: str,
-        prompts_dir: Optional[str] = None
+        prompts_dir: Optional[str] = None,
+        pool_config: Optional[AgentPoolConfig] = None,
+        share_readonly_clients: bool = False
     ):
         """
         Initialize Agent Hub.
@@ -101,31 +234,80 @@ class AgentHub:
             workspace: Working directory for agents
             api_key: Anthropic API key
             prompts_dir: Optional custom prompts directory
+            pool_config: Optional pool configuration; pass
+                AgentPoolConfig(min_warm=1) to pre-connect all agent
+                types in parallel on context-manager entry
+            share_readonly_clients: When True, the code/analysis/testing
+                agent types share one underlying ClaudeSDKClient (one CLI
+                subprocess instead of three); each type gets an
+                AgentHandle that prepends its persona prompt per query
         """
         self.workspace = Path(workspace).resolve()
         self.api_key = api_key
         self.prompts_dir = Path(prompts_dir) if prompts_dir else Path(__file__).parent.parent / "prompts"
-
-        # Active agent clients (cached for reuse)
-        self.agents: Dict[str, ClaudeSDKClient] = {}
+        self.pool_config = pool_config or AgentPoolConfig()
+        self.share_readonly_clients = share_readonly_clients
+
+        # Shared client backing AgentHandles when share_readonly_clients
+        # is enabled (created lazily on first shareable get_agent)
+        self._shared_client: Optional[ClaudeSDKClient] = None
+
+        # Active agent clients in LRU order (cached for reuse); each
+        # cached Claude CLI subprocess holds hundreds of MB of RSS, so
+        # the cache is size-bounded and optionally idle-reaped.
+        self.agents: 'OrderedDict[str, ClaudeSDKClient]' = OrderedDict()
+        self._last_used: Dict[str, float] = {}
+        # Tasks currently in flight per agent type; busy agents are never
+        # reaped or LRU-evicted, and _last_used is refreshed when a task
+        # returns so long-running tasks don't read as idle
+        self._active: Dict[str, int] = defaultdict(int)
+        self._reaper_task: Optional[asyncio.Task] = None
+
+        # Per-type creation locks so concurrent get_agent calls on a cold
+        # cache don't both pay connect() and leak the losing client
+        self._creation_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+        # Per-type counters for pool observability (see get_stats)
+        self._stats: Dict[str, _AgentStats] = defaultdict(_AgentStats)
 
         # Agent configurations
         self.configs: Dict[str, AgentConfig] = {}
 
-        # Initialize MCP servers (shared across agents)
-        self.jupyter_mcp = create_jupyter_mcp_server()
-        self.browser_mcp = create_browser_mcp_server()
-
-        # Setup agent configurations
+        # Setup agent configurations (MCP servers are created lazily via
+        # the jupyter_mcp/browser_mcp cached properties)
         self._setup_agent_configs()
 
         logger.info(f"AgentHub initialized with workspace: {self.workspace}")
         logger.info(f"Available agent types: {list(self.configs.keys())}")
 
+    @functools.cached_property
+    def jupyter_mcp(self):
+        """Jupyter MCP server, imported and constructed on first use."""
+        from openhands.mcp_servers.jupyter_mcp import create_jupyter_mcp_server
+        return create_jupyter_mcp_server()
+
+    @functools.cached_property
+    def browser_mcp(self):
+        """Browser MCP server, imported and constructed on first use."""
+        from openhands.mcp_servers.browser_mcp import create_browser_mcp_server
+        return create_browser_mcp_server()
+
+    def _resolve_mcp_servers(self, config: 'AgentConfig') -> Dict:
+        """Materialize lazily declared MCP servers for a config."""
+        if not config.mcp_servers:
+            return {}
+        return {
+            name: getattr(self, f"{name}_mcp") if server is _LAZY_MCP else server
+            for name, server in config.mcp_servers.items()
+        }
+
     def _load_prompt(self, filename: str) -> str:
         """
         Load system prompt from file.
 
+        Reads are cached per (path, mtime), so a prompt is read from disk
+        at most once per process until the file changes.
+
         Args:
             filename: Prompt file name (e.g., "code_agent.txt")
 
@@ -134,11 +316,13 @@ class AgentHub:
         """
         prompt_path = self.prompts_dir / filename
 
-        if not prompt_path.exists():
+        try:
+            mtime_ns = os.stat(prompt_path).st_mtime_ns
+        except FileNotFoundError:
             logger.warning(f"Prompt file not found: {prompt_path}, using default")
             return f"You are a helpful AI assistant for {filename.replace('.txt', '')} tasks."
 
-        return prompt_path.read_text()
+        return _read_prompt_cached(str(prompt_path), mtime_ns)
 
     def _setup_agent_configs(self):
         """Initialize configurations for all specialized agents."""
@@ -146,8 +330,8 @@ class AgentHub:
         # Code Agent: Full editing capabilities
         self.configs["code"] = AgentConfig(
             agent_type="code",
-            allowed_tools=["Read", "Write", "Edit", "Glob", "Grep", "Bash"],
-            system_prompt=self._load_prompt("code_agent.txt"),
+            allowed_tools=_CODE_TOOLS,
+            system_prompt=functools.partial(self._load_prompt, "code_agent.txt"),
             permission_mode="acceptEdits",
             max_turns=50
         )
@@ -155,8 +339,8 @@ class AgentHub:
         # Analysis Agent: Read-only analysis
         self.configs["analysis"] = AgentConfig(
             agent_type="analysis",
-            allowed_tools=["Read", "Grep", "Glob"],
-            system_prompt=self._load_prompt("analysis_agent.txt"),
+            allowed_tools=_BASE_RO_TOOLS,
+            system_prompt=functools.partial(self._load_prompt, "analysis_agent.txt"),
             permission_mode="accept",
             max_turns=30
         )
@@ -164,8 +348,8 @@ class AgentHub:
         # Testing Agent: Run tests
         self.configs["testing"] = AgentConfig(
             agent_type="testing",
-            allowed_tools=["Read", "Bash"],
-            system_prompt=self._load_prompt("testing_agent.txt"),
+            allowed_tools=_TESTING_TOOLS,
+            system_prompt=functools.partial(self._load_prompt, "testing_agent.txt"),
             permission_mode="accept",
             max_turns=20
         )
@@ -173,16 +357,9 @@ class AgentHub:
         # Browser Agent: Web interactions
         self.configs["browser"] = AgentConfig(
             agent_type="browser",
-            allowed_tools=[
-                "Read",
-                "mcp__browser__navigate",
-                "mcp__browser__interact",
-                "mcp__browser__extract_content",
-                "mcp__browser__screenshot",
-                "mcp__browser__get_page_info"
-            ],
-            system_prompt=self._load_prompt("browser_agent.txt"),
-            mcp_servers={"browser": self.browser_mcp},
+            allowed_tools=_BROWSER_TOOLS,
+            system_prompt=functools.partial(self._load_prompt, "browser_agent.txt"),
+            mcp_servers={"browser": _LAZY_MCP},
             permission_mode="accept",
             max_turns=40
         )
@@ -190,20 +367,80 @@ class AgentHub:
         # Python Agent: Code execution
         self.configs["python"] = AgentConfig(
             agent_type="python",
-            allowed_tools=[
-                "Read",
-                "mcp__jupyter__execute_python",
-                "mcp__jupyter__kernel_info",
-                "mcp__jupyter__reset_kernel"
-            ],
-            system_prompt=self._load_prompt("python_agent.txt"),
-            mcp_servers={"jupyter": self.jupyter_mcp},
+            allowed_tools=_PYTHON_TOOLS,
+            system_prompt=functools.partial(self._load_prompt, "python_agent.txt"),
+            mcp_servers={"jupyter": _LAZY_MCP},
             permission_mode="accept",
             max_turns=30
         )
 
         logger.info(f"Configured {len(self.configs)} agent types")
 
+    def _build_options(self, config: AgentConfig) -> ClaudeAgentOptions:
+        """
+        Build (and memoize) the ClaudeAgentOptions for a config.
+
+        The inputs never change for a given agent_type, so the options
+        object is constructed once and reused on later client creations.
+        """
+        if config._options is None:
+            # system_prompt may be a zero-arg callable (lazy prompt load)
+            system_prompt = (
+                config.system_prompt()
+                if callable(config.system_prompt)
+                else config.system_prompt
+            )
+            # The SDK expects a list; sort set-based configs so the
+            # resulting options are deterministic
+            allowed_tools = config.allowed_tools
+            if isinstance(allowed_tools, frozenset):
+                allowed_tools = sorted(allowed_tools)
+            config._options = ClaudeAgentOptions(
+                allowed_tools=allowed_tools,
+                system_prompt=system_prompt,
+                mcp_servers=self._resolve_mcp_servers(config),
+                permission_mode=config.permission_mode,
+                cwd=str(self.workspace),
+                max_turns=config.max_turns,
+                model=config.model
+            )
+        return config._options
+
+    async def _connect_with_timeout(
+        self,
+        client: ClaudeSDKClient,
+        timeout: float = 30.0,
+        retries: int = 2
+    ):
+        """
+        Connect a client with a timeout and bounded retries.
+
+        A hung Claude CLI subprocess would otherwise block get_agent
+        forever; this caps the worst-case cold start at
+        (retries + 1) * timeout and disconnects the orphan before each
+        retry so failed startups don't leak subprocesses.
+
+        Args:
+            client: Client to connect
+            timeout: Seconds to wait per attempt
+            retries: Additional attempts after the first timeout
+
+        Raises:
+            asyncio.TimeoutError: If every attempt times out
+        """
+        for attempt in range(retries + 1):
+            try:
+                return await asyncio.wait_for(client.connect(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"connect() timed out after {timeout}s "
+                    f"(attempt {attempt + 1}/{retries + 1})"
+                )
+                with contextlib.suppress(Exception):
+                    await client.disconnect()
+                if attempt == retries:
+                    raise
+
     async def get_agent(self, agent_type: str) -> ClaudeSDKClient:
         """
         Get or create an agent instance.
@@ -227,30 +464,190 @@ class AgentHub:
         # Return existing agent if already created
         if agent_type in self.agents:
             logger.debug(f"Reusing cached {agent_type} agent")
+            self._stats[agent_type].hits += 1
+            self.agents.move_to_end(agent_type)
+            self._last_used[agent_type] = time.monotonic()
             return self.agents[agent_type]
 
-        # Create new agent
-        config = self.configs[agent_type]
-
-        logger.info(f"Creating new {agent_type} agent")
+        # Double-checked locking: only one coroutine per type pays the
+        # connect() cost; concurrent callers await the same client.
+        async with self._creation_locks[agent_type]:
+            if agent_type in self.agents:
+                logger.debug(f"Reusing {agent_type} agent created concurrently")
+                self._stats[agent_type].hits += 1
+                self.agents.move_to_end(agent_type)
+                self._last_used[agent_type] = time.monotonic()
+                return self.agents[agent_type]
+
+            # Evict the least recently used agent if the cache is full,
+            # skipping agents with tasks in flight
+            while len(self.agents) >= self.pool_config.max_size:
+                victim_type = next(
+                    (t for t in self.agents if not self._active.get(t)),
+                    None,
+                )
+                if victim_type is None:
+                    # Every cached agent is mid-task; overflow the cache
+                    # temporarily rather than disconnect one under a caller
+                    logger.warning(
+                        "Agent cache full but all agents are busy; "
+                        "exceeding max_size until a task completes"
+                    )
+                    break
+                victim = self.agents.pop(victim_type)
+                self._last_used.pop(victim_type, None)
+                logger.info(f"Evicting LRU {victim_type} agent (cache full)")
+                try:
+                    await victim.disconnect()
+                except Exception as e:
+                    logger.error(f"Error disconnecting evicted {victim_type} agent: {e}")
+
+            # Create new agent
+            self._stats[agent_type].misses += 1
+            config = self.configs[agent_type]
+
+            # Shareable types ride one subprocess via a persona handle
+            if (
+                self.share_readonly_clients
+                and agent_type in _SHAREABLE_TYPES
+                and not config.mcp_servers
+            ):
+                shared = await self._get_shared_client()
+                system_prompt = (
+                    config.system_prompt()
+                    if callable(config.system_prompt)
+                    else config.system_prompt
+                )
+                handle = AgentHandle(shared, system_prompt)
+                self.agents[agent_type] = handle
+                self._last_used[agent_type] = time.monotonic()
+                logger.info(f"Created {agent_type} handle on shared client")
+                return handle
+
+            logger.info(f"Creating new {agent_type} agent")
+
+            client = ClaudeSDKClient(options=self._build_options(config))
+            await self._connect_with_timeout(client)
+
+            self.agents[agent_type] = client
+            self._last_used[agent_type] = time.monotonic()
+            logger.info(f"Created and connected {agent_type} agent")
+
+            return client
+
+    async def _get_shared_client(self) -> ClaudeSDKClient:
+        """
+        Get or create the client shared by the read-only agent types.
 
-        options = ClaudeAgentOptions(
-            allowed_tools=config.allowed_tools,
-            system_prompt=config.system_prompt,
-            mcp_servers=config.mcp_servers,
-            permission_mode=config.permission_mode,
-            cwd=str(self.workspace),
-            max_turns=config.max_turns,
-            model=config.model
-        )
+        Connected once with the union of the shareable types' tools and a
+        neutral base prompt; per-type behavior comes from AgentHandle
+        prepending the persona prompt to each query.
+        """
+        if self._shared_client is not None:
+            return self._shared_client
+
+        async with self._creation_locks["__shared__"]:
+            if self._shared_client is not None:
+                return self._shared_client
+
+            allowed_tools = sorted(frozenset().union(*(
+                self.configs[agent_type].allowed_tools
+                for agent_type in _SHAREABLE_TYPES
+            )))
+
+            logger.info("Creating shared client for read-only agent types")
+            options = ClaudeAgentOptions(
+                allowed_tools=allowed_tools,
+                system_prompt="You are a helpful AI assistant.",
+                mcp_servers={},
+                permission_mode="accept",
+                cwd=str(self.workspace),
+                max_turns=50,
+                model=self.configs["code"].model
+            )
+            client = ClaudeSDKClient(options=options)
+            await self._connect_with_timeout(client)
+            self._shared_client = client
+            return client
+
+    async def swap_workspace(self, agent_type: str, new_cwd: str) -> ClaudeSDKClient:
+        """
+        Point an existing agent at a new working directory.
 
-        client = ClaudeSDKClient(options=options)
-        await client.connect()
+        Tries to reconfigure the warm client in place so workspace
+        switches don't pay the full connect() cost; falls back to
+        disconnect + reconnect only when the SDK client offers no
+        reconfiguration hook.
 
-        self.agents[agent_type] = client
-        logger.info(f"Created and connected {agent_type} agent")
+        Args:
+            agent_type: Type of agent to repoint
+            new_cwd: New working directory
 
-        return client
+        Returns:
+            The (possibly reconnected) ClaudeSDKClient
+        """
+        new_workspace = Path(new_cwd).resolve()
+        self.workspace = new_workspace
+
+        # Cached options must be rebuilt with the new cwd either way
+        for config in self.configs.values():
+            config._options = None
+
+        client = self.agents.get(agent_type)
+        if client is None:
+            return await self.get_agent(agent_type)
+
+        # Probe for an in-place reconfiguration hook on the warm client
+        for method_name in ("set_cwd", "update_options"):
+            reconfigure = getattr(client, method_name, None)
+            if reconfigure is None:
+                continue
+            try:
+                result = reconfigure(str(new_workspace))
+                if asyncio.iscoroutine(result):
+                    await result
+                self._last_used[agent_type] = time.monotonic()
+                logger.info(
+                    f"Repointed {agent_type} agent to {new_workspace} "
+                    f"via {method_name}"
+                )
+                return client
+            except Exception as e:
+                logger.warning(f"{method_name} failed for {agent_type} agent: {e}")
+
+        # Fall back to a full reconnect
+        logger.info(f"Reconnecting {agent_type} agent for workspace switch")
+        self.agents.pop(agent_type, None)
+        self._last_used.pop(agent_type, None)
+        try:
+            await client.disconnect()
+        except Exception as e:
+            logger.error(f"Error disconnecting {agent_type} agent: {e}")
+        return await self.get_agent(agent_type)
+
+    async def _reap_idle_agents(self):
+        """Periodically disconnect agents idle longer than idle_ttl."""
+        ttl = self.pool_config.idle_ttl
+        while True:
+            await asyncio.sleep(self.pool_config.reap_interval)
+            now = time.monotonic()
+            idle_types = [
+                agent_type
+                for agent_type, last_used in self._last_used.items()
+                # _last_used only moves on borrow/return, so an agent
+                # mid-task would look idle; skip anything in flight
+                if now - last_used > ttl and not self._active.get(agent_type)
+            ]
+            for agent_type in idle_types:
+                client = self.agents.pop(agent_type, None)
+                self._last_used.pop(agent_type, None)
+                if client is None:
+                    continue
+                logger.info(f"Reaping idle {agent_type} agent")
+                try:
+                    await client.disconnect()
+                except Exception as e:
+                    logger.error(f"Error disconnecting idle {agent_type} agent: {e}")
 
     async def execute_task(
         self,
@@ -275,40 +672,82 @@ class AgentHub:
         """
         agent = await self.get_agent(agent_type)
 
+        stats = self._stats[agent_type]
+        stats.borrows += 1
+        self._active[agent_type] += 1
+        start_ns = time.perf_counter_ns()
+
         logger.info(f"Executing task with {agent_type} agent")
         logger.debug(f"Task: {task[:100]}...")
 
-        await agent.query(task)
-
-        messages = []
-        async for msg in agent.receive_response():
-            messages.append(msg)
-
-            if callback:
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        await callback(msg)
-                    else:
-                        callback(msg)
-                except Exception as e:
-                    logger.error(f"Callback error: {e}")
+        try:
+            await agent.query(task)
+
+            # Resolve the callback shape once instead of calling
+            # iscoroutinefunction on every streamed message
+            if callback is None:
+                dispatch = None
+            elif asyncio.iscoroutinefunction(callback):
+                dispatch = callback
+            else:
+                async def dispatch(msg):
+                    callback(msg)
+
+            messages = []
+            _append = messages.append
+            async for msg in agent.receive_response():
+                _append(msg)
+
+                if dispatch is not None:
+                    try:
+                        await dispatch(msg)
+                    except Exception as e:
+                        logger.error(f"Callback error: {e}")
+        finally:
+            self._active[agent_type] -= 1
+            self._last_used[agent_type] = time.monotonic()
+            # Accumulated on failure too, so avg_task_ms reflects every
+            # borrow rather than skewing low on error-heavy runs
+            stats.total_ms += (time.perf_counter_ns() - start_ns) / 1e6
 
         logger.info(f"Task complete, received {len(messages)} messages")
 
         return messages
 
+    def get_stats(self) -> Dict[str, Dict]:
+        """
+        Get pool statistics per agent type.
+
+        Returns:
+            Dict mapping agent_type to hit/miss/borrow counts and
+            average task duration in milliseconds
+        """
+        return {
+            agent_type: {
+                "hits": stats.hits,
+                "misses": stats.misses,
+                "borrows": stats.borrows,
+                "total_ms": stats.total_ms,
+                "avg_task_ms": stats.total_ms / stats.borrows if stats.borrows else 0.0,
+            }
+            for agent_type, stats in self._stats.items()
+        }
+
     async def parallel_execute(
         self,
-        tasks: List[tuple]  # [(agent_type, task_description), ...]
+        tasks: List[tuple],  # [(agent_type, task_description), ...]
+        max_concurrent: int = 32
     ) -> Dict[str, List]:
         """
-        Execute multiple tasks in parallel.
+        Execute multiple tasks in parallel with bounded concurrency.
 
         This is useful when tasks are independent and can run simultaneously,
-        improving overall execution time.
+        improving overall execution time. At most max_concurrent tasks are
+        in flight at once so large task lists don't overwhelm the host.
 
         Args:
             tasks: List of (agent_type, task_description) tuples
+            max_concurrent: Maximum number of tasks in flight
 
         Returns:
             Dictionary mapping agent_type to results
@@ -321,44 +760,102 @@ class AgentHub:
         """
         logger.info(f"Executing {len(tasks)} tasks in parallel")
 
+        semaphore = asyncio.Semaphore(max_concurrent)
+
         async def run_task(agent_type, task_desc):
             """Execute single task and return results."""
-            try:
-                results = await self.execute_task(agent_type, task_desc)
-                return agent_type, results
-            except Exception as e:
-                logger.error(f"Task failed for {agent_type}: {e}")
-                return agent_type, []
+            async with semaphore:
+                try:
+                    results = await self.execute_task(agent_type, task_desc)
+                    return agent_type, results
+                except Exception as e:
+                    logger.error(f"Task failed for {agent_type}: {e}")
+                    return agent_type, []
 
-        # Execute all tasks in parallel
+        # Execute all tasks in parallel (bounded by the semaphore)
         results_list = await asyncio.gather(*[
             run_task(agent_type, task_desc)
             for agent_type, task_desc in tasks
         ])
 
-        # Convert to dictionary
-        results_dict = {}
+        # Convert to dictionary; reuse each task's message list directly
+        # and only merge when the same agent_type appears twice
+        results_dict: Dict[str, List] = {}
         for agent_type, results in results_list:
-            if agent_type not in results_dict:
-                results_dict[agent_type] = []
-            results_dict[agent_type].extend(results)
+            bucket = results_dict.get(agent_type)
+            if bucket is None:
+                results_dict[agent_type] = results
+            else:
+                bucket.extend(results)
 
         logger.info(f"Parallel execution complete")
 
         return results_dict
 
+    async def parallel_execute_streaming(
+        self,
+        tasks: List[tuple],  # [(agent_type, task_description), ...]
+        max_concurrent: int = 32
+    ):
+        """
+        Execute tasks in parallel, yielding results as each completes.
+
+        Unlike parallel_execute, callers see the first finished task in
+        O(single-task-time) instead of waiting for the whole batch.
+
+        Args:
+            tasks: List of (agent_type, task_description) tuples
+            max_concurrent: Maximum number of tasks in flight
+
+        Yields:
+            (agent_type, results) tuples in completion order
+        """
+        logger.info(f"Streaming {len(tasks)} parallel tasks")
+
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def run_task(agent_type, task_desc):
+            async with semaphore:
+                try:
+                    return agent_type, await self.execute_task(agent_type, task_desc)
+                except Exception as e:
+                    logger.error(f"Task failed for {agent_type}: {e}")
+                    return agent_type, []
+
+        coros = [run_task(agent_type, task_desc) for agent_type, task_desc in tasks]
+        for future in asyncio.as_completed(coros):
+            yield await future
+
+    async def _disconnect_one(self, agent_type: str, client: ClaudeSDKClient):
+        """Disconnect a single agent, bounded to keep shutdown snappy."""
+        try:
+            await asyncio.wait_for(client.disconnect(), timeout=5.0)
+            logger.info(f"Disconnected {agent_type} agent")
+        except Exception as e:
+            logger.error(f"Error disconnecting {agent_type} agent: {e}")
+
     async def cleanup(self):
         """Cleanup all agent connections and resources."""
         logger.info(f"Cleaning up AgentHub ({len(self.agents)} agents)")
 
-        for agent_type, client in self.agents.items():
-            try:
-                await client.disconnect()
-                logger.info(f"Disconnected {agent_type} agent")
-            except Exception as e:
-                logger.error(f"Error disconnecting {agent_type} agent: {e}")
+        if self._reaper_task is not None:
+            self._reaper_task.cancel()
+            self._reaper_task = None
+
+        # Disconnect all agents in parallel so shutdown takes one
+        # disconnect's wall time instead of the sum of all of them
+        await asyncio.gather(*[
+            self._disconnect_one(agent_type, client)
+            for agent_type, client in self.agents.items()
+        ], return_exceptions=True)
 
         self.agents.clear()
+        self._last_used.clear()
+
+        # Handles are no-ops above; the shared client is closed once here
+        if self._shared_client is not None:
+            await self._disconnect_one("shared", self._shared_client)
+            self._shared_client = None
 
         # Cleanup MCP servers if they have cleanup methods
         # Note: The kernel manager and browser manager have cleanup methods
@@ -366,8 +863,42 @@ class AgentHub:
 
         logger.info("AgentHub cleanup complete")
 
+    async def warm_agents(self, agent_types: Optional[List[str]] = None):
+        """
+        Pre-connect agents so the first request doesn't pay startup cost.
+
+        All connect() calls run in parallel, turning N sequential
+        subprocess startups into one wall-clock startup.
+
+        Args:
+            agent_types: Types to warm (defaults to all configured types)
+        """
+        types_to_warm = agent_types or list(self.configs.keys())
+        logger.info(f"Warming agent pool: {types_to_warm}")
+        await asyncio.gather(*[
+            self.get_agent(agent_type) for agent_type in types_to_warm
+        ])
+
+    async def with_agent(self, agent_type: str, fn: Callable):
+        """
+        Run a callable against a (possibly pre-warmed) agent.
+
+        Args:
+            agent_type: Type of agent to check out
+            fn: Coroutine function taking the ClaudeSDKClient
+
+        Returns:
+            The callable's result
+        """
+        agent = await self.get_agent(agent_type)
+        return await fn(agent)
+
     async def __aenter__(self):
         """Async context manager entry."""
+        if self.pool_config.min_warm > 0:
+            await self.warm_agents()
+        if self.pool_config.idle_ttl > 0:
+            self._reaper_task = asyncio.create_task(self._reap_idle_agents())
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -28,6 +28,8 @@ Usage:
     )
 """
 
+import functools
+import importlib
 import os
 from typing import Optional, Type
 from enum import Enum
@@ -37,6 +39,65 @@ from openhands.core.config import AgentConfig
 from openhands.core.logger import openhands_logger as logger
 from openhands.llm.llm_registry import LLMRegistry
 
+# Agent name -> (module path, class name). Adding an agent is a one-line
+# dict entry; the class is imported on first use and cached.
+_LEGACY_AGENT_PATHS = {
+    "CodeActAgent": ("openhands.agenthub.codeact_agent.codeact_agent", "CodeActAgent"),
+    "BrowsingAgent": ("openhands.agenthub.browsing_agent.browsing_agent", "BrowsingAgent"),
+    "ReadOnlyAgent": ("openhands.agenthub.readonly_agent.readonly_agent", "ReadOnlyAgent"),
+    "DummyAgent": ("openhands.agenthub.dummy_agent.agent", "DummyAgent"),
+    "LOCAgent": ("openhands.agenthub.loc_agent.loc_agent", "LOCAgent"),
+    "VisualBrowsingAgent": (
+        "openhands.agenthub.visualbrowsing_agent.visualbrowsing_agent",
+        "VisualBrowsingAgent",
+    ),
+}
+
+_SDK_AGENT_PATHS = {
+    "CodeActAgent": ("openhands.agenthub.codeact_agent.codeact_agent_sdk", "CodeActAgentSDK"),
+    "BrowsingAgent": ("openhands.agenthub.browsing_agent.browsing_agent_sdk", "BrowsingAgentSDK"),
+    "ReadOnlyAgent": ("openhands.agenthub.readonly_agent.readonly_agent_sdk", "ReadOnlyAgentSDK"),
+    "VisualBrowsingAgent": (
+        "openhands.agenthub.visualbrowsing_agent.visualbrowsing_agent_sdk",
+        "VisualBrowsingAgentSDK",
+    ),
+    "LOCAgent": ("openhands.agenthub.loc_agent.loc_agent_sdk", "LocAgentSDK"),
+    "DummyAgent": ("openhands.agenthub.dummy_agent.agent_sdk", "DummyAgentSDK"),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _import_agent_class(module_path: str, class_name: str) -> Type[Agent]:
+    """Import an agent class, cached so repeat loads skip importlib."""
+    return getattr(importlib.import_module(module_path), class_name)
+
+
+def _read_env_sdk_override() -> Optional[bool]:
+    """Parse OPENHANDS_USE_SDK_AGENTS once; env vars don't change at runtime."""
+    value = os.environ.get("OPENHANDS_USE_SDK_AGENTS", "").lower()
+    if value == "true":
+        return True
+    if value == "false":
+        return False
+    return None
+
+
+_ENV_SDK_OVERRIDE: Optional[bool] = _read_env_sdk_override()
+
+
+@functools.lru_cache(maxsize=128)
+def _sdk_decision(model: str, use_sdk_flag: Optional[bool]) -> bool:
+    """Cached SDK-vs-legacy decision for a (model, config flag) pair."""
+    # SDK agents work best with Claude models
+    if 'claude' in model.lower():
+        return True
+
+    if use_sdk_flag is not None:
+        return use_sdk_flag
+
+    # Default: legacy, enabling gradual rollout
+    return False
+
 
 class AgentMode(Enum):
     """Agent execution mode."""
@@ -94,34 +155,11 @@ class AgentFactory:
         Raises:
             ImportError: If agent class cannot be loaded
         """
-        if agent_name == "CodeActAgent":
-            from openhands.agenthub.codeact_agent.codeact_agent import CodeActAgent
-            return CodeActAgent
-
-        elif agent_name == "BrowsingAgent":
-            from openhands.agenthub.browsing_agent.browsing_agent import BrowsingAgent
-            return BrowsingAgent
-
-        elif agent_name == "ReadOnlyAgent":
-            from openhands.agenthub.readonly_agent.readonly_agent import ReadOnlyAgent
-            return ReadOnlyAgent
-
-        elif agent_name == "DummyAgent":
-            from openhands.agenthub.dummy_agent.agent import DummyAgent
-            return DummyAgent
-
-        elif agent_name == "LOCAgent":
-            from openhands.agenthub.loc_agent.loc_agent import LOCAgent
-            return LOCAgent
-
-        elif agent_name == "VisualBrowsingAgent":
-            from openhands.agenthub.visualbrowsing_agent.visualbrowsing_agent import (
-                VisualBrowsingAgent
-            )
-            return VisualBrowsingAgent
-
-        else:
+        try:
+            module_path, class_name = _LEGACY_AGENT_PATHS[agent_name]
+        except KeyError:
             raise ImportError(f"Unknown legacy agent: {agent_name}")
+        return _import_agent_class(module_path, class_name)
 
     @classmethod
     def _load_sdk_agent(cls, agent_name: str) -> Type[Agent]:
@@ -137,35 +175,14 @@ class AgentFactory:
         Raises:
             ImportError: If agent class cannot be loaded or doesn't have SDK version
         """
-        if agent_name == "CodeActAgent":
-            from openhands.agenthub.codeact_agent.codeact_agent_sdk import CodeActAgentSDK
-            return CodeActAgentSDK
-
-        elif agent_name == "BrowsingAgent":
-            from openhands.agenthub.browsing_agent.browsing_agent_sdk import BrowsingAgentSDK
-            return BrowsingAgentSDK
-
-        elif agent_name == "ReadOnlyAgent":
-            from openhands.agenthub.readonly_agent.readonly_agent_sdk import ReadOnlyAgentSDK
-            return ReadOnlyAgentSDK
-
-        elif agent_name == "VisualBrowsingAgent":
-            from openhands.agenthub.visualbrowsing_agent.visualbrowsing_agent_sdk import VisualBrowsingAgentSDK
-            return VisualBrowsingAgentSDK
-
-        elif agent_name == "LOCAgent":
-            from openhands.agenthub.loc_agent.loc_agent_sdk import LocAgentSDK
-            return LocAgentSDK
-
-        elif agent_name == "DummyAgent":
-            from openhands.agenthub.dummy_agent.agent_sdk import DummyAgentSDK
-            return DummyAgentSDK
-
-        else:
+        try:
+            module_path, class_name = _SDK_AGENT_PATHS[agent_name]
+        except KeyError:
             raise ImportError(
                 f"No SDK version available for {agent_name}. "
                 f"Available SDK agents: {list(cls.SDK_AGENTS.keys())}"
             )
+        return _import_agent_class(module_path, class_name)
 
     @classmethod
     def create_agent(
@@ -246,26 +263,15 @@ class AgentFactory:
         Returns:
             True if SDK should be used, False otherwise
         """
-        # Check environment variable
-        use_sdk_env = os.environ.get("OPENHANDS_USE_SDK_AGENTS", "").lower()
-        if use_sdk_env == "true":
-            return True
-        elif use_sdk_env == "false":
-            return False
-
-        # Check if model is Claude (SDK agents work best with Claude)
-        if hasattr(config, 'llm_config') and config.llm_config:
-            model = getattr(config.llm_config, 'model', '')
-            if 'claude' in model.lower():
-                return True
-
-        # Check config flag if available
-        if hasattr(config, 'use_sdk_agents'):
-            return config.use_sdk_agents
-
-        # Default: use SDK for supported agents
-        # This enables gradual rollout
-        return False
+        # Environment override is read once at import time
+        if _ENV_SDK_OVERRIDE is not None:
+            return _ENV_SDK_OVERRIDE
+
+        llm_config = getattr(config, 'llm_config', None)
+        model = getattr(llm_config, 'model', '') if llm_config else ''
+        use_sdk_flag = getattr(config, 'use_sdk_agents', None)
+
+        return _sdk_decision(model, use_sdk_flag)
 
     @classmethod
     def list_agents(cls, include_sdk: bool = True, include_legacy: bool = True) -> dict:
@@ -17,6 +17,7 @@ The agent maintains backward compatibility with the Agent base class.
 
 import os
 import asyncio
+import functools
 from typing import TYPE_CHECKING
 
 from openhands.llm.llm_registry import LLMRegistry
@@ -27,7 +28,7 @@ if TYPE_CHECKING:
 from openhands.agenthub.claude_sdk_adapter import (
     ClaudeSDKAdapter,
     ClaudeSDKAdapterConfig,
-    run_async,
+    adapter_registry,
 )
 from openhands.controller.agent import Agent
 from openhands.controller.state.state import State
@@ -45,6 +46,72 @@ except ImportError:
     logger.warning("Browser MCP not available")
     BROWSER_MCP_AVAILABLE = False
 
+from openhands.mcp_servers.batch_mcp import create_batch_mcp_server
+
+
+# Browser-specific tools, shared across all instances
+_BROWSING_TOOLS = (
+    "Read",  # For reading local files
+    "mcp__browser__navigate",
+    "mcp__browser__interact",
+    "mcp__browser__extract_content",
+    "mcp__browser__screenshot",
+    "mcp__browser__get_page_info",
+    "mcp__batch__execute",
+)
+
+# Appended to the system prompt whenever batch execute is available
+_BATCH_PROMPT_SNIPPET = """
+
+When several tool calls are independent of each other (e.g. screenshot
+and extract_content), batch them into a single mcp__batch__execute call
+so they run concurrently."""
+
+# Fallback prompt used when the prompt manager can't render one
+_DEFAULT_SYSTEM_PROMPT = """You are a web browsing and interaction specialist.
+
+Your capabilities:
+- Navigate to web pages using navigate tool
+- Extract page content and structure
+- Interact with page elements (click, type, select)
+- Take screenshots of pages
+- Get detailed page information
+
+Your approach to web tasks:
+1. Navigate to the target URL
+2. Analyze the page structure and content
+3. Identify the relevant elements to interact with
+4. Perform interactions carefully
+5. Extract and return the requested information
+6. Take screenshots when needed for verification
+
+Guidelines:
+- Always start by navigating to the URL
+- Use accessibility tree information to find elements
+- Verify your actions succeeded before proceeding
+- Return concise, relevant information to the user
+- Handle errors gracefully
+
+Think step-by-step and explain your actions.
+"""
+
+
+@functools.lru_cache(maxsize=4)
+def _get_prompt_manager(prompt_dir: str, filename: str) -> PromptManager:
+    """One PromptManager per (prompts dir, filename), shared across agents."""
+    return PromptManager(
+        prompt_dir=prompt_dir,
+        system_prompt_filename=filename,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _render_system_prompt(prompt_dir: str, filename: str, cli_mode: bool) -> str:
+    """Render the system prompt once per (prompts dir, filename, cli_mode)."""
+    return _get_prompt_manager(prompt_dir, filename).get_system_message(
+        cli_mode=cli_mode
+    )
+
 
 class BrowsingAgentSDK(Agent):
     """
@@ -90,21 +157,74 @@ class BrowsingAgentSDK(Agent):
         # Create adapter configuration
         self.adapter_config = self._create_adapter_config()
 
-        # Create Claude SDK adapter
-        self.adapter = ClaudeSDKAdapter(self.adapter_config)
+        # Acquire a (possibly shared) Claude SDK adapter; instances with
+        # equivalent configs reuse one subprocess and MCP server set
+        self.adapter = adapter_registry.acquire(self.adapter_config)
 
         # Initialize adapter
         self._initialize_adapter()
 
         logger.info("BrowsingAgentSDK initialized")
 
+    def _run(self, coro):
+        """
+        Run a coroutine on the registry's shared-adapter loop.
+
+        A shared adapter's client and transports are bound to the loop
+        they were initialized on, so every holder must drive them from
+        that one loop; the registry owns it.
+        """
+        return adapter_registry.run(coro)
+
+    async def _init_and_warm(self) -> None:
+        """Initialize the adapter, overlapping chromium launch with it."""
+        await asyncio.gather(
+            self.adapter.initialize(),
+            self.adapter.warmup_mcp("browser"),
+        )
+
+    async def ainit(self) -> None:
+        """
+        Initialize the adapter asynchronously (idempotent).
+
+        Use with asyncio.gather to overlap several agents' startup
+        latency; see create().
+        """
+        await adapter_registry.arun(self._init_and_warm())
+
+    @classmethod
+    async def create(
+        cls, config: AgentConfig, llm_registry: LLMRegistry
+    ) -> 'BrowsingAgentSDK':
+        """
+        Construct and initialize an agent from async code.
+
+        Construction inside a running loop defers adapter startup, so
+        multiple agents can be created and their ainit() calls gathered
+        to overlap subprocess spawns.
+        """
+        agent = cls(config, llm_registry)
+        await agent.ainit()
+        return agent
+
     def _initialize_adapter(self) -> None:
         """Initialize the Claude SDK adapter asynchronously."""
         try:
-            run_async(self.adapter.initialize())
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # Constructed inside a running loop (e.g. via create());
+            # defer startup to ainit() so callers can gather several
+            # agents' initializations concurrently
+            logger.debug("Deferring adapter initialization to ainit()")
+            return
+
+        try:
+            self._run(self._init_and_warm())
             logger.info("Browser MCP adapter initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize adapter: {e}")
+            logger.error("Failed to initialize adapter: %s", e)
             raise
 
     def _create_adapter_config(self) -> ClaudeSDKAdapterConfig:
@@ -115,22 +235,17 @@ class BrowsingAgentSDK(Agent):
             ClaudeSDKAdapterConfig for the adapter
         """
         # Browser-specific tools
-        allowed_tools = [
-            "Read",  # For reading local files
-            "mcp__browser__navigate",
-            "mcp__browser__interact",
-            "mcp__browser__extract_content",
-            "mcp__browser__screenshot",
-            "mcp__browser__get_page_info"
-        ]
-
-        # Create Browser MCP server
+        allowed_tools = list(_BROWSING_TOOLS)
+
+        # Declare the Browser MCP server as a lazy factory; the adapter
+        # materializes it at initialize() time, not config-build time
         mcp_servers = {
-            "browser": create_browser_mcp_server()
+            "browser": create_browser_mcp_server,
+            "batch": create_batch_mcp_server,
         }
 
         # Load system prompt
-        system_prompt = self._load_system_prompt()
+        system_prompt = self._load_system_prompt() + _BATCH_PROMPT_SNIPPET
 
         # Create adapter config
         adapter_config = ClaudeSDKAdapterConfig(
@@ -144,7 +259,7 @@ class BrowsingAgentSDK(Agent):
             workspace_base=self.config.workspace_base
         )
 
-        logger.info(f"Created browsing adapter config with {len(allowed_tools)} tools")
+        logger.info("Created browsing adapter config with %d tools", len(allowed_tools))
 
         return adapter_config
 
@@ -152,54 +267,32 @@ class BrowsingAgentSDK(Agent):
         """
         Load system prompt for the browsing agent.
 
+        The rendered prompt is cached at module level, so repeated agent
+        constructions sharing a prompts dir skip the file I/O and
+        template rendering.
+
         Returns:
             System prompt string
         """
-        # Try to use the prompt manager
-        if self.prompt_manager:
-            try:
-                return self.prompt_manager.get_system_message(
-                    cli_mode=self.config.cli_mode
-                )
-            except Exception as e:
-                logger.warning(f"Failed to load prompt from manager: {e}")
+        try:
+            return _render_system_prompt(
+                os.path.join(os.path.dirname(__file__), 'prompts'),
+                self.config.resolved_system_prompt_filename,
+                self.config.cli_mode,
+            )
+        except Exception as e:
+            logger.warning("Failed to load prompt from manager: %s", e)
 
         # Fallback to a default browsing-focused prompt
-        default_prompt = """You are a web browsing and interaction specialist.
-
-Your capabilities:
-- Navigate to web pages using navigate tool
-- Extract page content and structure
-- Interact with page elements (click, type, select)
-- Take screenshots of pages
-- Get detailed page information
-
-Your approach to web tasks:
-1. Navigate to the target URL
-2. Analyze the page structure and content
-3. Identify the relevant elements to interact with
-4. Perform interactions carefully
-5. Extract and return the requested information
-6. Take screenshots when needed for verification
-
-Guidelines:
-- Always start by navigating to the URL
-- Use accessibility tree information to find elements
-- Verify your actions succeeded before proceeding
-- Return concise, relevant information to the user
-- Handle errors gracefully
-
-Think step-by-step and explain your actions.
-"""
-        return default_prompt
+        return _DEFAULT_SYSTEM_PROMPT
 
     @property
     def prompt_manager(self) -> PromptManager:
-        """Get or create prompt manager."""
+        """Get the shared prompt manager for this prompts directory."""
         if self._prompt_manager is None:
-            self._prompt_manager = PromptManager(
-                prompt_dir=os.path.join(os.path.dirname(__file__), 'prompts'),
-                system_prompt_filename=self.config.resolved_system_prompt_filename,
+            self._prompt_manager = _get_prompt_manager(
+                os.path.join(os.path.dirname(__file__), 'prompts'),
+                self.config.resolved_system_prompt_filename,
             )
         return self._prompt_manager
 
@@ -208,10 +301,13 @@ Think step-by-step and explain your actions.
         super().reset()
         logger.debug("BrowsingAgentSDK reset")
 
-    def step(self, state: State) -> 'Action':
+    async def astep(self, state: State) -> 'Action':
         """
         Execute one step using Claude SDK with Browser MCP.
 
+        Native async entry point: async callers (the controller, web
+        servers) should use this to avoid the sync/async bridge entirely.
+
         Args:
             state: Current OpenHands state
 
@@ -225,11 +321,11 @@ Think step-by-step and explain your actions.
         4. Converts response to action
         5. Returns action
         """
-        logger.debug("BrowsingAgentSDK step() called")
+        logger.debug("BrowsingAgentSDK astep() called")
 
-        # Check for exit command
-        latest_user_message = state.get_last_user_message()
-        if latest_user_message and latest_user_message.content.strip() == '/exit':
+        # Check for exit command (raw scan; skips building a view)
+        last_user_text = state.get_last_user_text_raw()
+        if last_user_text is not None and last_user_text.strip() == '/exit':
             logger.info("Exit command detected")
             return AgentFinishAction()
 
@@ -242,23 +338,72 @@ Think step-by-step and explain your actions.
             )
 
         try:
-            # Execute step via adapter
-            action = run_async(self.adapter.execute_step(state))
+            # Execute step via adapter, anchored to the registry loop
+            # the shared client lives on
+            action = await adapter_registry.arun(self.adapter.execute_step(state))
 
-            logger.info(f"Browsing step executed, returning: {type(action).__name__}")
+            logger.info("Browsing step executed, returning: %s", type(action).__name__)
             return action
 
         except Exception as e:
-            logger.error(f"Error in browsing step: {e}", exc_info=True)
+            logger.error("Error in browsing step: %s", e, exc_info=True)
             return MessageAction(
                 content=f"Error during browsing: {str(e)}",
                 wait_for_response=False
             )
 
+    def step(self, state: State) -> 'Action':
+        """
+        Synchronous fallback for astep().
+
+        Bridges onto the registry's shared-adapter loop; prefer astep()
+        when a loop is already available.
+
+        Args:
+            state: Current OpenHands state
+
+        Returns:
+            Action to execute
+        """
+        return self._run(self.astep(state))
+
+    async def aclose(self) -> None:
+        """
+        Release the adapter deterministically.
+
+        Prefer this (or the async context manager) over relying on
+        __del__, which depends on GC order at interpreter shutdown.
+        """
+        adapter = getattr(self, 'adapter', None)
+        if adapter is not None:
+            self.adapter = None
+            await adapter_registry.arelease(adapter)
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
+        return False
+
     def __del__(self):
-        """Cleanup when agent is destroyed."""
-        try:
-            if hasattr(self, 'adapter') and self.adapter:
-                run_async(self.adapter.cleanup())
-        except Exception as e:
-            logger.error(f"Error cleaning up adapter: {e}")
+        """Last-resort cleanup; prefer aclose()."""
+        adapter = getattr(self, 'adapter', None)
+        if adapter is not None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                try:
+                    # Cleanup runs on the registry loop, which stays up
+                    # for any surviving holders of the shared adapter
+                    adapter_registry.release(adapter)
+                except Exception as e:
+                    logger.error("Error cleaning up adapter: %s", e)
+            else:
+                # Can't block a running loop from a finalizer
+                logger.warning(
+                    "BrowsingAgentSDK deleted without aclose(); "
+                    "adapter cleanup skipped"
+                )
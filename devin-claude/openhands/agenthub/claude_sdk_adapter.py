@@ -23,7 +23,9 @@ Usage:
 """
 
 import asyncio
+import atexit
 import logging
+import threading
 from typing import List, Dict, Optional, Any
 from pathlib import Path
 from dataclasses import dataclass
@@ -64,7 +66,13 @@ class ClaudeSDKAdapterConfig:
 
     agent_type: str  # code, browsing, readonly, etc.
     allowed_tools: List[str]
-    system_prompt: str
+    # Either a plain string or a list of Anthropic content blocks (the
+    # latter lets callers set an explicit cache_control breakpoint on
+    # the static prefix)
+    system_prompt: Any
+    # Values may be MCP server instances or zero-arg factories; factories
+    # are only called when the adapter initializes, so building a config
+    # never spawns chromium/ipykernel subprocesses
     mcp_servers: Optional[Dict] = None
     permission_mode: str = "acceptEdits"
     max_turns: int = 50
@@ -95,6 +103,14 @@ class ClaudeSDKAdapter:
         self._initialized = False
         self._loop = None
 
+        # Materialized MCP servers (lazy factories resolved at most once)
+        self._resolved_mcp: Dict[str, Any] = {}
+
+        # Rolling serialized context for execute_step_incremental:
+        # already-serialized history parts are kept across steps so each
+        # turn only pays for the events appended since the last one
+        self._context_parts: List[str] = []
+
         logger.info(f"ClaudeSDKAdapter created for {config.agent_type} agent")
 
     async def initialize(self) -> None:
@@ -113,7 +129,7 @@ class ClaudeSDKAdapter:
         options = ClaudeAgentOptions(
             allowed_tools=self.config.allowed_tools,
             system_prompt=self.config.system_prompt,
-            mcp_servers=self.config.mcp_servers or {},
+            mcp_servers=self._materialize_mcp_servers(),
             permission_mode=self.config.permission_mode,
             cwd=self.config.workspace_base or str(Path.cwd()),
             max_turns=self.config.max_turns,
@@ -127,6 +143,47 @@ class ClaudeSDKAdapter:
         self._initialized = True
         logger.info(f"Claude SDK client initialized for {self.config.agent_type}")
 
+    def _materialize_mcp_servers(self) -> Dict[str, Any]:
+        """
+        Resolve lazily declared MCP server factories.
+
+        Each factory is called at most once; agents whose config flags
+        enable a server but that never initialize the adapter skip the
+        subprocess spawn entirely.
+        """
+        if not self.config.mcp_servers:
+            return {}
+        for name, server in self.config.mcp_servers.items():
+            if name not in self._resolved_mcp:
+                if callable(server):
+                    logger.info(f"Materializing {name} MCP server")
+                    server = server()
+                self._resolved_mcp[name] = server
+        return self._resolved_mcp
+
+    async def warmup_mcp(self, name: str) -> None:
+        """
+        Pre-warm the backing resource of an MCP server.
+
+        The browser and jupyter servers lazily start chromium / an
+        ipykernel on the first tool call; running this concurrently with
+        initialize() overlaps the spawn with client connection so step 1
+        doesn't pay it.
+
+        Args:
+            name: MCP server name ("browser" or "jupyter")
+        """
+        try:
+            if name == "browser":
+                from openhands.mcp_servers.browser_mcp import _browser_manager
+                await _browser_manager.initialize()
+            elif name == "jupyter":
+                from openhands.mcp_servers.jupyter_mcp import _kernel_manager
+                await _kernel_manager.get_or_create_kernel()
+            logger.info(f"Warmed up {name} MCP server")
+        except Exception as e:
+            logger.warning(f"Failed to warm up {name} MCP server: {e}")
+
     def _ensure_initialized(self) -> None:
         """Ensure the adapter is initialized."""
         if not self._initialized or self.claude_client is None:
@@ -162,23 +219,7 @@ class ClaudeSDKAdapter:
         recent_events = list(state.history)[-10:]  # Last 10 events
 
         for event in recent_events:
-            if isinstance(event, Observation):
-                # Add observation context
-                if isinstance(event, CmdOutputObservation):
-                    if event.command:
-                        context_parts.append(f"Previous command: {event.command}")
-                    if event.content:
-                        # Truncate long outputs
-                        output = event.content[:500]
-                        context_parts.append(f"Command output: {output}")
-
-                elif isinstance(event, FileReadObservation):
-                    if event.path:
-                        context_parts.append(f"Previously read file: {event.path}")
-
-                elif isinstance(event, ErrorObservation):
-                    if event.content:
-                        context_parts.append(f"Previous error: {event.content[:200]}")
+            context_parts.extend(self._event_context_parts(event))
 
         # Combine into final prompt
         if context_parts:
@@ -191,6 +232,43 @@ class ClaudeSDKAdapter:
 
         return full_prompt
 
+    def _event_context_parts(self, event: Any) -> List[str]:
+        """
+        Serialize one history event to its prompt-context lines.
+
+        Shared by state_to_prompt (full rebuild) and
+        execute_step_incremental (delta-only serialization).
+
+        Args:
+            event: A history event
+
+        Returns:
+            Zero or more context strings for the event
+        """
+        parts: List[str] = []
+        if isinstance(event, Observation):
+            # Add observation context
+            if isinstance(event, CmdOutputObservation):
+                if event.command:
+                    parts.append(f"Previous command: {event.command}")
+                if event.content:
+                    # Truncate long outputs
+                    output = event.content[:500]
+                    parts.append(f"Command output: {output}")
+
+            elif isinstance(event, FileReadObservation):
+                if event.path:
+                    parts.append(f"Previously read file: {event.path}")
+
+            elif isinstance(event, ErrorObservation):
+                if event.content:
+                    parts.append(f"Previous error: {event.content[:200]}")
+        return parts
+
+    def reset_context(self) -> None:
+        """Drop the rolling incremental context (e.g. on history rewind)."""
+        self._context_parts = []
+
     def messages_to_action(self, messages: List[Any]) -> Action:
         """
         Convert Claude SDK response messages to an OpenHands Action.
@@ -401,6 +479,72 @@ class ClaudeSDKAdapter:
 
         return action
 
+    async def execute_step_incremental(
+        self, state: State, new_events: List[Any],
+        context_parts: Optional[List[str]] = None,
+    ) -> Action:
+        """
+        Execute one step, serializing only events added since the last call.
+
+        Instead of re-walking the whole (growing) history each turn like
+        execute_step, the already-serialized context is kept across calls
+        and only the delta appended — per-step serialization cost becomes
+        O(last turn) rather than O(history).
+
+        Args:
+            state: Current OpenHands state
+            new_events: Events appended to state.history since the
+                previous call (callers track the offset; pass the full
+                history on the first call)
+            context_parts: Caller-owned rolling context window. Registry-
+                shared adapters serve several holders, so conversation
+                state must live with the holder; falls back to the
+                adapter-local list only for unshared direct use
+
+        Returns:
+            An OpenHands Action to execute
+        """
+        self._ensure_initialized()
+
+        logger.info(
+            f"Executing incremental step for {self.config.agent_type} agent "
+            f"({len(new_events)} new events)"
+        )
+
+        parts = context_parts if context_parts is not None else self._context_parts
+        for event in new_events:
+            parts.extend(self._event_context_parts(event))
+        # Bound the rolling window to roughly what state_to_prompt keeps
+        if len(parts) > 20:
+            del parts[:-20]
+
+        latest_user_message = state.get_last_user_text_raw()
+        if latest_user_message:
+            base_prompt = latest_user_message
+        else:
+            base_prompt = state.inputs.get('task', 'Complete the current task.')
+
+        if parts:
+            context_str = "\n\n".join(parts)
+            prompt = f"{base_prompt}\n\nRecent context:\n{context_str}"
+        else:
+            prompt = base_prompt
+
+        # Query Claude SDK
+        await self.claude_client.query(prompt)
+
+        # Receive response messages
+        messages = []
+        async for msg in self.claude_client.receive_response():
+            messages.append(msg)
+
+        logger.info(f"Received {len(messages)} messages from Claude SDK")
+
+        action = self.messages_to_action(messages)
+        logger.info(f"Converted to action: {type(action).__name__}")
+
+        return action
+
     async def cleanup(self) -> None:
         """Cleanup resources."""
         if self.claude_client:
@@ -412,6 +556,202 @@ class ClaudeSDKAdapter:
 
         self._initialized = False
         self.claude_client = None
+        self._resolved_mcp = {}
+        self._context_parts = []
+
+
+class AdapterRegistry:
+    """
+    Process-wide registry of shared, refcounted adapters.
+
+    Agents with equivalent configs (same type, tools, model, workspace)
+    reuse one ClaudeSDKAdapter — and therefore one Claude CLI subprocess
+    and one set of MCP servers — instead of each spawning their own. The
+    adapter is cleaned up when the last holder releases it.
+
+    The registry also owns the event loop all shared adapters run on.
+    asyncio transports and futures are loop-affine, so a client
+    initialized on one holder's loop cannot be driven from another's;
+    anchoring every adapter interaction to one registry-owned loop
+    thread (via run()/arun()) makes sharing safe regardless of which
+    holder, or which thread, calls in.
+    """
+
+    def __init__(self):
+        self._adapters: Dict[tuple, 'ClaudeSDKAdapter'] = {}
+        self._refcounts: Dict[tuple, int] = {}
+        # Serializes adapter/refcount mutation and loop startup; holders
+        # may acquire/release from any thread
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Lazily start the daemon thread owning the shared-adapter loop."""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="claude-sdk-adapter-loop",
+                    daemon=True,
+                )
+                self._loop_thread.start()
+                atexit.register(self._stop_loop)
+            return self._loop
+
+    def _stop_loop(self) -> None:
+        """Stop the registry loop thread; safe to call more than once."""
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            loop.call_soon_threadsafe(loop.stop)
+
+    def run(self, coro, timeout: float = 600.0):
+        """
+        Run a coroutine on the registry loop from sync code.
+
+        Blocks the calling thread until the coroutine finishes on the
+        loop the shared adapters are anchored to.
+
+        Args:
+            coro: Coroutine to schedule
+            timeout: Seconds to wait for the result
+
+        Returns:
+            The coroutine's result
+        """
+        # Blocking on the loop's own thread can never complete
+        assert threading.current_thread() is not self._loop_thread, (
+            "AdapterRegistry.run() called from the registry loop thread; "
+            "use arun() or submit() instead"
+        )
+        return asyncio.run_coroutine_threadsafe(
+            coro, self._ensure_loop()
+        ).result(timeout)
+
+    def submit(self, coro):
+        """
+        Schedule a coroutine on the registry loop without waiting.
+
+        Fire-and-forget variant of run() for contexts that must not
+        block (e.g. finalizers).
+
+        Returns:
+            The concurrent.futures.Future for the scheduled coroutine
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    async def arun(self, coro):
+        """
+        Run a coroutine on the registry loop from async code.
+
+        The caller's loop keeps running while the work executes on the
+        registry loop.
+
+        Args:
+            coro: Coroutine to schedule
+
+        Returns:
+            The coroutine's result
+        """
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        )
+
+    @staticmethod
+    def _key(config: ClaudeSDKAdapterConfig) -> tuple:
+        """Identity key for adapter sharing (MCP factories excluded).
+
+        Every field that changes the client's behavior participates:
+        agents differing only in system prompt (e.g. cli_mode prompt
+        variants) must not share an adapter. The prompt is folded in as
+        a hash since it may be a list of content blocks.
+        """
+        system_prompt = config.system_prompt
+        if not isinstance(system_prompt, str):
+            system_prompt = repr(system_prompt)
+        return (
+            config.agent_type,
+            tuple(config.allowed_tools),
+            config.model,
+            config.workspace_base,
+            config.permission_mode,
+            config.max_turns,
+            hash(system_prompt),
+        )
+
+    def acquire(self, config: ClaudeSDKAdapterConfig) -> 'ClaudeSDKAdapter':
+        """
+        Get a shared adapter for the config, creating it if needed.
+
+        Args:
+            config: Adapter configuration
+
+        Returns:
+            A (possibly shared) ClaudeSDKAdapter; callers must pair this
+            with release() when done
+        """
+        key = self._key(config)
+        with self._lock:
+            adapter = self._adapters.get(key)
+            if adapter is None:
+                adapter = ClaudeSDKAdapter(config)
+                self._adapters[key] = adapter
+                self._refcounts[key] = 0
+            else:
+                logger.info(f"Reusing shared adapter for {config.agent_type}")
+            self._refcounts[key] += 1
+        return adapter
+
+    def _drop(self, adapter: 'ClaudeSDKAdapter') -> bool:
+        """Decrement the refcount; True when the caller must clean up."""
+        with self._lock:
+            for key, existing in list(self._adapters.items()):
+                if existing is adapter:
+                    self._refcounts[key] -= 1
+                    if self._refcounts[key] > 0:
+                        return False
+                    del self._adapters[key]
+                    del self._refcounts[key]
+                    return True
+            # Not registry-managed (e.g. constructed directly)
+            return True
+
+    def release(self, adapter: 'ClaudeSDKAdapter', runner=None) -> None:
+        """
+        Release a previously acquired adapter.
+
+        The underlying client and MCP servers are cleaned up only when
+        the last holder releases.
+
+        Must not be called with the default runner from the registry
+        loop thread itself (run() would block waiting on its own loop);
+        code running there should use arelease() or pass runner=submit.
+
+        Args:
+            adapter: Adapter returned by acquire()
+            runner: Optional sync-to-async bridge used to run cleanup()
+                (defaults to run(), which targets the registry loop)
+        """
+        if self._drop(adapter):
+            try:
+                (runner or self.run)(adapter.cleanup())
+            except Exception as e:
+                logger.error(f"Error cleaning up adapter: {e}")
+
+    async def arelease(self, adapter: 'ClaudeSDKAdapter') -> None:
+        """
+        Async variant of release(); awaits cleanup on the last holder.
+
+        Args:
+            adapter: Adapter returned by acquire()
+        """
+        if self._drop(adapter):
+            await self.arun(adapter.cleanup())
+
+
+# Shared process-wide registry used by the SDK agents
+adapter_registry = AdapterRegistry()
 
 
 def run_async(coro):
@@ -18,6 +18,7 @@ be used as a drop-in replacement in existing OpenHands workflows.
 
 import os
 import asyncio
+import functools
 from typing import TYPE_CHECKING
 
 from openhands.llm.llm_registry import LLMRegistry
@@ -28,7 +29,7 @@ if TYPE_CHECKING:
 from openhands.agenthub.claude_sdk_adapter import (
     ClaudeSDKAdapter,
     ClaudeSDKAdapterConfig,
-    run_async,
+    adapter_registry,
 )
 from openhands.controller.agent import Agent
 from openhands.controller.state.state import State
@@ -51,6 +52,73 @@ except ImportError:
     logger.warning("MCP servers not available, some features will be disabled")
     MCP_AVAILABLE = False
 
+from openhands.mcp_servers.batch_mcp import create_batch_mcp_server
+
+
+# Feature-flagged tool groups, concatenated per config at construction
+_BASE_TOOLS = ("Read", "Grep", "Glob")
+_CMD_TOOLS = ("Bash",)
+_EDIT_TOOLS = ("Write", "Edit")
+_JUPYTER_TOOLS = (
+    "mcp__jupyter__execute_python",
+    "mcp__jupyter__kernel_info",
+    "mcp__jupyter__reset_kernel",
+)
+_BROWSER_TOOLS = (
+    "mcp__browser__navigate",
+    "mcp__browser__interact",
+    "mcp__browser__extract_content",
+    "mcp__browser__screenshot",
+    "mcp__browser__get_page_info",
+)
+_BATCH_TOOLS = ("mcp__batch__execute",)
+
+
+# Appended to the system prompt whenever batch execute is available
+_BATCH_PROMPT_SNIPPET = """
+
+When several tool calls are independent of each other, batch them into a
+single mcp__batch__execute call so they run concurrently."""
+
+
+# Fallback prompt used when the prompt manager can't render one
+_DEFAULT_SYSTEM_PROMPT = """You are a highly skilled software engineer with expertise in code analysis, implementation, debugging, and testing.
+
+Your capabilities:
+- Read and analyze code using Read, Grep, Glob tools
+- Write and edit files using Write and Edit tools
+- Execute bash commands using Bash tool
+- Run Python code using Jupyter MCP tools
+- Browse web pages using Browser MCP tools
+
+Your approach:
+1. Understand the task thoroughly
+2. Analyze the codebase to understand context
+3. Plan your implementation
+4. Execute changes carefully
+5. Test your changes
+6. Verify everything works
+
+Always think step-by-step and explain your reasoning.
+"""
+
+
+@functools.lru_cache(maxsize=4)
+def _get_prompt_manager(prompt_dir: str, filename: str) -> PromptManager:
+    """One PromptManager per (prompts dir, filename), shared across agents."""
+    return PromptManager(
+        prompt_dir=prompt_dir,
+        system_prompt_filename=filename,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _render_system_prompt(prompt_dir: str, filename: str, cli_mode: bool) -> str:
+    """Render the system prompt once per (prompts dir, filename, cli_mode)."""
+    return _get_prompt_manager(prompt_dir, filename).get_system_message(
+        cli_mode=cli_mode
+    )
+
 
 class CodeActAgentSDK(Agent):
     """
@@ -95,21 +163,74 @@ class CodeActAgentSDK(Agent):
         # Create adapter configuration
         self.adapter_config = self._create_adapter_config()
 
-        # Create Claude SDK adapter
-        self.adapter = ClaudeSDKAdapter(self.adapter_config)
+        # Acquire a (possibly shared) Claude SDK adapter; instances with
+        # equivalent configs reuse one subprocess and MCP server set
+        self.adapter = adapter_registry.acquire(self.adapter_config)
 
         # Initialize adapter asynchronously
         self._initialize_adapter()
 
         logger.info("CodeActAgentSDK initialized")
 
+    def _run(self, coro):
+        """
+        Run a coroutine on the registry's shared-adapter loop.
+
+        A shared adapter's client and transports are bound to the loop
+        they were initialized on, so every holder must drive them from
+        that one loop; the registry owns it.
+        """
+        return adapter_registry.run(coro)
+
+    async def _init_and_warm(self) -> None:
+        """Initialize the adapter, overlapping kernel startup with it."""
+        coros = [self.adapter.initialize()]
+        if MCP_AVAILABLE and self.config.enable_jupyter:
+            coros.append(self.adapter.warmup_mcp("jupyter"))
+        await asyncio.gather(*coros)
+
+    async def ainit(self) -> None:
+        """
+        Initialize the adapter asynchronously (idempotent).
+
+        Use with asyncio.gather to overlap several agents' startup
+        latency; see create().
+        """
+        await adapter_registry.arun(self._init_and_warm())
+
+    @classmethod
+    async def create(
+        cls, config: AgentConfig, llm_registry: LLMRegistry
+    ) -> 'CodeActAgentSDK':
+        """
+        Construct and initialize an agent from async code.
+
+        Construction inside a running loop defers adapter startup, so
+        multiple agents can be created and their ainit() calls gathered
+        to overlap subprocess spawns.
+        """
+        agent = cls(config, llm_registry)
+        await agent.ainit()
+        return agent
+
     def _initialize_adapter(self) -> None:
         """Initialize the Claude SDK adapter asynchronously."""
         try:
-            run_async(self.adapter.initialize())
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # Constructed inside a running loop (e.g. via create());
+            # defer startup to ainit() so callers can gather several
+            # agents' initializations concurrently
+            logger.debug("Deferring adapter initialization to ainit()")
+            return
+
+        try:
+            self._run(self._init_and_warm())
             logger.info("Claude SDK adapter initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize Claude SDK adapter: {e}")
+            logger.error("Failed to initialize Claude SDK adapter: %s", e)
             raise
 
     def _create_adapter_config(self) -> ClaudeSDKAdapterConfig:
@@ -119,41 +240,42 @@ class CodeActAgentSDK(Agent):
         Returns:
             ClaudeSDKAdapterConfig for the adapter
         """
-        # Define allowed tools based on config
-        allowed_tools = ["Read", "Grep", "Glob"]
+        # Concatenate pre-built tool tuples per feature flag; no
+        # per-instance list building
+        tools = _BASE_TOOLS
 
         if self.config.enable_cmd:
-            allowed_tools.append("Bash")
+            tools += _CMD_TOOLS
 
         if self.config.enable_editor or self.config.enable_llm_editor:
-            allowed_tools.extend(["Write", "Edit"])
+            tools += _EDIT_TOOLS
 
-        # Prepare MCP servers
+        # Prepare MCP servers as lazy factories; the adapter materializes
+        # them at initialize() time, not config-build time
         mcp_servers = {}
 
         if MCP_AVAILABLE:
             if self.config.enable_jupyter:
-                mcp_servers["jupyter"] = create_jupyter_mcp_server()
-                # Add Jupyter MCP tools
-                allowed_tools.extend([
-                    "mcp__jupyter__execute_python",
-                    "mcp__jupyter__kernel_info",
-                    "mcp__jupyter__reset_kernel"
-                ])
+                mcp_servers["jupyter"] = create_jupyter_mcp_server
+                tools += _JUPYTER_TOOLS
 
             if self.config.enable_browsing:
-                mcp_servers["browser"] = create_browser_mcp_server()
-                # Add Browser MCP tools
-                allowed_tools.extend([
-                    "mcp__browser__navigate",
-                    "mcp__browser__interact",
-                    "mcp__browser__extract_content",
-                    "mcp__browser__screenshot",
-                    "mcp__browser__get_page_info"
-                ])
+                mcp_servers["browser"] = create_browser_mcp_server
+                tools += _BROWSER_TOOLS
+
+            # Batch executor lets Claude fan out independent MCP calls
+            # in one request
+            if mcp_servers:
+                mcp_servers["batch"] = create_batch_mcp_server
+                tools += _BATCH_TOOLS
+
+        # Order-preserving dedup guards against overlapping groups
+        allowed_tools = list(dict.fromkeys(tools))
 
         # Load system prompt
         system_prompt = self._load_system_prompt()
+        if "batch" in mcp_servers:
+            system_prompt += _BATCH_PROMPT_SNIPPET
 
         # Create adapter config
         adapter_config = ClaudeSDKAdapterConfig(
@@ -167,8 +289,8 @@ class CodeActAgentSDK(Agent):
             workspace_base=self.config.workspace_base
         )
 
-        logger.info(f"Created adapter config with {len(allowed_tools)} tools")
-        logger.debug(f"Allowed tools: {allowed_tools}")
+        logger.info("Created adapter config with %d tools", len(allowed_tools))
+        logger.debug("Allowed tools: %s", allowed_tools)
 
         return adapter_config
 
@@ -176,47 +298,32 @@ class CodeActAgentSDK(Agent):
         """
         Load system prompt for the agent.
 
+        The rendered prompt is cached at module level, so repeated agent
+        constructions sharing a prompts dir skip the file I/O and
+        template rendering.
+
         Returns:
             System prompt string
         """
-        # Try to use the prompt manager
-        if self.prompt_manager:
-            try:
-                return self.prompt_manager.get_system_message(
-                    cli_mode=self.config.cli_mode
-                )
-            except Exception as e:
-                logger.warning(f"Failed to load prompt from manager: {e}")
+        try:
+            return _render_system_prompt(
+                os.path.join(os.path.dirname(__file__), 'prompts'),
+                self.config.resolved_system_prompt_filename,
+                self.config.cli_mode,
+            )
+        except Exception as e:
+            logger.warning("Failed to load prompt from manager: %s", e)
 
         # Fallback to a default prompt
-        default_prompt = """You are a highly skilled software engineer with expertise in code analysis, implementation, debugging, and testing.
-
-Your capabilities:
-- Read and analyze code using Read, Grep, Glob tools
-- Write and edit files using Write and Edit tools
-- Execute bash commands using Bash tool
-- Run Python code using Jupyter MCP tools
-- Browse web pages using Browser MCP tools
-
-Your approach:
-1. Understand the task thoroughly
-2. Analyze the codebase to understand context
-3. Plan your implementation
-4. Execute changes carefully
-5. Test your changes
-6. Verify everything works
-
-Always think step-by-step and explain your reasoning.
-"""
-        return default_prompt
+        return _DEFAULT_SYSTEM_PROMPT
 
     @property
     def prompt_manager(self) -> PromptManager:
-        """Get or create prompt manager."""
+        """Get the shared prompt manager for this prompts directory."""
         if self._prompt_manager is None:
-            self._prompt_manager = PromptManager(
-                prompt_dir=os.path.join(os.path.dirname(__file__), 'prompts'),
-                system_prompt_filename=self.config.resolved_system_prompt_filename,
+            self._prompt_manager = _get_prompt_manager(
+                os.path.join(os.path.dirname(__file__), 'prompts'),
+                self.config.resolved_system_prompt_filename,
             )
         return self._prompt_manager
 
@@ -225,12 +332,12 @@ Always think step-by-step and explain your reasoning.
         super().reset()
         logger.debug("CodeActAgentSDK reset")
 
-    def step(self, state: State) -> 'Action':
+    async def astep(self, state: State) -> 'Action':
         """
         Execute one step using Claude SDK.
 
-        This method maintains the same interface as the legacy CodeActAgent but
-        delegates execution to Claude SDK via the adapter.
+        Native async entry point: async callers (the controller, web
+        servers) should use this to avoid the sync/async bridge entirely.
 
         Args:
             state: Current OpenHands state
@@ -245,11 +352,11 @@ Always think step-by-step and explain your reasoning.
         4. Converts response to action
         5. Returns action
         """
-        logger.debug("CodeActAgentSDK step() called")
+        logger.debug("CodeActAgentSDK astep() called")
 
-        # Check for exit command
-        latest_user_message = state.get_last_user_message()
-        if latest_user_message and latest_user_message.content.strip() == '/exit':
+        # Check for exit command (raw scan; skips building a view)
+        last_user_text = state.get_last_user_text_raw()
+        if last_user_text is not None and last_user_text.strip() == '/exit':
             logger.info("Exit command detected")
             return AgentFinishAction()
 
@@ -262,27 +369,76 @@ Always think step-by-step and explain your reasoning.
             )
 
         try:
-            # Execute step via adapter
-            # The adapter handles:
+            # Execute step via adapter, anchored to the registry loop
+            # the shared client lives on. The adapter handles:
             # - Converting state to prompt
             # - Querying Claude SDK
             # - Converting response to action
-            action = run_async(self.adapter.execute_step(state))
+            action = await adapter_registry.arun(self.adapter.execute_step(state))
 
-            logger.info(f"Step executed, returning: {type(action).__name__}")
+            logger.info("Step executed, returning: %s", type(action).__name__)
             return action
 
         except Exception as e:
-            logger.error(f"Error in step execution: {e}", exc_info=True)
+            logger.error("Error in step execution: %s", e, exc_info=True)
             return MessageAction(
                 content=f"Error executing step: {str(e)}",
                 wait_for_response=False
             )
 
+    def step(self, state: State) -> 'Action':
+        """
+        Synchronous fallback for astep().
+
+        Maintains the same interface as the legacy CodeActAgent by
+        bridging onto the registry's shared-adapter loop; prefer astep()
+        when a loop is already available.
+
+        Args:
+            state: Current OpenHands state
+
+        Returns:
+            Action to execute
+        """
+        return self._run(self.astep(state))
+
+    async def aclose(self) -> None:
+        """
+        Release the adapter deterministically.
+
+        Prefer this (or the async context manager) over relying on
+        __del__, which depends on GC order at interpreter shutdown.
+        """
+        adapter = getattr(self, 'adapter', None)
+        if adapter is not None:
+            self.adapter = None
+            await adapter_registry.arelease(adapter)
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
+        return False
+
     def __del__(self):
-        """Cleanup when agent is destroyed."""
-        try:
-            if hasattr(self, 'adapter') and self.adapter:
-                run_async(self.adapter.cleanup())
-        except Exception as e:
-            logger.error(f"Error cleaning up adapter: {e}")
+        """Last-resort cleanup; prefer aclose()."""
+        adapter = getattr(self, 'adapter', None)
+        if adapter is not None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                try:
+                    # Cleanup runs on the registry loop, which stays up
+                    # for any surviving holders of the shared adapter
+                    adapter_registry.release(adapter)
+                except Exception as e:
+                    logger.error("Error cleaning up adapter: %s", e)
+            else:
+                # Can't block a running loop from a finalizer
+                logger.warning(
+                    "CodeActAgentSDK deleted without aclose(); "
+                    "adapter cleanup skipped"
+                )
@@ -31,7 +31,7 @@ Built-in Tools:
 
 import os
 import asyncio
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from openhands.llm.llm_registry import LLMRegistry
 
@@ -41,7 +41,7 @@ if TYPE_CHECKING:
 from openhands.agenthub.claude_sdk_adapter import (
     ClaudeSDKAdapter,
     ClaudeSDKAdapterConfig,
-    run_async,
+    adapter_registry,
 )
 from openhands.controller.agent import Agent
 from openhands.controller.state.state import State
@@ -54,13 +54,220 @@ from openhands.runtime.plugins import (
     PluginRequirement,
 )
 
-# Import MCP servers
-try:
-    from openhands.mcp_servers.jupyter_mcp import create_jupyter_mcp_server
-    MCP_AVAILABLE = True
-except ImportError:
-    logger.warning("Jupyter MCP server not available, LOC tools will be limited")
-    MCP_AVAILABLE = False
+# Whether the Jupyter MCP stack imports; None until first probed. The
+# import drags in jupyter_client/zmq/tornado, so it is deferred until a
+# LocAgentSDK is actually constructed and then memoized process-wide.
+_MCP_AVAILABLE: bool | None = None
+
+
+def _mcp_available() -> bool:
+    """Probe (at most once per process) whether Jupyter MCP is importable."""
+    global _MCP_AVAILABLE
+    if _MCP_AVAILABLE is None:
+        try:
+            from openhands.mcp_servers import batch_mcp, jupyter_mcp  # noqa: F401
+            _MCP_AVAILABLE = True
+        except ImportError:
+            logger.warning(
+                "Jupyter MCP server not available, LOC tools will be limited"
+            )
+            _MCP_AVAILABLE = False
+    return _MCP_AVAILABLE
+
+
+# Tool-set variants precomputed at import time, indexed by
+# (enable_cmd, enable_edit, mcp_available); config construction is a
+# single dict probe instead of per-instance list building
+_BASE_TOOLS = ("Read", "Grep", "Glob")
+_CMD_TOOLS = ("Bash",)
+_EDIT_TOOLS = ("Write", "Edit")
+_JUPYTER_TOOLS = (
+    "mcp__jupyter__execute_python",
+    "mcp__jupyter__kernel_info",
+    "mcp__jupyter__reset_kernel",
+)
+_BATCH_TOOLS = ("mcp__batch__execute",)
+_TOOL_VARIANTS = {
+    (cmd, edit, mcp): (
+        _BASE_TOOLS
+        + (_CMD_TOOLS if cmd else ())
+        + (_EDIT_TOOLS if edit else ())
+        + ((_JUPYTER_TOOLS + _BATCH_TOOLS) if mcp else ())
+    )
+    for cmd in (False, True)
+    for edit in (False, True)
+    for mcp in (False, True)
+}
+
+
+# LocAgent-specific system prompt; built once per process, not per
+# agent. Split into a compact core (sent by default) and the verbose
+# fenced examples (opt-in via config.verbose_prompt) — the examples are
+# ~1.5KB of token-hungry code blocks that only pay off in evaluation.
+_LOC_CORE_PROMPT: Final[str] = """You are a highly skilled software engineer specialized in code localization and analysis using graph-based representations.
+
+## Your Capabilities
+
+You have access to a powerful set of tools for navigating and understanding codebases through a pre-built code graph:
+
+### 1. explore_tree_structure
+Traverse the dependency graph to understand code structure and relationships.
+Signature: explore_tree_structure(start_entities, direction='upstream'|'downstream'|'both', traversal_depth=N, dependency_type_filter=[...])
+
+**Entity ID Format:**
+- Functions/Classes: `"file_path:QualifiedName"` (e.g., `"src/utils.py:Calculator.add"`)
+- Files: `"src/module.py"`
+- Directories: `"src/"`
+
+**Direction Options:**
+- `upstream`: Find what the entity depends on
+- `downstream`: Find what depends on the entity
+- `both`: Explore both directions
+
+**Dependency Types:**
+- `contains`: Directory/file containment
+- `imports`: Import relationships
+- `invokes`: Function/method calls
+- `inherits`: Class inheritance
+
+### 2. search_code_snippets
+Search the codebase for relevant code snippets.
+Signature: search_code_snippets(search_terms=[...]) or search_code_snippets(line_nums=[...], file_path_or_pattern='src/example.py')
+
+### 3. get_entity_contents
+Retrieve complete implementations of specific entities.
+Signature: get_entity_contents([entity_ids]) — accepts entity IDs, file paths, or a mix.
+
+## Code Graph Structure
+
+The codebase is represented as a directed heterogeneous graph:
+
+**Entity Types:**
+- `directory`: Directory nodes
+- `file`: Python/other source files
+- `class`: Class definitions
+- `function`: Function/method definitions
+
+**Relationships:**
+- `contains`: Hierarchical structure (dir → file → class → method)
+- `imports`: Import dependencies
+- `invokes`: Function/method invocations
+- `inherits`: Class inheritance
+
+## Your Approach
+
+1. **Understand the Task**: Carefully read the user's request to determine what code needs to be located
+2. **Start Broad**: Use `search_code_snippets` to find relevant areas of the codebase
+3. **Explore Structure**: Use `explore_tree_structure` to understand dependencies and relationships
+4. **Get Details**: Use `get_entity_contents` to retrieve specific implementations
+5. **Multi-hop Reasoning**: Follow dependency chains to understand impact and relationships
+6. **Verify**: Double-check your findings before presenting results
+
+## Best Practices
+
+- Use `explore_tree_structure` with `direction='both'` to get complete context
+- Start with shallow `traversal_depth` (1-2) and go deeper if needed
+- Use `dependency_type_filter` to focus on relevant relationships
+- Combine multiple tools for comprehensive understanding
+- Always provide entity IDs in the correct format: `"file_path:QualifiedName"`
+
+## Standard Tools
+
+You also have access to standard development tools:
+- **Read**: Read file contents
+- **Grep**: Search for patterns in files
+- **Glob**: Find files matching patterns
+- **Bash**: Execute shell commands (if enabled)
+- **Write/Edit**: Modify files (if enabled)
+
+Always think step-by-step and explain your reasoning as you navigate the codebase.
+"""
+
+# Verbose worked examples, appended only when config.verbose_prompt is set
+_LOC_EXAMPLES: Final[str] = """
+
+## Worked Examples
+
+### explore_tree_structure
+
+```python
+# Explore downstream dependencies (what depends on this entity)
+print(explore_tree_structure(
+    start_entities=['src/module.py:ClassName'],
+    direction='downstream',
+    traversal_depth=2,
+    dependency_type_filter=['invokes', 'imports']
+))
+
+# Explore upstream dependencies (what this entity depends on)
+print(explore_tree_structure(
+    start_entities=['src/module.py:ClassName'],
+    direction='upstream',
+    traversal_depth=2
+))
+
+# Explore repository structure from root
+print(explore_tree_structure(
+    start_entities=['/'],
+    traversal_depth=2,
+    dependency_type_filter=['contains']
+))
+```
+
+### search_code_snippets
+
+```python
+# Search by keywords
+print(search_code_snippets(search_terms=["ClassName", "function_name"]))
+
+# Search by line numbers in a specific file
+print(search_code_snippets(
+    line_nums=[10, 25, 50],
+    file_path_or_pattern='src/example.py'
+))
+
+# Search with file pattern
+print(search_code_snippets(
+    search_terms=["keyword"],
+    file_path_or_pattern='src/**/*.py'
+))
+```
+
+### get_entity_contents
+
+```python
+# Get function/class implementation
+print(get_entity_contents(['src/utils.py:Calculator.add']))
+
+# Get entire file contents
+print(get_entity_contents(['src/utils.py']))
+
+# Get multiple entities
+print(get_entity_contents([
+    'src/module_a.py:ClassA',
+    'src/module_b.py:ClassB.method'
+]))
+```
+"""
+
+# Appended to the system prompt when the batch MCP server is available
+_LOC_BATCH_SNIPPET: Final[str] = """
+
+## Batching Tool Calls
+
+When several Jupyter tool calls are independent, combine them into one
+mcp__batch__execute call so they run concurrently in a single round-trip:
+
+```json
+{
+  "calls": [
+    {"tool": "execute_python", "arguments": {"code": "print(search_code_snippets(search_terms=['Calculator']))"}},
+    {"tool": "execute_python", "arguments": {"code": "print(get_entity_contents(['src/utils.py:Calculator.add']))"}}
+  ],
+  "maxConcurrent": 4
+}
+```
+"""
 
 
 class LocAgentSDK(Agent):
@@ -105,18 +312,45 @@ class LocAgentSDK(Agent):
         # Create adapter configuration
         self.adapter_config = self._create_adapter_config()
 
-        # Create Claude SDK adapter
-        self.adapter = ClaudeSDKAdapter(self.adapter_config)
+        # Acquire a (possibly shared) Claude SDK adapter; instances with
+        # equivalent configs reuse one subprocess, kernel and MCP
+        # handshake instead of each paying full startup
+        self.adapter = adapter_registry.acquire(self.adapter_config)
+
+        # History offset already serialized into the rolling context;
+        # step() only hands over events appended after this index. The
+        # window itself lives here, not on the adapter — the adapter may
+        # be shared with other agents, whose conversations must not
+        # interleave with ours
+        self._last_history_len = 0
+        self._context_parts: list[str] = []
 
         # Initialize adapter asynchronously
         self._initialize_adapter()
 
         logger.info("LocAgentSDK initialized with LOC-specific tools")
 
+    def _run(self, coro, timeout: float = 600.0):
+        """
+        Run a coroutine on the registry's shared-adapter loop.
+
+        A shared adapter's client, MCP stdio connection, and reader task
+        are bound to the loop they were initialized on; the registry
+        owns that loop and keeps it alive between turns.
+
+        Args:
+            coro: Coroutine to schedule
+            timeout: Seconds to wait for the result
+
+        Returns:
+            The coroutine's result
+        """
+        return adapter_registry.run(coro, timeout)
+
     def _initialize_adapter(self) -> None:
         """Initialize the Claude SDK adapter asynchronously."""
         try:
-            run_async(self.adapter.initialize())
+            self._run(self.adapter.initialize())
             logger.info("Claude SDK adapter initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Claude SDK adapter: {e}")
@@ -134,36 +368,44 @@ class LocAgentSDK(Agent):
         Returns:
             ClaudeSDKAdapterConfig for the adapter
         """
-        # Define allowed tools based on config
-        # LocAgent primarily uses file reading and Jupyter for LOC tools
-        allowed_tools = ["Read", "Grep", "Glob"]
+        mcp_available = _mcp_available()
 
-        # Add optional command execution
-        if self.config.enable_cmd:
-            allowed_tools.append("Bash")
-
-        # Add optional file editing
-        if self.config.enable_editor or self.config.enable_llm_editor:
-            allowed_tools.extend(["Write", "Edit"])
+        # Pick the precomputed tool set for this feature combination;
+        # LocAgent primarily uses file reading and Jupyter for LOC tools
+        allowed_tools = list(_TOOL_VARIANTS[(
+            bool(self.config.enable_cmd),
+            bool(self.config.enable_editor or self.config.enable_llm_editor),
+            mcp_available,
+        )])
 
         # Prepare MCP servers
         mcp_servers = {}
 
         # Jupyter is REQUIRED for LOC tools (explore_tree_structure, search_code_snippets, get_entity_contents)
-        if MCP_AVAILABLE:
+        if mcp_available:
+            from openhands.mcp_servers.batch_mcp import create_batch_mcp_server
+            from openhands.mcp_servers.jupyter_mcp import create_jupyter_mcp_server
+
             mcp_servers["jupyter"] = create_jupyter_mcp_server()
-            # Add Jupyter MCP tools - these will be used to call LOC functions
-            allowed_tools.extend([
-                "mcp__jupyter__execute_python",
-                "mcp__jupyter__kernel_info",
-                "mcp__jupyter__reset_kernel"
-            ])
+            # Batch aggregator: one tool-use turn fans out to several
+            # Jupyter calls instead of N stdio round-trips
+            mcp_servers["batch"] = create_batch_mcp_server()
             logger.info("Jupyter MCP server configured for LOC tools")
         else:
             logger.warning("Jupyter MCP not available - LOC tools will not function properly")
 
-        # Load system prompt
-        system_prompt = self._load_system_prompt()
+        # Load system prompt and mark it as the sole prompt-cache
+        # breakpoint (Anthropic prompt-caching shape), so every step
+        # after the first hits a prefix cache. Dynamic history turns
+        # deliberately get no cache_control.
+        system_prompt_text = self._load_system_prompt()
+        if mcp_available:
+            system_prompt_text += _LOC_BATCH_SNIPPET
+        system_prompt = [{
+            "type": "text",
+            "text": system_prompt_text,
+            "cache_control": {"type": "ephemeral"},
+        }]
 
         # Create adapter config
         adapter_config = ClaudeSDKAdapterConfig(
@@ -186,154 +428,30 @@ class LocAgentSDK(Agent):
         """
         Load system prompt for the LocAgent.
 
-        This creates a specialized prompt that explains:
+        The prompt is built from module-level constants. It explains:
         - The graph-based code representation
         - The three LOC-specific tools
         - Best practices for code localization
         - How to use multi-hop reasoning
 
+        The compact core prompt is used by default; the verbose fenced
+        examples are only appended when config.verbose_prompt is set
+        (mainly for agent evaluation), keeping the first-turn token cost
+        down.
+
         Returns:
             System prompt string optimized for code localization tasks
         """
-        # LocAgent-specific system prompt
-        loc_prompt = """You are a highly skilled software engineer specialized in code localization and analysis using graph-based representations.
-
-## Your Capabilities
-
-You have access to a powerful set of tools for navigating and understanding codebases through a pre-built code graph:
-
-### 1. explore_tree_structure
-Traverse the dependency graph to understand code structure and relationships.
-
-**Usage:**
-```python
-# Explore downstream dependencies (what depends on this entity)
-print(explore_tree_structure(
-    start_entities=['src/module.py:ClassName'],
-    direction='downstream',
-    traversal_depth=2,
-    dependency_type_filter=['invokes', 'imports']
-))
-
-# Explore upstream dependencies (what this entity depends on)
-print(explore_tree_structure(
-    start_entities=['src/module.py:ClassName'],
-    direction='upstream',
-    traversal_depth=2
-))
-
-# Explore repository structure from root
-print(explore_tree_structure(
-    start_entities=['/'],
-    traversal_depth=2,
-    dependency_type_filter=['contains']
-))
-```
-
-**Entity ID Format:**
-- Functions/Classes: `"file_path:QualifiedName"` (e.g., `"src/utils.py:Calculator.add"`)
-- Files: `"src/module.py"`
-- Directories: `"src/"`
-
-**Direction Options:**
-- `upstream`: Find what the entity depends on
-- `downstream`: Find what depends on the entity
-- `both`: Explore both directions
-
-**Dependency Types:**
-- `contains`: Directory/file containment
-- `imports`: Import relationships
-- `invokes`: Function/method calls
-- `inherits`: Class inheritance
-
-### 2. search_code_snippets
-Search the codebase for relevant code snippets.
-
-**Usage:**
-```python
-# Search by keywords
-print(search_code_snippets(search_terms=["ClassName", "function_name"]))
-
-# Search by line numbers in a specific file
-print(search_code_snippets(
-    line_nums=[10, 25, 50],
-    file_path_or_pattern='src/example.py'
-))
-
-# Search with file pattern
-print(search_code_snippets(
-    search_terms=["keyword"],
-    file_path_or_pattern='src/**/*.py'
-))
-```
+        if self.config.verbose_prompt:
+            return _LOC_CORE_PROMPT + _LOC_EXAMPLES
+        return _LOC_CORE_PROMPT
 
-### 3. get_entity_contents
-Retrieve complete implementations of specific entities.
-
-**Usage:**
-```python
-# Get function/class implementation
-print(get_entity_contents(['src/utils.py:Calculator.add']))
-
-# Get entire file contents
-print(get_entity_contents(['src/utils.py']))
-
-# Get multiple entities
-print(get_entity_contents([
-    'src/module_a.py:ClassA',
-    'src/module_b.py:ClassB.method'
-]))
-```
-
-## Code Graph Structure
-
-The codebase is represented as a directed heterogeneous graph:
-
-**Entity Types:**
-- `directory`: Directory nodes
-- `file`: Python/other source files
-- `class`: Class definitions
-- `function`: Function/method definitions
-
-**Relationships:**
-- `contains`: Hierarchical structure (dir → file → class → method)
-- `imports`: Import dependencies
-- `invokes`: Function/method invocations
-- `inherits`: Class inheritance
-
-## Your Approach
-
-1. **Understand the Task**: Carefully read the user's request to determine what code needs to be located
-2. **Start Broad**: Use `search_code_snippets` to find relevant areas of the codebase
-3. **Explore Structure**: Use `explore_tree_structure` to understand dependencies and relationships
-4. **Get Details**: Use `get_entity_contents` to retrieve specific implementations
-5. **Multi-hop Reasoning**: Follow dependency chains to understand impact and relationships
-6. **Verify**: Double-check your findings before presenting results
-
-## Best Practices
-
-- Use `explore_tree_structure` with `direction='both'` to get complete context
-- Start with shallow `traversal_depth` (1-2) and go deeper if needed
-- Use `dependency_type_filter` to focus on relevant relationships
-- Combine multiple tools for comprehensive understanding
-- Always provide entity IDs in the correct format: `"file_path:QualifiedName"`
-
-## Standard Tools
-
-You also have access to standard development tools:
-- **Read**: Read file contents
-- **Grep**: Search for patterns in files
-- **Glob**: Find files matching patterns
-- **Bash**: Execute shell commands (if enabled)
-- **Write/Edit**: Modify files (if enabled)
-
-Always think step-by-step and explain your reasoning as you navigate the codebase.
-"""
-        return loc_prompt
 
     def reset(self) -> None:
         """Reset the agent's internal state."""
         super().reset()
+        self._last_history_len = 0
+        self._context_parts.clear()
         logger.debug("LocAgentSDK reset")
 
     def step(self, state: State) -> 'Action':
@@ -373,13 +491,24 @@ Always think step-by-step and explain your reasoning as you navigate the codebas
             )
 
         try:
-            # Execute step via adapter
-            # The adapter handles:
-            # - Converting state to prompt
+            # Execute step via adapter, handing over only the history
+            # delta since the previous step (the adapter keeps the
+            # already-serialized prefix). The adapter handles:
+            # - Converting new events to prompt context
             # - Querying Claude SDK
             # - Converting response to action
             # - Mapping LOC tool calls (explore_tree_structure, etc.) to IPythonRunCellAction
-            action = run_async(self.adapter.execute_step(state))
+            if len(state.history) < self._last_history_len:
+                # History was rewound (restore/truncation); start over
+                self._last_history_len = 0
+                self._context_parts.clear()
+            new_events = state.history[self._last_history_len:]
+            self._last_history_len = len(state.history)
+            action = self._run(
+                self.adapter.execute_step_incremental(
+                    state, new_events, self._context_parts
+                )
+            )
 
             logger.info(f"Step executed, returning: {type(action).__name__}")
             return action
@@ -392,10 +521,22 @@ Always think step-by-step and explain your reasoning as you navigate the codebas
             )
 
     def __del__(self):
-        """Cleanup when agent is destroyed."""
+        """
+        Cleanup when agent is destroyed.
+
+        GC can fire from arbitrary threads (or mid-shutdown), so cleanup
+        is submitted fire-and-forget to the registry loop rather than
+        waited on; blocking a finalizer on a 30s cleanup stalls
+        teardown when many agents are collected at once.
+        """
         try:
-            if hasattr(self, 'adapter') and self.adapter:
-                run_async(self.adapter.cleanup())
-                logger.info("LocAgentSDK adapter cleaned up")
+            adapter = getattr(self, 'adapter', None)
+            if adapter is not None:
+                # Release through the registry: cleanup only runs when
+                # the last holder of a shared adapter lets go, and is
+                # scheduled fire-and-forget on the registry loop (which
+                # stays up for surviving holders)
+                adapter_registry.release(adapter, runner=adapter_registry.submit)
+                logger.debug("LocAgentSDK adapter released")
         except Exception as e:
-            logger.error(f"Error cleaning up adapter: {e}")
+            logger.error("Error releasing adapter: %s", e)
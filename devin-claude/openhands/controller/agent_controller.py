@@ -191,6 +191,10 @@ class AgentController:
         self._stuck_detector = StuckDetector(self.state)
         self.status_callback = status_callback
 
+        # Set whenever agent_state changes; lets run loops wait on real
+        # transitions instead of polling.
+        self.state_changed = asyncio.Event()
+
         # replay-related
         self._replay_manager = ReplayManager(replay_events)
 
@@ -713,6 +717,9 @@ class AgentController:
         # in case of crashes or unexpected circumstances
         self.save_state()
 
+        # Wake anything waiting for a state transition
+        self.state_changed.set()
+
     def get_agent_state(self) -> AgentState:
         """Returns the current state of the agent.
 
@@ -6,7 +6,11 @@ LiteLLM (legacy agents) and Claude SDK (SDK agents) to OpenHands error types.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional, Tuple
+import itertools
+import logging
+import sys
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple, Union
 
 from litellm.exceptions import (
     APIConnectionError,
@@ -36,22 +40,112 @@ if TYPE_CHECKING:
     from openhands.controller.state.state import State
 
 
+class AgentType(IntEnum):
+    """Agent execution kind.
+
+    An IntEnum so hot-path comparisons are identity checks rather than
+    string equality; handle_error still accepts the legacy 'legacy'/'sdk'
+    strings at the public boundary.
+    """
+
+    LEGACY = 0
+    SDK = 1
+
+
 class ErrorCategory:
-    """Error categories for unified handling."""
-
-    LLM_ERROR = 'llm_error'
-    CONTEXT_WINDOW = 'context_window'
-    CONTROL_FLAG = 'control_flag'
-    STUCK_DETECTION = 'stuck_detection'
-    UNEXPECTED = 'unexpected'
-    AUTHENTICATION = 'authentication'
-    RATE_LIMIT = 'rate_limit'
-    SERVICE_UNAVAILABLE = 'service_unavailable'
-    INTERNAL_SERVER = 'internal_server'
-    CONTENT_POLICY = 'content_policy'
-    MALFORMED_ACTION = 'malformed_action'
-    NO_ACTION = 'no_action'
-    FUNCTION_CALL_ERROR = 'function_call_error'
+    """Error categories for unified handling.
+
+    Values are sys.intern'd so hot-path membership tests and equality
+    checks short-circuit on pointer identity.
+    """
+
+    LLM_ERROR = sys.intern('llm_error')
+    CONTEXT_WINDOW = sys.intern('context_window')
+    CONTROL_FLAG = sys.intern('control_flag')
+    STUCK_DETECTION = sys.intern('stuck_detection')
+    UNEXPECTED = sys.intern('unexpected')
+    AUTHENTICATION = sys.intern('authentication')
+    RATE_LIMIT = sys.intern('rate_limit')
+    SERVICE_UNAVAILABLE = sys.intern('service_unavailable')
+    INTERNAL_SERVER = sys.intern('internal_server')
+    CONTENT_POLICY = sys.intern('content_policy')
+    MALFORMED_ACTION = sys.intern('malformed_action')
+    NO_ACTION = sys.intern('no_action')
+    FUNCTION_CALL_ERROR = sys.intern('function_call_error')
+
+
+def _const_category(category: str) -> Callable[[Exception, str], str]:
+    """Build a handler that returns a fixed category."""
+
+    def handler(error: Exception, error_msg: str) -> str:
+        return category
+
+    return handler
+
+
+def _handle_bad_request(error: Exception, error_msg: str) -> str:
+    """BadRequestError sometimes wraps a content-policy refusal as a 400."""
+    if 'ContentPolicyViolationError' in error_msg:
+        return ErrorCategory.CONTENT_POLICY
+    return ErrorCategory.LLM_ERROR
+
+
+# Per-exception-type categorization handlers, built once at import.
+# _categorize_error resolves via type(error).__mro__, so the substring
+# probe in _handle_bad_request is paid only by plain BadRequestError —
+# every other type returns its constant without touching str(error).
+_EXC_HANDLERS: dict[type, Callable[[Exception, str], str]] = {
+    AgentStuckInLoopError: _const_category(ErrorCategory.STUCK_DETECTION),
+    ContextWindowExceededError: _const_category(ErrorCategory.CONTEXT_WINDOW),
+    LLMContextWindowExceedError: _const_category(ErrorCategory.CONTEXT_WINDOW),
+    AuthenticationError: _const_category(ErrorCategory.AUTHENTICATION),
+    RateLimitError: _const_category(ErrorCategory.RATE_LIMIT),
+    ServiceUnavailableError: _const_category(ErrorCategory.SERVICE_UNAVAILABLE),
+    APIConnectionError: _const_category(ErrorCategory.SERVICE_UNAVAILABLE),
+    InternalServerError: _const_category(ErrorCategory.INTERNAL_SERVER),
+    ContentPolicyViolationError: _const_category(ErrorCategory.CONTENT_POLICY),
+    LLMMalformedActionError: _const_category(ErrorCategory.MALFORMED_ACTION),
+    LLMNoActionError: _const_category(ErrorCategory.NO_ACTION),
+    FunctionCallValidationError: _const_category(ErrorCategory.FUNCTION_CALL_ERROR),
+    FunctionCallNotExistsError: _const_category(ErrorCategory.FUNCTION_CALL_ERROR),
+    LLMResponseError: _const_category(ErrorCategory.LLM_ERROR),
+    APIError: _const_category(ErrorCategory.LLM_ERROR),
+    BadRequestError: _handle_bad_request,
+}
+
+
+# Uppercase display forms of the categories, computed once at import
+_CATEGORY_UPPER = {
+    value: value.upper()
+    for name, value in vars(ErrorCategory).items()
+    if not name.startswith('__') and isinstance(value, str)
+}
+
+# Category sets for is_recoverable/should_retry, hoisted so the hot
+# retry loop doesn't rebuild a set literal per call
+_RECOVERABLE = frozenset({
+    ErrorCategory.RATE_LIMIT,
+    ErrorCategory.SERVICE_UNAVAILABLE,
+    ErrorCategory.MALFORMED_ACTION,
+    ErrorCategory.NO_ACTION,
+    ErrorCategory.FUNCTION_CALL_ERROR,
+    ErrorCategory.CONTEXT_WINDOW,
+})
+_RETRYABLE = frozenset({
+    ErrorCategory.RATE_LIMIT,
+    ErrorCategory.SERVICE_UNAVAILABLE,
+    ErrorCategory.INTERNAL_SERVER,
+})
+
+# Category -> log severity; anything unlisted logs at INFO
+_CATEGORY_LOG_LEVEL = {
+    ErrorCategory.AUTHENTICATION: logging.ERROR,
+    ErrorCategory.CONTENT_POLICY: logging.ERROR,
+    ErrorCategory.UNEXPECTED: logging.ERROR,
+    ErrorCategory.RATE_LIMIT: logging.WARNING,
+    ErrorCategory.SERVICE_UNAVAILABLE: logging.WARNING,
+    ErrorCategory.INTERNAL_SERVER: logging.WARNING,
+}
 
 
 class UnifiedErrorHandler:
@@ -61,101 +155,100 @@ class UnifiedErrorHandler:
     agent types, mapping them to appropriate OpenHands error types and categories.
     """
 
+    __slots__ = ('logger', '_error_counter')
+
+    # Static user-facing messages, built once at class creation;
+    # get_user_message only formats the error for the dynamic categories
+    _STATIC_USER_MESSAGES: dict[str, str] = {
+        ErrorCategory.AUTHENTICATION: 'Authentication failed. Please check your API credentials.',
+        ErrorCategory.RATE_LIMIT: 'Rate limit exceeded. The agent will retry automatically.',
+        ErrorCategory.CONTEXT_WINDOW: 'Context window exceeded. Consider enabling history truncation.',
+        ErrorCategory.CONTENT_POLICY: 'Content policy violation. Please rephrase your request.',
+        ErrorCategory.SERVICE_UNAVAILABLE: 'Service temporarily unavailable. Retrying...',
+        ErrorCategory.INTERNAL_SERVER: 'Internal server error. The agent will retry.',
+        ErrorCategory.STUCK_DETECTION: 'Agent stuck in a loop. Consider resetting or providing different instructions.',
+        ErrorCategory.MALFORMED_ACTION: 'The agent produced a malformed action. Retrying...',
+        ErrorCategory.NO_ACTION: 'The agent did not produce an action. Retrying...',
+        ErrorCategory.FUNCTION_CALL_ERROR: 'Function call error. The agent will retry.',
+    }
+
     def __init__(self):
         """Initialize the unified error handler."""
         self.logger = logger
 
+        # Monotonic counter for error ids; id(error) addresses get
+        # reused for short-lived exceptions and would collide
+        self._error_counter = itertools.count()
+
     def handle_error(
         self,
         error: Exception,
         context: Optional[dict[str, Any]] = None,
-        agent_type: str = 'legacy',
+        agent_type: Union[AgentType, str] = AgentType.LEGACY,
     ) -> Tuple[ErrorObservation, str]:
         """Handle error and return observation + category.
 
         Args:
             error: The exception that occurred
             context: Additional context about the error (state, action, etc.)
-            agent_type: Type of agent ('legacy' or 'sdk')
+            agent_type: Kind of agent (AgentType; the legacy 'legacy'/'sdk'
+                strings are still accepted)
 
         Returns:
             Tuple of (ErrorObservation, error_category)
         """
-        if context is None:
-            context = {}
+        # context stays None when absent (the common case); sub-methods
+        # handle the sentinel, saving a dict allocation per call
+
+        # Deprecation shim for callers still passing strings
+        if isinstance(agent_type, str):
+            agent_type = AgentType.SDK if agent_type == 'sdk' else AgentType.LEGACY
+
+        # Materialize the error strings once; LiteLLM exceptions can
+        # carry full HTTP bodies, so repeated str(error) calls allocate
+        # KB-sized strings
+        error_type = type(error).__name__
+        try:
+            error_msg = str(error)
+        except Exception:
+            error_msg = '<unprintable error>'
 
         # Categorize the error
-        category = self._categorize_error(error, agent_type)
+        category = self._categorize_error(error, agent_type, error_msg)
 
         # Create error observation
-        observation = self._create_error_observation(error, category, context)
+        observation = self._create_error_observation(
+            error, category, context, error_type, error_msg
+        )
 
         # Log error with structured metadata
-        self._log_error(error, category, context, agent_type)
+        self._log_error(category, context, agent_type, error_type, error_msg)
 
         return observation, category
 
-    def _categorize_error(self, error: Exception, agent_type: str) -> str:
+    def _categorize_error(
+        self, error: Exception, agent_type: AgentType, error_msg: str
+    ) -> str:
         """Categorize error into one of the error categories.
 
         Args:
             error: The exception to categorize
-            agent_type: Type of agent ('legacy' or 'sdk')
+            agent_type: Kind of agent
+            error_msg: Pre-computed str(error)
 
         Returns:
             Error category string
         """
-        # Handle stuck detection errors
-        if isinstance(error, AgentStuckInLoopError):
-            return ErrorCategory.STUCK_DETECTION
-
-        # Handle context window errors
-        if isinstance(
-            error, (ContextWindowExceededError, LLMContextWindowExceedError)
-        ):
-            return ErrorCategory.CONTEXT_WINDOW
-
-        # Handle authentication errors
-        if isinstance(error, AuthenticationError):
-            return ErrorCategory.AUTHENTICATION
-
-        # Handle rate limit errors
-        if isinstance(error, RateLimitError):
-            return ErrorCategory.RATE_LIMIT
-
-        # Handle service unavailable errors
-        if isinstance(error, (ServiceUnavailableError, APIConnectionError)):
-            return ErrorCategory.SERVICE_UNAVAILABLE
-
-        # Handle internal server errors
-        if isinstance(error, InternalServerError):
-            return ErrorCategory.INTERNAL_SERVER
-
-        # Handle content policy violations
-        if isinstance(error, ContentPolicyViolationError) or (
-            isinstance(error, BadRequestError)
-            and 'ContentPolicyViolationError' in str(error)
-        ):
-            return ErrorCategory.CONTENT_POLICY
-
-        # Handle malformed action errors
-        if isinstance(error, LLMMalformedActionError):
-            return ErrorCategory.MALFORMED_ACTION
-
-        # Handle no action errors
-        if isinstance(error, LLMNoActionError):
-            return ErrorCategory.NO_ACTION
-
-        # Handle function call errors
-        if isinstance(error, (FunctionCallValidationError, FunctionCallNotExistsError)):
-            return ErrorCategory.FUNCTION_CALL_ERROR
-
-        # Handle generic LLM errors
-        if isinstance(error, (LLMResponseError, APIError, BadRequestError)):
-            return ErrorCategory.LLM_ERROR
+        # Single MRO walk against the prebuilt handler table; the most
+        # specific registered ancestor wins, and only plain
+        # BadRequestError pays the content-policy substring probe
+        for cls in type(error).__mro__:
+            handler = _EXC_HANDLERS.get(cls)
+            if handler is not None:
+                return handler(error, error_msg)
 
         # Handle SDK-specific errors (placeholder for future SDK error types)
-        if agent_type == 'sdk':
+        if agent_type is AgentType.SDK:
             # Future: Map Claude SDK specific errors here
             # For now, treat as LLM errors
             return ErrorCategory.LLM_ERROR
@@ -164,61 +257,78 @@ class UnifiedErrorHandler:
         return ErrorCategory.UNEXPECTED
 
     def _create_error_observation(
-        self, error: Exception, category: str, context: dict[str, Any]
+        self,
+        error: Exception,
+        category: str,
+        context: Optional[dict[str, Any]],
+        error_type: str,
+        error_msg: str,
     ) -> ErrorObservation:
         """Create ErrorObservation from error.
 
         Args:
             error: The exception that occurred
             category: The error category
-            context: Additional context
+            context: Additional context, or None
+            error_type: Pre-computed type(error).__name__
+            error_msg: Pre-computed str(error)
 
         Returns:
             ErrorObservation instance
         """
-        # Build error message
-        error_type = type(error).__name__
-        error_msg = str(error)
-
-        # Create content with category information
-        content = f'[{category.upper()}] {error_type}: {error_msg}'
+        # Build content as a list + join (linear assembly, and the
+        # uppercase category form is precomputed at import)
+        category_upper = _CATEGORY_UPPER.get(category) or category.upper()
+        parts = [f'[{category_upper}] {error_type}: {error_msg}']
 
         # Add context information if available
-        if context:
-            if 'action' in context:
-                content += f'\nAction: {context["action"]}'
-            if 'step_count' in context:
-                content += f'\nStep: {context["step_count"]}'
+        if context is not None:
+            action = context.get('action')
+            if action is not None:
+                parts.append(f'Action: {action}')
+            step_count = context.get('step_count')
+            if step_count is not None:
+                parts.append(f'Step: {step_count}')
+        content = '\n'.join(parts)
 
         # Create and return error observation
         return ErrorObservation(
             content=content,
-            error_id=f'{error_type}_{id(error)}',
+            error_id=f'{error_type}_{next(self._error_counter)}',
         )
 
     def _log_error(
         self,
-        error: Exception,
         category: str,
-        context: dict[str, Any],
-        agent_type: str,
+        context: Optional[dict[str, Any]],
+        agent_type: AgentType,
+        error_type: str,
+        error_msg: str,
     ) -> None:
         """Log error with structured metadata.
 
         Args:
-            error: The exception that occurred
             category: The error category
-            context: Additional context
-            agent_type: Type of agent
+            context: Additional context, or None
+            agent_type: Kind of agent
+            error_type: Pre-computed type(error).__name__
+            error_msg: Pre-computed str(error)
         """
-        error_type = type(error).__name__
-        error_msg = str(error)
+        # Pick severity first so a suppressed level skips the
+        # structured-data allocation entirely
+        level = _CATEGORY_LOG_LEVEL.get(category, logging.INFO)
+
+        if not self.logger.isEnabledFor(level):
+            return
+
+        # Only materialize the name string once we know the record is kept
+        agent_type_name = agent_type.name.lower()
 
         # Build structured log message
         log_data = {
             'error_type': error_type,
             'error_category': category,
-            'agent_type': agent_type,
+            'agent_type': agent_type_name,
             'error_message': error_msg,
         }
 
@@ -226,31 +336,14 @@ class UnifiedErrorHandler:
         if context:
             log_data['context'] = context
 
-        # Log based on category severity
-        if category in (
-            ErrorCategory.AUTHENTICATION,
-            ErrorCategory.CONTENT_POLICY,
-            ErrorCategory.UNEXPECTED,
-        ):
-            self.logger.error(
-                f'Critical error in {agent_type} agent: {error_type}',
-                extra=log_data,
-                exc_info=True,
-            )
-        elif category in (
-            ErrorCategory.RATE_LIMIT,
-            ErrorCategory.SERVICE_UNAVAILABLE,
-            ErrorCategory.INTERNAL_SERVER,
-        ):
-            self.logger.warning(
-                f'Service error in {agent_type} agent: {error_type}',
-                extra=log_data,
-            )
-        else:
-            self.logger.info(
-                f'Recoverable error in {agent_type} agent: {error_type}',
-                extra=log_data,
-            )
+        self.logger.log(
+            level,
+            'Error in %s agent: %s',
+            agent_type_name,
+            error_type,
+            extra=log_data,
+            exc_info=(level >= logging.ERROR),
+        )
 
     def is_recoverable(self, category: str) -> bool:
         """Check if an error category is recoverable.
@@ -261,15 +354,7 @@ class UnifiedErrorHandler:
         Returns:
             True if the error is recoverable, False otherwise
         """
-        recoverable_categories = {
-            ErrorCategory.RATE_LIMIT,
-            ErrorCategory.SERVICE_UNAVAILABLE,
-            ErrorCategory.MALFORMED_ACTION,
-            ErrorCategory.NO_ACTION,
-            ErrorCategory.FUNCTION_CALL_ERROR,
-            ErrorCategory.CONTEXT_WINDOW,
-        }
-        return category in recoverable_categories
+        return category in _RECOVERABLE
 
     def should_retry(self, category: str, retry_count: int = 0) -> bool:
         """Determine if an error should trigger a retry.
@@ -281,18 +366,8 @@ class UnifiedErrorHandler:
         Returns:
             True if should retry, False otherwise
         """
-        max_retries = 3
-
-        if retry_count >= max_retries:
-            return False
-
-        retryable_categories = {
-            ErrorCategory.RATE_LIMIT,
-            ErrorCategory.SERVICE_UNAVAILABLE,
-            ErrorCategory.INTERNAL_SERVER,
-        }
-
-        return category in retryable_categories
+        # Exhausted retries short-circuit before the set lookup
+        return retry_count < 3 and category in _RETRYABLE
 
     def get_user_message(self, category: str, error: Exception) -> str:
         """Get a user-friendly error message.
@@ -304,21 +379,14 @@ class UnifiedErrorHandler:
         Returns:
             User-friendly error message
         """
-        category_messages = {
-            ErrorCategory.AUTHENTICATION: 'Authentication failed. Please check your API credentials.',
-            ErrorCategory.RATE_LIMIT: 'Rate limit exceeded. The agent will retry automatically.',
-            ErrorCategory.CONTEXT_WINDOW: 'Context window exceeded. Consider enabling history truncation.',
-            ErrorCategory.CONTENT_POLICY: 'Content policy violation. Please rephrase your request.',
-            ErrorCategory.SERVICE_UNAVAILABLE: 'Service temporarily unavailable. Retrying...',
-            ErrorCategory.INTERNAL_SERVER: 'Internal server error. The agent will retry.',
-            ErrorCategory.STUCK_DETECTION: 'Agent stuck in a loop. Consider resetting or providing different instructions.',
-            ErrorCategory.MALFORMED_ACTION: 'The agent produced a malformed action. Retrying...',
-            ErrorCategory.NO_ACTION: 'The agent did not produce an action. Retrying...',
-            ErrorCategory.FUNCTION_CALL_ERROR: 'Function call error. The agent will retry.',
-            ErrorCategory.LLM_ERROR: f'LLM error: {str(error)}',
-            ErrorCategory.UNEXPECTED: f'Unexpected error: {str(error)}',
-        }
+        msg = self._STATIC_USER_MESSAGES.get(category)
+        if msg is not None:
+            return msg
 
-        return category_messages.get(
-            category, f'An error occurred: {type(error).__name__}'
-        )
+        # Only the dynamic messages pay for str(error)
+        if category == ErrorCategory.LLM_ERROR:
+            return f'LLM error: {error}'
+        if category == ErrorCategory.UNEXPECTED:
+            return f'Unexpected error: {error}'
+
+        return f'An error occurred: {type(error).__name__}'
@@ -30,6 +30,7 @@ Usage:
 from typing import Optional, Callable, Any, Dict, Union
 import asyncio
 import logging
+import weakref
 from pathlib import Path
 from enum import Enum
 
@@ -39,7 +40,7 @@ from openhands.core.schema import AgentState
 from openhands.events import EventStream, EventSource
 from openhands.events.action import Action, MessageAction, AgentFinishAction, NullAction
 from openhands.events.observation import Observation, AgentStateChangedObservation, ErrorObservation
-from openhands.orchestrator import TaskOrchestrator, TaskStatus
+from openhands.orchestrator import Progress, TaskOrchestrator, TaskStatus
 from openhands.server.services.conversation_stats import ConversationStats
 from openhands.llm.metrics import Metrics
 
@@ -50,6 +51,9 @@ from openhands.agenthub.claude_sdk_adapter import ClaudeSDKAdapter
 
 logger = logging.getLogger(__name__)
 
+# Hoisted attribute lookup for the per-tick progress path
+_SRC_AGENT = EventSource.AGENT
+
 
 class AgentType(Enum):
     """Agent execution type."""
@@ -57,6 +61,13 @@ class AgentType(Enum):
     LEGACY = "legacy"
 
 
+# Per-instance detection cache. WeakKeyDictionary so cached verdicts
+# don't keep dead agents alive; entries vanish with their agent.
+_TYPE_CACHE: 'weakref.WeakKeyDictionary[Agent, AgentType]' = weakref.WeakKeyDictionary()
+_cache_hits = 0
+_cache_misses = 0
+
+
 def detect_agent_type(agent: Agent) -> AgentType:
     """
     Detect if agent is SDK or legacy type.
@@ -66,20 +77,102 @@ def detect_agent_type(agent: Agent) -> AgentType:
     - Class name containing 'SDK'
     - Being instance of SDK agent classes
 
+    Verdicts are cached per instance (weakly, so agents can still be
+    collected); detection runs at most once per agent object.
+
     Args:
         agent: Agent instance to check
 
     Returns:
         AgentType.SDK or AgentType.LEGACY
     """
-    # Check for ClaudeSDKAdapter attribute
-    if hasattr(agent, 'adapter') and isinstance(agent.adapter, ClaudeSDKAdapter):
-        logger.debug(f"Detected SDK agent (has ClaudeSDKAdapter): {agent.name}")
-        return AgentType.SDK
+    global _cache_hits, _cache_misses
+
+    try:
+        cached = _TYPE_CACHE[agent]
+    except (KeyError, TypeError):
+        pass
+    else:
+        _cache_hits += 1
+        return cached
+
+    _cache_misses += 1
+    try:
+        verdict = _detect_agent_type_uncached(agent)
+    except Exception as e:
+        # Misbehaving proxies can raise from attribute probes; keep the
+        # steady-state error path cheap and only pay for a traceback
+        # when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("agent-type detect failed: %r", e, exc_info=True)
+        else:
+            logger.warning("agent-type detect failed: %s", e)
+        return AgentType.LEGACY
+    try:
+        _TYPE_CACHE[agent] = verdict
+    except TypeError:
+        # Agent isn't weak-referenceable (e.g. __slots__ without
+        # __weakref__); detection stays uncached for it
+        pass
+    return verdict
+
+
+def clear_detection_cache() -> None:
+    """Drop all cached detection verdicts (e.g. after hot-swapping agents)."""
+    _TYPE_CACHE.clear()
+    _CLASS_VERDICT.clear()
+
+
+def get_cache_info() -> Dict[str, int]:
+    """Return detection-cache statistics: hits, misses and current size."""
+    return {
+        'hits': _cache_hits,
+        'misses': _cache_misses,
+        'size': len(_TYPE_CACHE),
+    }
+
+
+# Class-level verdicts for classes whose name alone settles detection;
+# None marks classes that need per-instance inspection
+_CLASS_VERDICT: Dict[type, Optional[AgentType]] = {}
 
-    # Check class name
-    if 'SDK' in agent.__class__.__name__:
-        logger.debug(f"Detected SDK agent (class name): {agent.name}")
+
+def _classify_class(cls: type) -> Optional[AgentType]:
+    """Classify by class alone, or None when the class is inconclusive.
+
+    Builds a single casefolded probe from the class name and module so
+    one scan covers both (e.g. CodeActAgentSDK, loc_agent_sdk); the
+    '|' separator lets a name-final 'sdk' match via 'sdk|'.
+    """
+    probe = f"{cls.__name__}|{cls.__module__}".casefold()
+    if (
+        probe.endswith("sdk")
+        or "sdk|" in probe
+        or "_sdk" in probe
+        or "sdk." in probe
+    ):
+        return AgentType.SDK
+    return None
+
+
+def _detect_agent_type_uncached(agent: Agent) -> AgentType:
+    """Run the actual detection checks; see detect_agent_type."""
+    # Class-determined verdicts (e.g. 'SDK' in the class name) are
+    # shared across all instances of that class
+    cls = type(agent)
+    try:
+        class_verdict = _CLASS_VERDICT[cls]
+    except KeyError:
+        class_verdict = _CLASS_VERDICT[cls] = _classify_class(cls)
+    if class_verdict is not None:
+        logger.debug(f"Detected {class_verdict.value} agent (class): {agent.name}")
+        return class_verdict
+
+    # Check for ClaudeSDKAdapter attribute (instance-level; adapters can
+    # be attached to otherwise unremarkable classes)
+    adapter = getattr(agent, 'adapter', None)
+    if adapter is not None and isinstance(adapter, ClaudeSDKAdapter):
+        logger.debug(f"Detected SDK agent (has ClaudeSDKAdapter): {agent.name}")
         return AgentType.SDK
 
     # Check for legacy LLM attribute
@@ -126,6 +219,26 @@ class OrchestratorAdapter:
         config: OpenHands configuration
     """
 
+    # Fixed attribute set; skipping the per-instance __dict__ shrinks
+    # adapters (one can be created per task) and speeds attribute access
+    __slots__ = (
+        'config',
+        'event_stream',
+        'workspace',
+        '_workspace_str',
+        'conversation_stats',
+        'agent',
+        'controller',
+        'orchestrator',
+        'agent_type',
+        'state',
+        '_user_progress_callback',
+        '_user_cb_is_async',
+        '_progress_queue',
+        '_drain_task',
+        'state_changed',
+    )
+
     def __init__(
         self,
         config: OpenHandsConfig,
@@ -152,7 +265,9 @@ class OrchestratorAdapter:
         """
         self.config = config
         self.event_stream = event_stream
+        # Resolve (and stat) the workspace once; reuse the string form
         self.workspace = Path(workspace).resolve()
+        self._workspace_str = str(self.workspace)
         self.conversation_stats = conversation_stats
         self.agent = agent
         self.controller: Optional[AgentController] = None
@@ -167,17 +282,21 @@ class OrchestratorAdapter:
             self.agent_type = AgentType.SDK
             logger.info("No agent provided, defaulting to SDK type")
 
-        # Get API key from config if not provided
+        # Get API key from config if not provided (EAFP: the attribute
+        # almost always exists, so try/except beats getattr-with-default)
         if api_key is None:
-            api_key = getattr(config.llm, 'api_key', None)
-            if api_key is None and self.agent_type == AgentType.SDK:
-                raise ValueError("API key must be provided or set in config for SDK agents")
+            try:
+                api_key = config.llm.api_key
+            except AttributeError:
+                api_key = None
+        if api_key is None and self.agent_type == AgentType.SDK:
+            raise ValueError("API key must be provided or set in config for SDK agents")
 
         # Initialize appropriate executor based on agent type
         if self.agent_type == AgentType.SDK:
             logger.info("Initializing SDK execution path (TaskOrchestrator)")
             self.orchestrator = TaskOrchestrator(
-                workspace=str(self.workspace),
+                workspace=self._workspace_str,
                 api_key=api_key or "",
                 max_retries=max_retries,
                 progress_callback=self._handle_progress
@@ -216,8 +335,23 @@ class OrchestratorAdapter:
         if hasattr(self.state, 'agent_type'):
             self.state.agent_type = self.agent_type.value
 
-        # Store callback
+        # Store callback; resolve its sync/async kind once instead of
+        # re-introspecting with iscoroutinefunction on every tick
         self._user_progress_callback = progress_callback
+        self._user_cb_is_async = (
+            asyncio.iscoroutinefunction(progress_callback)
+            if progress_callback
+            else False
+        )
+
+        # Set whenever agent_state changes; lets run loops wait on real
+        # transitions instead of polling.
+        self.state_changed = asyncio.Event()
+
+        # Coalescing progress queue; created lazily on the first tick so
+        # construction doesn't require a running event loop
+        self._progress_queue: Optional[asyncio.Queue] = None
+        self._drain_task: Optional[asyncio.Task] = None
 
         logger.info(
             f"OrchestratorAdapter initialized for workspace: {self.workspace}, "
@@ -242,11 +376,18 @@ class OrchestratorAdapter:
         Returns:
             OrchestratorAdapter instance
         """
+        # __slots__: every slot must be assigned explicitly, otherwise
+        # later attribute access raises AttributeError
         adapter = cls.__new__(cls)
         adapter.orchestrator = orchestrator
         adapter.event_stream = event_stream
         adapter.config = config
+        adapter.agent = None
+        adapter.controller = None
+        adapter.conversation_stats = None
+        adapter.agent_type = AgentType.SDK
         adapter.workspace = orchestrator.workspace
+        adapter._workspace_str = str(adapter.workspace)
         adapter.state = State(
             inputs={},
             iteration=0,
@@ -254,40 +395,87 @@ class OrchestratorAdapter:
         )
         adapter.state.agent_state = AgentState.INIT
         adapter._user_progress_callback = None
+        adapter._user_cb_is_async = False
+        adapter._progress_queue = None
+        adapter._drain_task = None
+        adapter.state_changed = asyncio.Event()
 
         logger.info("OrchestratorAdapter created from existing TaskOrchestrator")
         return adapter
 
-    async def _handle_progress(self, message: str, metadata: Dict[str, Any]):
+    async def _handle_progress(
+        self, message: str, metadata: Union[Dict[str, Any], Progress]
+    ):
         """
         Internal progress handler that bridges to OpenHands event system.
 
         Args:
             message: Progress message
-            metadata: Progress metadata
+            metadata: Progress object from TaskOrchestrator, or a plain
+                metadata dict from older callers
         """
-        # Update state
-        self.state.iteration = metadata.get('iteration', self.state.iteration)
-
-        # Publish to event stream
-        if self.event_stream:
-            # Create a MessageAction for progress updates
-            progress_action = MessageAction(
-                content=message,
-                source=EventSource.AGENT
-            )
-            self.event_stream.add_event(progress_action, EventSource.AGENT)
-
-        # Call user callback if provided
+        # Update state; slot attribute access on the structured path,
+        # dict probe only for legacy dict callers
+        if isinstance(metadata, Progress):
+            self.state.iteration = metadata.iteration
+        else:
+            self.state.iteration = metadata.get('iteration', self.state.iteration)
+
+        # Publish to event stream; skip the queueing entirely when
+        # nobody is listening. Messages are coalesced by a background
+        # drain task so N progress ticks become ~N/32 event-bus writes.
+        if self.event_stream and self.event_stream.has_subscribers():
+            if self._progress_queue is None:
+                self._progress_queue = asyncio.Queue()
+                self._drain_task = asyncio.create_task(self._drain_progress())
+            self._progress_queue.put_nowait(message)
+
+        # Call user callback if provided (kind resolved at assignment)
         if self._user_progress_callback:
             try:
-                if asyncio.iscoroutinefunction(self._user_progress_callback):
+                if self._user_cb_is_async:
                     await self._user_progress_callback(message, metadata)
                 else:
                     self._user_progress_callback(message, metadata)
             except Exception as e:
                 logger.error(f"User progress callback error: {e}")
 
+    def set_progress_callback(self, progress_callback: Optional[Callable]) -> None:
+        """
+        Swap the user progress callback, re-resolving its sync/async kind.
+
+        Args:
+            progress_callback: New callback, or None to clear
+        """
+        self._user_progress_callback = progress_callback
+        self._user_cb_is_async = (
+            asyncio.iscoroutinefunction(progress_callback)
+            if progress_callback
+            else False
+        )
+
+    async def _drain_progress(self) -> None:
+        """
+        Drain the progress queue, coalescing messages into batched writes.
+
+        Flushes every 50ms or 32 messages, whichever comes first, so a
+        tight progress loop serializes on the event stream once per
+        batch instead of once per tick.
+        """
+        queue = self._progress_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < 32:
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=0.05))
+                except asyncio.TimeoutError:
+                    break
+            progress_action = MessageAction(
+                content='\n'.join(batch),
+                source=_SRC_AGENT
+            )
+            self.event_stream.add_event(progress_action, _SRC_AGENT)
+
     async def run(
         self,
         task: str,
@@ -313,11 +501,16 @@ class OrchestratorAdapter:
         # Update state
         self.state.agent_state = AgentState.RUNNING
         self.state.iteration = 0
+        self.state_changed.set()
 
         # Publish initial message
         initial_action = MessageAction(content=task, source=EventSource.USER)
         self.event_stream.add_event(initial_action, EventSource.USER)
 
+        # Terminal state is accumulated locally and written to the State
+        # model exactly once at the bottom; each branch is symmetric
+        final_state = AgentState.RUNNING
+
         try:
             # Execute task through orchestrator
             result = await self.orchestrator.execute_simple_task(
@@ -327,7 +520,7 @@ class OrchestratorAdapter:
 
             # Update state based on result
             if result.status == TaskStatus.COMPLETED:
-                self.state.agent_state = AgentState.FINISHED
+                final_state = AgentState.FINISHED
 
                 # Add finish action
                 finish_action = AgentFinishAction(
@@ -336,31 +529,34 @@ class OrchestratorAdapter:
                 self.event_stream.add_event(finish_action, EventSource.AGENT)
 
             elif result.status == TaskStatus.FAILED:
-                self.state.agent_state = AgentState.ERROR
+                final_state = AgentState.ERROR
                 self.state.last_error = result.error
 
                 # Add error observation
-                from openhands.events.observation import ErrorObservation
                 error_obs = ErrorObservation(content=result.error or "Unknown error")
                 self.event_stream.add_event(error_obs, EventSource.AGENT)
 
-            # Update metrics
-            self.state.iteration = result.metadata.get('iterations', 1)
+            # Update metrics (attribute access, no metadata dict probe)
+            self.state.iteration = result.iterations
 
         except Exception as e:
             logger.error(f"Task execution failed: {e}")
-            self.state.agent_state = AgentState.ERROR
+            final_state = AgentState.ERROR
             self.state.last_error = str(e)
 
             # Add error observation
-            from openhands.events.observation import ErrorObservation
             error_obs = ErrorObservation(content=str(e))
             self.event_stream.add_event(error_obs, EventSource.AGENT)
 
-        # Add state changed observation
+        # Single terminal write + state changed observation. add_event is
+        # synchronous and hands events to the stream's background queue
+        # thread, so the publishes here don't block on subscriber dispatch
+        # and need no concurrent scheduling.
+        self.state.agent_state = final_state
+        self.state_changed.set()
         state_obs = AgentStateChangedObservation(
             content="",
-            agent_state=self.state.agent_state
+            agent_state=final_state
         )
         self.event_stream.add_event(state_obs, EventSource.AGENT)
 
@@ -391,10 +587,11 @@ class OrchestratorAdapter:
         # Update state
         self.state.agent_state = AgentState.RUNNING
         self.state.iteration = 0
+        self.state_changed.set()
 
         # Use workspace as repo_path if not provided
         if repo_path is None:
-            repo_path = str(self.workspace)
+            repo_path = self._workspace_str
 
         try:
             # Execute GitHub issue workflow
@@ -416,7 +613,6 @@ class OrchestratorAdapter:
                 self.state.agent_state = AgentState.ERROR
                 self.state.last_error = result.error
 
-                from openhands.events.observation import ErrorObservation
                 error_obs = ErrorObservation(content=result.error or "Unknown error")
                 self.event_stream.add_event(error_obs, EventSource.AGENT)
 
@@ -425,6 +621,7 @@ class OrchestratorAdapter:
             self.state.agent_state = AgentState.ERROR
             self.state.last_error = str(e)
 
+        self.state_changed.set()
         return self.state
 
     async def __aenter__(self):
@@ -436,9 +633,14 @@ class OrchestratorAdapter:
         """Async context manager exit."""
         if self.orchestrator:
             await self.orchestrator.__aexit__(exc_type, exc_val, exc_tb)
+        self.close()
 
     def close(self):
         """Close the adapter and cleanup resources."""
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            self._drain_task = None
+            self._progress_queue = None
         if self.controller:
             self.controller.close()
         # TaskOrchestrator cleanup is handled by context manager
@@ -33,7 +33,12 @@ Usage:
 """
 
 import asyncio
+import atexit
+import logging
+import threading
+import time
 import traceback
+from collections import deque
 from typing import TYPE_CHECKING, Optional, Dict, Any
 
 from openhands.core.logger import openhands_logger as logger
@@ -41,11 +46,8 @@ from openhands.core.schema import AgentState
 from openhands.core.exceptions import (
     AgentStuckInLoopError,
     LLMNoActionError,
-    LLMMalformedActionError,
-    LLMResponseError,
     LLMContextWindowExceedError,
-    FunctionCallValidationError,
-    FunctionCallNotExistsError,
+    LLMRecoverableError,
 )
 from openhands.controller.stuck import StuckDetector
 from openhands.events.action import Action, NullAction
@@ -58,6 +60,37 @@ if TYPE_CHECKING:
     from openhands.events.stream import EventStream
 
 
+# nest_asyncio.apply() monkeypatches asyncio globally, so it only needs to
+# run once per process. run_async is called on every SDK step; remembering
+# the application here keeps the import machinery and re-patching out of
+# the hot path.
+_NEST_ASYNCIO_APPLIED = False
+
+# Sentinel for "no pending action". Checking identity against this avoids
+# truthiness dispatch (and any Action __bool__) on every step.
+_NO_PENDING = object()
+
+# CondensationRequestAction is imported lazily to avoid a circular import;
+# cache the class after the first context-window error so repeated errors
+# skip the import machinery.
+_CondensationRequestAction = None
+
+# Long-lived event loop per thread for the no-running-loop path.
+# asyncio.run() builds and tears down a fresh loop (selector, executor,
+# signal handlers) on every call, which dominates execute_step's non-LLM
+# overhead in a tight stepping loop; reusing one loop amortizes that.
+_thread_loops = threading.local()
+
+
+def _get_thread_loop() -> asyncio.AbstractEventLoop:
+    loop = getattr(_thread_loops, 'loop', None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _thread_loops.loop = loop
+        atexit.register(loop.close)
+    return loop
+
+
 def run_async(coro):
     """
     Run async function in sync context.
@@ -75,26 +108,30 @@ def run_async(coro):
     Raises:
         Any exception raised by the coroutine
     """
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = None
-
-    if loop and loop.is_running():
-        # Already in async context, need nest_asyncio
-        try:
-            import nest_asyncio
+    global _NEST_ASYNCIO_APPLIED
+
+    # C-accelerated probe that returns None instead of raising RuntimeError
+    # when no loop is running (get_running_loop is a thin raising wrapper
+    # around this).
+    loop = asyncio._get_running_loop()
+
+    if loop is not None:
+        # Already in async context, need nest_asyncio (applied once)
+        if not _NEST_ASYNCIO_APPLIED:
+            try:
+                import nest_asyncio
+            except ImportError:
+                logger.error("nest_asyncio not available, cannot run async in nested context")
+                raise RuntimeError(
+                    "Cannot run async coroutine in nested async context without nest_asyncio. "
+                    "Install with: pip install nest-asyncio"
+                )
             nest_asyncio.apply()
-            return loop.run_until_complete(coro)
-        except ImportError:
-            logger.error("nest_asyncio not available, cannot run async in nested context")
-            raise RuntimeError(
-                "Cannot run async coroutine in nested async context without nest_asyncio. "
-                "Install with: pip install nest-asyncio"
-            )
-    else:
-        # Create new event loop
-        return asyncio.run(coro)
+            _NEST_ASYNCIO_APPLIED = True
+        return loop.run_until_complete(coro)
+
+    # Reuse this thread's long-lived loop instead of asyncio.run()
+    return _get_thread_loop().run_until_complete(coro)
 
 
 class SDKExecutor:
@@ -119,6 +156,26 @@ class SDKExecutor:
     execution and legacy agent execution.
     """
 
+    # Orchestrators create one executor per delegate/subagent; slots keep
+    # per-instance memory down and make attribute access an offset load
+    # instead of a dict probe
+    __slots__ = (
+        'agent',
+        'state',
+        'event_stream',
+        'headless_mode',
+        'confirmation_mode',
+        'stuck_detector',
+        '_pending_action',
+        '_agent_cls_name',
+        '_agent_step',
+        '_enable_condensation',
+        '_last_tail_hash',
+        '_last_stuck_result',
+        '_error_buffer',
+        '_last_error_flush',
+    )
+
     def __init__(
         self,
         agent: 'Agent',
@@ -146,8 +203,29 @@ class SDKExecutor:
         # Initialize stuck detector
         self.stuck_detector = StuckDetector(state)
 
+        # Prefilter for stuck detection: remember the history tail the
+        # detector last saw so repeat checks against an unchanged history
+        # skip the full sequence analysis
+        self._last_tail_hash = 0
+        self._last_stuck_result = False
+
+        # Bounded buffer for error observations. Under error storms each
+        # add_event serializes, persists, and fans out; buffering lets a
+        # burst coalesce into a single event. Flushed on size/time
+        # thresholds and forced on step return / ERROR transitions.
+        self._error_buffer: deque = deque(maxlen=32)
+        self._last_error_flush = time.monotonic()
+
         # Track pending action (waiting for observation)
-        self._pending_action: Optional[Action] = None
+        self._pending_action: Any = _NO_PENDING
+
+        # The agent's class, step method, and config are fixed for the
+        # executor's lifetime; resolve them once instead of per step/error
+        self._agent_cls_name = type(agent).__name__
+        self._agent_step = agent.step
+        self._enable_condensation = bool(
+            getattr(getattr(agent, 'config', None), 'enable_history_truncation', False)
+        )
 
         # Validate that agent has adapter
         if not hasattr(agent, 'adapter'):
@@ -157,8 +235,8 @@ class SDKExecutor:
             )
 
         logger.info(
-            f"SDKExecutor initialized for {agent.__class__.__name__}",
-            extra={'agent_type': agent.__class__.__name__}
+            f"SDKExecutor initialized for {self._agent_cls_name}",
+            extra={'agent_type': self._agent_cls_name}
         )
 
     def execute_step(self) -> Action:
@@ -186,16 +264,21 @@ class SDKExecutor:
             - Validation errors: Logged and returns NullAction
             - Unexpected errors: Logged with stack trace, returns NullAction
         """
+        # Bind hot attributes once; execute_step runs thousands of times
+        # in a tight stepping loop
+        state = self.state
+
         # Step 1: Validate state before execution
         if not self._validate_pre_step():
             return NullAction()
 
-        logger.debug(
-            f"Executing SDK step - Delegate Level: {self.state.delegate_level}, "
-            f"Local Step: {self.state.get_local_step()}, "
-            f"Global Step: {self.state.iteration_flag.current_value}",
-            extra={'msg_type': 'SDK_STEP'}
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Executing SDK step - Delegate Level: {state.delegate_level}, "
+                f"Local Step: {state.get_local_step()}, "
+                f"Global Step: {state.iteration_flag.current_value}",
+                extra={'msg_type': 'SDK_STEP'}
+            )
 
         # Step 2: Check for stuck condition
         if self._is_stuck():
@@ -211,7 +294,7 @@ class SDKExecutor:
 
         try:
             # Call agent.step(state) - SDK agents handle async internally
-            action = self.agent.step(self.state)
+            action = self._agent_step(state)
 
             if action is None:
                 raise LLMNoActionError('No action was returned from SDK agent')
@@ -219,24 +302,22 @@ class SDKExecutor:
             # Mark action source
             action._source = EventSource.AGENT  # type: ignore [attr-defined]
 
-            logger.info(
-                f"SDK agent returned action: {action.__class__.__name__}",
-                extra={'action_type': action.__class__.__name__}
-            )
+            if logger.isEnabledFor(logging.INFO):
+                action_type = type(action).__name__
+                logger.info(
+                    f"SDK agent returned action: {action_type}",
+                    extra={'action_type': action_type}
+                )
 
-        except (
-            LLMMalformedActionError,
-            LLMNoActionError,
-            LLMResponseError,
-            FunctionCallValidationError,
-            FunctionCallNotExistsError,
-        ) as e:
-            # These are LLM-level errors that should be sent back to the agent
+        except LLMRecoverableError as e:
+            # LLM-level errors that should be sent back to the agent;
+            # the shared base makes this a single isinstance check
             logger.warning(
                 f"LLM error during SDK step: {e}",
                 extra={'error_type': type(e).__name__}
             )
             self._emit_error_observation(str(e))
+            self._flush_error_buffer()
             return NullAction()
 
         except LLMContextWindowExceedError as e:
@@ -249,22 +330,18 @@ class SDKExecutor:
             return NullAction()
 
         except Exception as e:
-            # Unexpected error - log and convert to ErrorObservation
-            logger.error(
-                f"Unexpected error during SDK step execution: {e}",
-                exc_info=True,
-                extra={'error_type': type(e).__name__}
-            )
+            # Unexpected error - handler logs (with stack trace) and
+            # converts to ErrorObservation
             self._handle_unexpected_error(e)
             return NullAction()
 
-        # Step 5: Validate action
-        if not self._validate_action(action):
-            logger.warning(
-                f"Action validation failed for {action.__class__.__name__}",
-                extra={'action_type': action.__class__.__name__}
-            )
-            return NullAction()
+        # Step 5: Validate action. The None case already raised
+        # LLMNoActionError above and SDK agents return Action subclasses
+        # on the happy path, so this is a debug-only guard that compiles
+        # out under python -O.
+        assert isinstance(action, Action), (
+            f"Invalid action type: {type(action)}. Expected Action instance."
+        )
 
         # Step 6: Update state metadata
         self._update_state_metadata(action)
@@ -290,8 +367,8 @@ class SDKExecutor:
             )
             return False
 
-        # Check for pending action
-        if self._pending_action:
+        # Check for pending action (single pointer comparison)
+        if self._pending_action is not _NO_PENDING:
             action_id = getattr(self._pending_action, 'id', 'unknown')
             action_type = type(self._pending_action).__name__
             logger.debug(
@@ -313,7 +390,19 @@ class SDKExecutor:
             True if stuck, False otherwise
         """
         try:
+            # Only re-run the full detector when the history tail has
+            # actually changed; repeat calls within the same idle/retry
+            # loop collapse to a tuple hash comparison
+            history = self.state.history
+            tail_hash = hash(
+                (len(history), id(history[-1])) if history else (0, 0)
+            )
+            if tail_hash == self._last_tail_hash and not self._last_stuck_result:
+                return False
+
             is_stuck = self.stuck_detector.is_stuck(headless_mode=self.headless_mode)
+            self._last_tail_hash = tail_hash
+            self._last_stuck_result = is_stuck
 
             if is_stuck:
                 logger.warning(
@@ -355,35 +444,6 @@ class SDKExecutor:
             self._handle_control_flag_error(e)
             return False
 
-    def _validate_action(self, action: Action) -> bool:
-        """
-        Validate action after step execution.
-
-        Checks:
-        - Action is not None
-        - Action is an Action instance
-        - Action has required attributes
-
-        Args:
-            action: Action to validate
-
-        Returns:
-            True if action is valid, False otherwise
-        """
-        if action is None:
-            logger.error("Action is None after SDK step")
-            return False
-
-        if not isinstance(action, Action):
-            logger.error(
-                f"Invalid action type: {type(action)}. Expected Action instance.",
-                extra={'action_type': type(action).__name__}
-            )
-            return False
-
-        # Action is valid
-        return True
-
     def _update_state_metadata(self, action: Action) -> None:
         """
         Update state metadata after successful step.
@@ -397,25 +457,21 @@ class SDKExecutor:
         Args:
             action: Action that was executed
         """
-        # Update SDK metadata if state has it
-        if hasattr(self.state, 'sdk_metadata'):
-            if not isinstance(self.state.sdk_metadata, dict):
-                self.state.sdk_metadata = {}
+        # Resolve the attribute once; states without the field (old
+        # pickles) resolve to None just like unset metadata does
+        meta = getattr(self.state, 'sdk_metadata', None)
+        if meta is None:
+            meta = self.state.sdk_metadata = {}
 
-            # Track step count
-            step_count = self.state.sdk_metadata.get('step_count', 0)
-            self.state.sdk_metadata['step_count'] = step_count + 1
+        meta['step_count'] = meta.get('step_count', 0) + 1
+        meta['last_action_type'] = type(action).__name__
+        meta['agent_type'] = self._agent_cls_name
 
-            # Track last action type
-            self.state.sdk_metadata['last_action_type'] = action.__class__.__name__
-
-            # Track agent type
-            self.state.sdk_metadata['agent_type'] = self.agent.__class__.__name__
-
-        logger.debug(
-            f"Updated state metadata after SDK step",
-            extra={'step_count': self.state.sdk_metadata.get('step_count') if hasattr(self.state, 'sdk_metadata') else 0}
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Updated state metadata after SDK step",
+                extra={'step_count': meta['step_count']}
+            )
 
     def _handle_stuck_error(self) -> None:
         """
@@ -430,6 +486,7 @@ class SDKExecutor:
         self.state.last_error = error_msg
 
         self._emit_error_observation(error_msg)
+        self._flush_error_buffer()
 
     def _handle_control_flag_error(self, error: Exception) -> None:
         """
@@ -447,6 +504,7 @@ class SDKExecutor:
         self.state.last_error = error_msg
 
         self._emit_error_observation(error_msg)
+        self._flush_error_buffer()
 
     def _handle_context_window_error(self, error: LLMContextWindowExceedError) -> None:
         """
@@ -459,20 +517,22 @@ class SDKExecutor:
         """
         error_msg = str(error)
 
-        # Check if condensation is enabled
-        enable_condensation = getattr(self.agent.config, 'enable_history_truncation', False)
-
-        if enable_condensation:
+        # Condensation setting was resolved once in __init__
+        if self._enable_condensation:
             logger.warning(
                 "Context window exceeded, requesting condensation",
                 extra={'msg_type': 'SDK_CONTEXT_WINDOW_CONDENSATION'}
             )
-            # Import here to avoid circular dependency
-            from openhands.events.action import CondensationRequestAction
+            # Lazy import to avoid circular dependency; cached after the
+            # first use
+            global _CondensationRequestAction
+            if _CondensationRequestAction is None:
+                from openhands.events.action import CondensationRequestAction
+                _CondensationRequestAction = CondensationRequestAction
 
             # Emit condensation request
             self.event_stream.add_event(
-                CondensationRequestAction(),
+                _CondensationRequestAction(),
                 EventSource.AGENT
             )
         else:
@@ -483,6 +543,7 @@ class SDKExecutor:
             self.state.agent_state = AgentState.ERROR
             self.state.last_error = error_msg
             self._emit_error_observation(error_msg)
+            self._flush_error_buffer()
 
     def _handle_unexpected_error(self, error: Exception) -> None:
         """
@@ -494,25 +555,61 @@ class SDKExecutor:
             error: The unexpected exception
         """
         error_msg = f"Unexpected error in SDK step: {str(error)}"
-        stack_trace = traceback.format_exc()
 
-        logger.error(
-            f"{error_msg}\n{stack_trace}",
-            extra={'msg_type': 'SDK_UNEXPECTED_ERROR', 'error_type': type(error).__name__}
-        )
+        # Format the traceback once and reuse it for both the log record
+        # and the observation; skip frame walking entirely when ERROR
+        # records are filtered out.
+        if logger.isEnabledFor(logging.ERROR):
+            stack_trace = traceback.format_exc()
+            logger.error(
+                f"{error_msg}\n{stack_trace}",
+                extra={'msg_type': 'SDK_UNEXPECTED_ERROR', 'error_type': type(error).__name__}
+            )
+        else:
+            stack_trace = ''
 
         self.state.agent_state = AgentState.ERROR
         self.state.last_error = error_msg
 
         self._emit_error_observation(f"{error_msg}\n\nStack trace:\n{stack_trace[:500]}")
+        self._flush_error_buffer()
 
     def _emit_error_observation(self, content: str) -> None:
         """
-        Emit an error observation to the event stream.
+        Queue an error observation for the event stream.
+
+        Errors are buffered and coalesced so that a burst (context window
+        retries, malformed-action storms) becomes one event-stream write
+        instead of one per error.
 
         Args:
             content: Error message content
         """
+        self._error_buffer.append(content)
+        self._maybe_flush_errors()
+
+    def _maybe_flush_errors(self) -> None:
+        """Flush buffered errors when the size or age threshold is hit."""
+        if (
+            len(self._error_buffer) >= 8
+            or time.monotonic() - self._last_error_flush >= 0.05
+        ):
+            self._flush_error_buffer()
+
+    def _flush_error_buffer(self) -> None:
+        """
+        Emit all buffered errors as a single ErrorObservation.
+
+        No-op when the buffer is empty. Called on thresholds, on step
+        return after a recoverable error, and on ERROR state transitions.
+        """
+        self._last_error_flush = time.monotonic()
+        if not self._error_buffer:
+            return
+
+        content = '\n\n'.join(self._error_buffer)
+        self._error_buffer.clear()
+
         try:
             self.event_stream.add_event(
                 ErrorObservation(content=content),
@@ -535,15 +632,15 @@ class SDKExecutor:
         Args:
             action: Action to set as pending, or None to clear
         """
-        self._pending_action = action
-
-        if action:
+        if action is None:
+            self._pending_action = _NO_PENDING
+            logger.debug("Cleared pending action")
+        else:
+            self._pending_action = action
             logger.debug(
                 f"Set pending action: {action.__class__.__name__}",
                 extra={'action_type': action.__class__.__name__}
             )
-        else:
-            logger.debug("Cleared pending action")
 
     def get_state(self) -> 'State':
         """
@@ -561,5 +658,7 @@ class SDKExecutor:
         Clears pending action and resets stuck detector.
         """
         logger.debug("Resetting SDKExecutor")
-        self._pending_action = None
+        self._pending_action = _NO_PENDING
         self.stuck_detector = StuckDetector(self.state)
+        self._last_tail_hash = 0
+        self._last_stuck_result = False
@@ -302,6 +302,18 @@ class State:
                 return event
         return None
 
+    def get_last_user_text_raw(self) -> str | None:
+        """Return the last user message's raw content, or None.
+
+        Cheap variant of get_last_user_message for literal checks (e.g.
+        '/exit'): scans the raw history backwards instead of
+        materializing a View first.
+        """
+        for event in reversed(self.history):
+            if isinstance(event, MessageAction) and event.source == EventSource.USER:
+                return event.content
+        return None
+
     def to_llm_metadata(self, model_name: str, agent_name: str) -> dict:
         metadata = {
             'session_id': self.session_id,
@@ -51,6 +51,8 @@ class AgentConfig(BaseModel):
     """Whether to enable SoM (Set of Marks) visual browsing."""
     enable_plan_mode: bool = Field(default=True)
     """Whether to enable plan mode, which uses the long horizon system message and add the new tool - task_tracker - for planning, tracking and executing complex tasks."""
+    verbose_prompt: bool = Field(default=False)
+    """Whether to include verbose worked examples in agents' system prompts. Off by default to keep token cost down; mainly useful for agent evaluation."""
     condenser: CondenserConfig = Field(
         # The default condenser is set to the conversation window condenser -- if
         # we use NoOp and the conversation hits the LLM context length limit,
@@ -61,9 +61,16 @@ class TaskInvalidStateError(Exception):
 # ============================================
 
 
+# Common base for LLM-level errors that get sent back to the agent and
+# retried rather than aborting the run. Lets hot except clauses match one
+# class instead of scanning a five-way tuple.
+class LLMRecoverableError(Exception):
+    pass
+
+
 # This exception gets sent back to the LLM
 # It might be malformed JSON
-class LLMMalformedActionError(Exception):
+class LLMMalformedActionError(LLMRecoverableError):
     def __init__(self, message: str = 'Malformed response') -> None:
         self.message = message
         super().__init__(message)
@@ -74,14 +81,14 @@ class LLMMalformedActionError(Exception):
 
 # This exception gets sent back to the LLM
 # For some reason, the agent did not return an action
-class LLMNoActionError(Exception):
+class LLMNoActionError(LLMRecoverableError):
     def __init__(self, message: str = 'Agent must return an action') -> None:
         super().__init__(message)
 
 
 # This exception gets sent back to the LLM
 # The LLM output did not include an action, or the action was not the expected type
-class LLMResponseError(Exception):
+class LLMResponseError(LLMRecoverableError):
     def __init__(
         self, message: str = 'Failed to retrieve action from LLM response'
     ) -> None:
@@ -133,7 +140,7 @@ class FunctionCallConversionError(Exception):
         super().__init__(message)
 
 
-class FunctionCallValidationError(Exception):
+class FunctionCallValidationError(LLMRecoverableError):
     """Exception raised when FunctionCallingConverter failed to validate a function call message.
 
     This typically happens when the LLM outputs unrecognized function call / parameter names / values.
@@ -143,7 +150,7 @@ class FunctionCallValidationError(Exception):
         super().__init__(message)
 
 
-class FunctionCallNotExistsError(Exception):
+class FunctionCallNotExistsError(LLMRecoverableError):
     """Exception raised when an LLM call a tool that is not registered."""
 
     def __init__(self, message: str) -> None:
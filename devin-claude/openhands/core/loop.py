@@ -9,6 +9,11 @@ from openhands.memory.memory import Memory
 from openhands.runtime.base import Runtime
 from openhands.runtime.runtime_status import RuntimeStatus
 
+# Watchdog timeout for the state-change wait. The loop wakes on every real
+# transition via the controller's state_changed event; this only bounds how
+# long we go between defensive re-checks if a transition is ever missed.
+_STATE_CHANGE_WATCHDOG = 30.0
+
 
 async def run_agent_until_done(
     controller: Union[AgentController, OrchestratorAdapter],
@@ -29,21 +34,44 @@ async def run_agent_until_done(
 
     logger.info(f"Running agent loop with {executor_type} executor")
 
+    # Captured so status_callback can schedule work on this loop even when
+    # invoked from a runtime thread.
+    main_loop = asyncio.get_running_loop()
+
+    def _on_error(runtime_status: RuntimeStatus, msg: str) -> None:
+        logger.error(msg)
+        if controller:
+            # Get state from appropriate executor
+            if is_sdk_agent:
+                state = controller.get_state()
+                if state:
+                    state.last_error = msg
+                    state.agent_state = AgentState.ERROR
+                # asyncio.Event is not thread-safe and this callback may
+                # fire from a runtime thread; wake the waiter on its loop
+                main_loop.call_soon_threadsafe(controller.state_changed.set)
+            else:
+                controller.state.last_error = msg
+                # set_agent_state_to has side effects (reset, event
+                # emission, state save) that must run on the main loop;
+                # anchoring the task there also keeps its exception from
+                # being silently dropped with an orphan task. It sets
+                # state_changed itself once the transition lands.
+                main_loop.call_soon_threadsafe(
+                    lambda: asyncio.ensure_future(
+                        controller.set_agent_state_to(AgentState.ERROR)
+                    )
+                )
+
+    def _on_info(runtime_status: RuntimeStatus, msg: str) -> None:
+        logger.info(msg)
+
+    # Dispatch on msg_type through a table; new message types get a
+    # handler entry instead of another branch in the hot conditional
+    handlers = {'error': _on_error}
+
     def status_callback(msg_type: str, runtime_status: RuntimeStatus, msg: str) -> None:
-        if msg_type == 'error':
-            logger.error(msg)
-            if controller:
-                # Get state from appropriate executor
-                if is_sdk_agent:
-                    state = controller.get_state()
-                    if state:
-                        state.last_error = msg
-                        state.agent_state = AgentState.ERROR
-                else:
-                    controller.state.last_error = msg
-                    asyncio.create_task(controller.set_agent_state_to(AgentState.ERROR))
-        else:
-            logger.info(msg)
+        handlers.get(msg_type, _on_info)(runtime_status, msg)
 
     if not skip_set_callback:
         if hasattr(runtime, 'status_callback') and runtime.status_callback:
@@ -59,7 +87,11 @@ async def run_agent_until_done(
         controller.status_callback = status_callback
         memory.status_callback = status_callback
 
-    # Main event loop - unified for both executor types
+    # Main event loop - unified for both executor types. Instead of
+    # polling every second, wait on the controller's state_changed event
+    # so we only wake on real transitions (with a watchdog timeout).
+    state_changed = controller.state_changed
+
     while True:
         # Get current state from appropriate executor
         if is_sdk_agent:
@@ -82,4 +114,11 @@ async def run_agent_until_done(
                     f"sdk_steps: {state.sdk_metadata.get('step_count', 0)}"
                 )
 
-        await asyncio.sleep(1)
+        try:
+            await asyncio.wait_for(
+                state_changed.wait(), timeout=_STATE_CHANGE_WATCHDOG
+            )
+        except asyncio.TimeoutError:
+            pass
+        else:
+            state_changed.clear()
@@ -160,6 +160,14 @@ class EventStream(EventStore):
 
         self._clean_up_subscriber(subscriber_id, callback_id)
 
+    def has_subscribers(self) -> bool:
+        """Whether any callback is currently subscribed.
+
+        Cheap probe for hot paths that want to skip building events
+        nobody will receive.
+        """
+        return any(self._subscribers.values())
+
     def add_event(self, event: Event, source: EventSource) -> None:
         if event.id != Event.INVALID_ID:
             raise ValueError(
@@ -7,6 +7,7 @@ that extend Claude Code with domain-specific tools for OpenHands.
 Available MCP Servers:
 - Jupyter MCP: Execute Python code in Jupyter kernels
 - Browser MCP: Web automation and interaction using Playwright
+- Batch MCP: Fan out several independent tool calls in one request
 
 These MCP servers enable Claude agents to perform specialized tasks
 beyond the built-in tools provided by Claude Code CLI.
@@ -14,10 +15,12 @@ beyond the built-in tools provided by Claude Code CLI.
 
 from .jupyter_mcp import create_jupyter_mcp_server, JupyterKernelManager
 from .browser_mcp import create_browser_mcp_server, BrowserManager
+from .batch_mcp import create_batch_mcp_server
 
 __all__ = [
     "create_jupyter_mcp_server",
     "JupyterKernelManager",
     "create_browser_mcp_server",
     "BrowserManager",
+    "create_batch_mcp_server",
 ]
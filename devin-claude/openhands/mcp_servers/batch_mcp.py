@@ -0,0 +1,150 @@
+"""
+Batch MCP Server for Claude Agent SDK
+
+This module provides an MCP server with a single `execute` tool that fans
+out several other MCP tool calls concurrently. When Claude needs multiple
+independent operations in one turn (e.g. screenshot + extract_content),
+batching them into one request saves a stdio JSON-RPC roundtrip per
+sub-call and overlaps their I/O waits.
+
+Tools from the other MCP servers opt in by registering themselves via
+register_batch_targets() inside their create_*_mcp_server() factory.
+
+Usage:
+    from openhands.mcp_servers.batch_mcp import create_batch_mcp_server
+
+    batch_mcp = create_batch_mcp_server()
+
+    options = ClaudeAgentOptions(
+        allowed_tools=["mcp__batch__execute", ...],
+        mcp_servers={"batch": batch_mcp}
+    )
+"""
+
+from claude_agent_sdk import tool, create_sdk_mcp_server
+import asyncio
+import json
+from typing import Any, Dict, List
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Tool name -> handler for dispatchable sub-calls, populated by the other
+# MCP server factories via register_batch_targets()
+_dispatch_table: Dict[str, Any] = {}
+
+
+def register_batch_targets(tools: List[Any]) -> None:
+    """
+    Register tools as dispatchable from batch execute.
+
+    Args:
+        tools: Decorated MCP tool objects (or plain async callables
+            taking an args dict)
+    """
+    for t in tools:
+        name = getattr(t, 'name', None) or getattr(t, '__name__', None)
+        if name:
+            _dispatch_table[name] = t
+
+
+async def _invoke(target: Any, args: Dict[str, Any]):
+    """Invoke a registered tool, unwrapping the SDK decorator if needed."""
+    handler = getattr(target, 'handler', None) or target
+    return await handler(args)
+
+
+@tool(
+    "execute",
+    "Execute several independent MCP tool calls concurrently in one request",
+    {
+        "calls": {
+            "type": "array",
+            "description": "List of {tool, args} objects to run concurrently"
+        },
+        "maxConcurrent": {
+            "type": "integer",
+            "description": "Maximum sub-calls in flight at once (default: 5)",
+            "optional": True
+        },
+        "stopOnError": {
+            "type": "boolean",
+            "description": "Skip remaining calls after the first failure (default: false)",
+            "optional": True
+        }
+    }
+)
+async def batch_execute(args):
+    """
+    Fan out several sub-calls concurrently and return all results.
+
+    Args:
+        args: Dictionary with 'calls' plus optional 'maxConcurrent' and
+            'stopOnError'
+
+    Returns:
+        MCP tool result with one entry per sub-call, in request order
+    """
+    calls = args.get("calls") or []
+    max_concurrent = int(args.get("maxConcurrent") or 5)
+    stop_on_error = bool(args.get("stopOnError"))
+
+    if not calls:
+        return {
+            "content": [{
+                "type": "text",
+                "text": "Error: No calls provided"
+            }],
+            "isError": True
+        }
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+    failed = asyncio.Event()
+
+    async def run_one(call):
+        tool_name = call.get("tool", "")
+        # Accept both short ("navigate") and full ("mcp__browser__navigate") names
+        short_name = tool_name.rsplit("__", 1)[-1]
+        target = _dispatch_table.get(short_name)
+
+        if stop_on_error and failed.is_set():
+            return {"tool": tool_name, "skipped": True}
+
+        if target is None:
+            failed.set()
+            return {"tool": tool_name, "error": f"Unknown tool: {tool_name}"}
+
+        async with semaphore:
+            try:
+                result = await _invoke(target, call.get("args") or {})
+                return {"tool": tool_name, "result": result}
+            except Exception as e:
+                failed.set()
+                return {"tool": tool_name, "error": str(e)}
+
+    results = await asyncio.gather(*[run_one(call) for call in calls])
+
+    return {
+        "content": [{
+            "type": "text",
+            "text": json.dumps(results, default=str, indent=2)
+        }],
+        "isError": any("error" in r for r in results)
+    }
+
+
+def create_batch_mcp_server():
+    """
+    Create batch MCP server.
+
+    Returns:
+        MCP server instance configured with the batch execute tool
+    """
+    logger.info("Creating Batch MCP server")
+
+    return create_sdk_mcp_server(
+        name="batch",
+        version="1.0.0",
+        tools=[batch_execute]
+    )
@@ -478,6 +478,10 @@ def create_browser_mcp_server():
     """
     logger.info("Creating Browser MCP server")
 
+    # Make these tools dispatchable from mcp__batch__execute
+    from openhands.mcp_servers.batch_mcp import register_batch_targets
+    register_batch_targets([navigate, interact, screenshot, extract_content, get_page_info])
+
     return create_sdk_mcp_server(
         name="browser",
         version="1.0.0",
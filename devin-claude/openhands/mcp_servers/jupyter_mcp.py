@@ -376,6 +376,10 @@ def create_jupyter_mcp_server():
     """
     logger.info("Creating Jupyter MCP server")
 
+    # Make these tools dispatchable from mcp__batch__execute
+    from openhands.mcp_servers.batch_mcp import register_batch_targets
+    register_batch_targets([execute_python, kernel_info, reset_kernel])
+
     return create_sdk_mcp_server(
         name="jupyter",
         version="1.0.0",
@@ -8,6 +8,7 @@ Main Components:
 - TaskOrchestrator: High-level task coordination
 - TaskResult: Task execution results
 - TaskStatus: Task status enumeration
+- Progress: Structured progress update for callbacks
 
 Usage:
     from openhands.orchestrator import TaskOrchestrator
@@ -16,6 +17,6 @@ Usage:
         result = await orch.execute_github_issue_workflow(...)
 """
 
-from .task_orchestrator import TaskOrchestrator, TaskResult, TaskStatus
+from .task_orchestrator import Progress, TaskOrchestrator, TaskResult, TaskStatus
 
-__all__ = ["TaskOrchestrator", "TaskResult", "TaskStatus"]
+__all__ = ["Progress", "TaskOrchestrator", "TaskResult", "TaskStatus"]
@@ -56,6 +56,35 @@ class TaskResult:
     messages: List[Any] = field(default_factory=list)
     error: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    iterations: int = 1
+
+
+@dataclass(slots=True)
+class Progress:
+    """
+    Structured progress update passed to progress callbacks.
+
+    Slot attribute access (``progress.iteration``) is cheaper than a dict
+    hash lookup and needs no fallback default. The dict-style accessors
+    below keep existing ``(message, metadata)`` callbacks that treat the
+    second argument as a plain dict working unchanged.
+    """
+    iteration: int
+    message: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == 'iteration':
+            return self.iteration
+        return self.metadata.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'iteration':
+            return self.iteration
+        return self.metadata[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key == 'iteration' or key in self.metadata
 
 
 class TaskOrchestrator:
@@ -109,6 +138,7 @@ class TaskOrchestrator:
         # Task tracking
         self.tasks: Dict[str, TaskResult] = {}
         self.task_counter = 0
+        self._progress_count = 0
 
         logger.info(f"TaskOrchestrator initialized for workspace: {self.workspace}")
 
@@ -119,12 +149,20 @@ class TaskOrchestrator:
 
     async def _report_progress(self, message: str, metadata: Dict = None):
         """Report progress to callback if provided."""
+        # Counted whether or not a callback is attached: the entry
+        # points reset it per task and record it as TaskResult.iterations
+        self._progress_count += 1
         if self.progress_callback:
+            progress = Progress(
+                iteration=self._progress_count,
+                message=message,
+                metadata=metadata or {}
+            )
             try:
                 if asyncio.iscoroutinefunction(self.progress_callback):
-                    await self.progress_callback(message, metadata or {})
+                    await self.progress_callback(message, progress)
                 else:
-                    self.progress_callback(message, metadata or {})
+                    self.progress_callback(message, progress)
             except Exception as e:
                 logger.error(f"Progress callback error: {e}")
 
@@ -144,6 +182,7 @@ class TaskOrchestrator:
             TaskResult with execution results
         """
         task_id = self._generate_task_id()
+        self._progress_count = 0
 
         await self._report_progress(
             f"Starting task {task_id} with {agent_type} agent",
@@ -181,6 +220,7 @@ class TaskOrchestrator:
                 {"task_id": task_id, "error": str(e)}
             )
 
+        result.iterations = self._progress_count
         self.tasks[task_id] = result
         return result
 
@@ -213,6 +253,7 @@ class TaskOrchestrator:
             TaskResult with complete workflow results
         """
         task_id = self._generate_task_id()
+        self._progress_count = 0
 
         workflow_result = TaskResult(
             task_id=task_id,
@@ -338,6 +379,7 @@ Fix all test failures.
             workflow_result.error = str(e)
             await self._report_progress(f"❌ Workflow {task_id} failed: {e}")
 
+        workflow_result.iterations = self._progress_count
         self.tasks[task_id] = workflow_result
         return workflow_result
 
@@ -363,6 +405,7 @@ Fix all test failures.
             TaskResult with complete workflow results
         """
         task_id = self._generate_task_id()
+        self._progress_count = 0
 
         await self._report_progress(f"Starting feature implementation: {task_id}")
 
@@ -454,6 +497,7 @@ Write complete test suite.
             result.error = str(e)
             await self._report_progress(f"❌ Feature implementation {task_id} failed: {e}")
 
+        result.iterations = self._progress_count
         self.tasks[task_id] = result
         return result
 
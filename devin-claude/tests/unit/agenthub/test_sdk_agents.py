@@ -185,6 +185,79 @@ class TestClaudeSDKAdapter:
         assert isinstance(action, AgentFinishAction)
 
 
+class TestAdapterRegistry:
+    """Test the shared-adapter registry's refcounting."""
+
+    def _make_config(self, **overrides):
+        from openhands.agenthub.claude_sdk_adapter import ClaudeSDKAdapterConfig
+
+        params = dict(
+            agent_type="test",
+            allowed_tools=["Read"],
+            system_prompt="Test prompt",
+            workspace_base="/test",
+        )
+        params.update(overrides)
+        return ClaudeSDKAdapterConfig(**params)
+
+    def test_acquire_shares_equivalent_configs(self):
+        """Two acquires with equivalent configs return one adapter."""
+        from openhands.agenthub.claude_sdk_adapter import AdapterRegistry
+
+        registry = AdapterRegistry()
+
+        first = registry.acquire(self._make_config())
+        second = registry.acquire(self._make_config())
+
+        assert first is second
+        assert len(registry._adapters) == 1
+
+    def test_differing_prompts_get_separate_adapters(self):
+        """Configs differing only in system prompt must not share."""
+        from openhands.agenthub.claude_sdk_adapter import AdapterRegistry
+
+        registry = AdapterRegistry()
+
+        first = registry.acquire(self._make_config(system_prompt="Persona A"))
+        second = registry.acquire(self._make_config(system_prompt="Persona B"))
+
+        assert first is not second
+        assert len(registry._adapters) == 2
+
+    def test_release_cleans_up_only_last_holder(self):
+        """cleanup() runs once, when the final holder releases."""
+        from openhands.agenthub.claude_sdk_adapter import AdapterRegistry
+
+        registry = AdapterRegistry()
+
+        adapter = registry.acquire(self._make_config())
+        assert registry.acquire(self._make_config()) is adapter
+        adapter.cleanup = AsyncMock()
+
+        registry.release(adapter, runner=asyncio.run)
+        assert not adapter.cleanup.called
+        assert len(registry._adapters) == 1
+
+        registry.release(adapter, runner=asyncio.run)
+        assert adapter.cleanup.call_count == 1
+        assert len(registry._adapters) == 0
+
+    def test_release_unmanaged_adapter_cleans_up(self):
+        """A directly constructed adapter is cleaned up immediately."""
+        from openhands.agenthub.claude_sdk_adapter import (
+            AdapterRegistry,
+            ClaudeSDKAdapter,
+        )
+
+        registry = AdapterRegistry()
+
+        adapter = ClaudeSDKAdapter(self._make_config())
+        adapter.cleanup = AsyncMock()
+
+        registry.release(adapter, runner=asyncio.run)
+        assert adapter.cleanup.call_count == 1
+
+
 class TestCodeActAgentSDK:
     """Test CodeActAgentSDK."""
 
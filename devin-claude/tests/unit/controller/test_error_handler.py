@@ -13,7 +13,11 @@ from litellm.exceptions import (
     ServiceUnavailableError,
 )
 
-from openhands.controller.error_handler import ErrorCategory, UnifiedErrorHandler
+from openhands.controller.error_handler import (
+    AgentType,
+    ErrorCategory,
+    UnifiedErrorHandler,
+)
 from openhands.core.exceptions import (
     AgentStuckInLoopError,
     FunctionCallNotExistsError,
@@ -42,43 +46,43 @@ class TestUnifiedErrorHandler:
     def test_categorize_llm_error(self):
         """Test categorization of generic LLM errors."""
         error = LLMResponseError('Failed to get response')
-        category = self.handler._categorize_error(error, 'legacy')
+        category = self.handler._categorize_error(error, AgentType.LEGACY, str(error))
         assert category == ErrorCategory.LLM_ERROR
 
         api_error = APIError('API failed')
-        category = self.handler._categorize_error(api_error, 'legacy')
+        category = self.handler._categorize_error(api_error, AgentType.LEGACY, str(api_error))
         assert category == ErrorCategory.LLM_ERROR
 
     def test_categorize_context_window_error(self):
         """Test categorization of context window errors."""
         error = ContextWindowExceededError('Context window exceeded')
-        category = self.handler._categorize_error(error, 'legacy')
+        category = self.handler._categorize_error(error, AgentType.LEGACY, str(error))
         assert category == ErrorCategory.CONTEXT_WINDOW
 
         llm_error = LLMContextWindowExceedError()
-        category = self.handler._categorize_error(llm_error, 'legacy')
+        category = self.handler._categorize_error(llm_error, AgentType.LEGACY, str(llm_error))
         assert category == ErrorCategory.CONTEXT_WINDOW
 
     def test_categorize_control_flag_error(self):
         """Test categorization of control flag errors (stuck detection)."""
         error = AgentStuckInLoopError('Agent stuck in loop')
-        category = self.handler._categorize_error(error, 'legacy')
+        category = self.handler._categorize_error(error, AgentType.LEGACY, str(error))
         assert category == ErrorCategory.STUCK_DETECTION
 
     def test_categorize_stuck_error(self):
         """Test categorization of stuck detection errors."""
         error = AgentStuckInLoopError('Agent is stuck')
-        category = self.handler._categorize_error(error, 'legacy')
+        category = self.handler._categorize_error(error, AgentType.LEGACY, str(error))
         assert category == ErrorCategory.STUCK_DETECTION
 
     def test_categorize_unexpected_error(self):
         """Test categorization of unexpected errors."""
         error = RuntimeError('Unexpected runtime error')
-        category = self.handler._categorize_error(error, 'legacy')
+        category = self.handler._categorize_error(error, AgentType.LEGACY, str(error))
         assert category == ErrorCategory.UNEXPECTED
 
         value_error = ValueError('Invalid value')
-        category = self.handler._categorize_error(value_error, 'legacy')
+        category = self.handler._categorize_error(value_error, AgentType.LEGACY, str(value_error))
         assert category == ErrorCategory.UNEXPECTED
 
     def test_create_error_observation(self):
@@ -87,7 +91,9 @@ class TestUnifiedErrorHandler:
         category = ErrorCategory.MALFORMED_ACTION
         context = {'action': 'test_action', 'step_count': 5}
 
-        observation = self.handler._create_error_observation(error, category, context)
+        observation = self.handler._create_error_observation(
+            error, category, context, type(error).__name__, str(error)
+        )
 
         assert isinstance(observation, ErrorObservation)
         assert 'MALFORMED_ACTION' in observation.content
@@ -128,7 +134,7 @@ class TestUnifiedErrorHandler:
         """Test that SDK agent errors are properly mapped."""
         # Test with SDK agent type
         error = APIError('SDK API error')
-        category = self.handler._categorize_error(error, 'sdk')
+        category = self.handler._categorize_error(error, AgentType.SDK, str(error))
         assert category == ErrorCategory.LLM_ERROR
 
         # Test all major error types with SDK
@@ -141,70 +147,70 @@ class TestUnifiedErrorHandler:
         ]
 
         for error, expected_category in test_cases:
-            category = self.handler._categorize_error(error, 'sdk')
+            category = self.handler._categorize_error(error, AgentType.SDK, str(error))
             assert category == expected_category
 
     def test_categorize_authentication_error(self):
         """Test categorization of authentication errors."""
         error = AuthenticationError('Invalid API key')
-        category = self.handler._categorize_error(error, 'legacy')
+        category = self.handler._categorize_error(error, AgentType.LEGACY, str(error))
         assert category == ErrorCategory.AUTHENTICATION
 
     def test_categorize_rate_limit_error(self):
         """Test categorization of rate limit errors."""
         error = RateLimitError('Too many requests')
-        category = self.handler._categorize_error(error, 'legacy')
+        category = self.handler._categorize_error(error, AgentType.LEGACY, str(error))
         assert category == ErrorCategory.RATE_LIMIT
 
     def test_categorize_service_unavailable_error(self):
         """Test categorization of service unavailable errors."""
         error = ServiceUnavailableError('Service down')
-        category = self.handler._categorize_error(error, 'legacy')
+        category = self.handler._categorize_error(error, AgentType.LEGACY, str(error))
         assert category == ErrorCategory.SERVICE_UNAVAILABLE
 
         conn_error = APIConnectionError('Connection failed')
-        category = self.handler._categorize_error(conn_error, 'legacy')
+        category = self.handler._categorize_error(conn_error, AgentType.LEGACY, str(conn_error))
         assert category == ErrorCategory.SERVICE_UNAVAILABLE
 
     def test_categorize_internal_server_error(self):
         """Test categorization of internal server errors."""
         error = InternalServerError('Internal error')
-        category = self.handler._categorize_error(error, 'legacy')
+        category = self.handler._categorize_error(error, AgentType.LEGACY, str(error))
         assert category == ErrorCategory.INTERNAL_SERVER
 
     def test_categorize_content_policy_error(self):
         """Test categorization of content policy violation errors."""
         error = ContentPolicyViolationError('Content blocked')
-        category = self.handler._categorize_error(error, 'legacy')
+        category = self.handler._categorize_error(error, AgentType.LEGACY, str(error))
         assert category == ErrorCategory.CONTENT_POLICY
 
         # Test BadRequestError with ContentPolicyViolationError message
         bad_request = BadRequestError(
             'BadRequestError: ContentPolicyViolationError: Blocked'
         )
-        category = self.handler._categorize_error(bad_request, 'legacy')
+        category = self.handler._categorize_error(bad_request, AgentType.LEGACY, str(bad_request))
         assert category == ErrorCategory.CONTENT_POLICY
 
     def test_categorize_malformed_action_error(self):
         """Test categorization of malformed action errors."""
         error = LLMMalformedActionError('Invalid JSON format')
-        category = self.handler._categorize_error(error, 'legacy')
+        category = self.handler._categorize_error(error, AgentType.LEGACY, str(error))
         assert category == ErrorCategory.MALFORMED_ACTION
 
     def test_categorize_no_action_error(self):
         """Test categorization of no action errors."""
         error = LLMNoActionError('Agent did not return action')
-        category = self.handler._categorize_error(error, 'legacy')
+        category = self.handler._categorize_error(error, AgentType.LEGACY, str(error))
         assert category == ErrorCategory.NO_ACTION
 
     def test_categorize_function_call_error(self):
         """Test categorization of function call errors."""
         validation_error = FunctionCallValidationError('Invalid parameters')
-        category = self.handler._categorize_error(validation_error, 'legacy')
+        category = self.handler._categorize_error(validation_error, AgentType.LEGACY, str(validation_error))
         assert category == ErrorCategory.FUNCTION_CALL_ERROR
 
         not_exists_error = FunctionCallNotExistsError('Function not found')
-        category = self.handler._categorize_error(not_exists_error, 'legacy')
+        category = self.handler._categorize_error(not_exists_error, AgentType.LEGACY, str(not_exists_error))
         assert category == ErrorCategory.FUNCTION_CALL_ERROR
 
     def test_is_recoverable(self):
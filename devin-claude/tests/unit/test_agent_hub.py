@@ -5,6 +5,8 @@ Tests agent lifecycle, configuration, task execution, and caching
 without making actual API calls.
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from pathlib import Path
@@ -53,15 +55,10 @@ class TestAgentConfig:
 class TestAgentHub:
     """Test AgentHub class."""
 
-    @patch('openhands.agent_hub.hub.create_jupyter_mcp_server')
-    @patch('openhands.agent_hub.hub.create_browser_mcp_server')
-    def test_hub_initialization(self, mock_browser, mock_jupyter, temp_workspace):
+    def test_hub_initialization(self, temp_workspace):
         """Test AgentHub initialization."""
         from openhands.agent_hub import AgentHub
 
-        mock_jupyter.return_value = Mock()
-        mock_browser.return_value = Mock()
-
         hub = AgentHub(
             workspace=str(temp_workspace),
             api_key="test-key"
@@ -77,15 +74,10 @@ class TestAgentHub:
         assert "browser" in hub.configs
         assert "python" in hub.configs
 
-    @patch('openhands.agent_hub.hub.create_jupyter_mcp_server')
-    @patch('openhands.agent_hub.hub.create_browser_mcp_server')
-    def test_agent_configs_setup(self, mock_browser, mock_jupyter, temp_workspace):
+    def test_agent_configs_setup(self, temp_workspace):
         """Test that agent configurations are set up correctly."""
         from openhands.agent_hub import AgentHub
 
-        mock_jupyter.return_value = Mock()
-        mock_browser.return_value = Mock()
-
         hub = AgentHub(
             workspace=str(temp_workspace),
             api_key="test-key"
@@ -114,17 +106,11 @@ class TestAgentHub:
         assert "Bash" in testing_config.allowed_tools
         assert testing_config.max_turns == 20
 
-    @patch('openhands.agent_hub.hub.create_jupyter_mcp_server')
-    @patch('openhands.agent_hub.hub.create_browser_mcp_server')
     @patch('openhands.agent_hub.hub.ClaudeSDKClient')
-    async def test_get_agent_creates_new(self, mock_client_class, mock_browser,
-                                         mock_jupyter, temp_workspace):
+    async def test_get_agent_creates_new(self, mock_client_class, temp_workspace):
         """Test getting an agent creates new instance."""
         from openhands.agent_hub import AgentHub
 
-        mock_jupyter.return_value = Mock()
-        mock_browser.return_value = Mock()
-
         # Setup mock client
         mock_client = AsyncMock()
         mock_client.connect = AsyncMock()
@@ -143,17 +129,11 @@ class TestAgentHub:
         assert "code" in hub.agents
         assert hub.agents["code"] == agent
 
-    @patch('openhands.agent_hub.hub.create_jupyter_mcp_server')
-    @patch('openhands.agent_hub.hub.create_browser_mcp_server')
     @patch('openhands.agent_hub.hub.ClaudeSDKClient')
-    async def test_get_agent_caching(self, mock_client_class, mock_browser,
-                                     mock_jupyter, temp_workspace):
+    async def test_get_agent_caching(self, mock_client_class, temp_workspace):
         """Test that agents are cached and reused."""
         from openhands.agent_hub import AgentHub
 
-        mock_jupyter.return_value = Mock()
-        mock_browser.return_value = Mock()
-
         # Setup mock client
         mock_client = AsyncMock()
         mock_client.connect = AsyncMock()
@@ -173,15 +153,10 @@ class TestAgentHub:
         # Connect should only be called once
         assert mock_client.connect.call_count == 1
 
-    @patch('openhands.agent_hub.hub.create_jupyter_mcp_server')
-    @patch('openhands.agent_hub.hub.create_browser_mcp_server')
-    async def test_get_agent_invalid_type(self, mock_browser, mock_jupyter, temp_workspace):
+    async def test_get_agent_invalid_type(self, temp_workspace):
         """Test getting invalid agent type raises error."""
         from openhands.agent_hub import AgentHub
 
-        mock_jupyter.return_value = Mock()
-        mock_browser.return_value = Mock()
-
         hub = AgentHub(
             workspace=str(temp_workspace),
             api_key="test-key"
@@ -190,15 +165,10 @@ class TestAgentHub:
         with pytest.raises(ValueError, match="Unknown agent type"):
             await hub.get_agent("invalid_type")
 
-    @patch('openhands.agent_hub.hub.create_jupyter_mcp_server')
-    @patch('openhands.agent_hub.hub.create_browser_mcp_server')
-    async def test_execute_task(self, mock_browser, mock_jupyter, temp_workspace):
+    async def test_execute_task(self, temp_workspace):
         """Test task execution."""
         from openhands.agent_hub import AgentHub
 
-        mock_jupyter.return_value = Mock()
-        mock_browser.return_value = Mock()
-
         # Create mock client with response
         mock_client = AsyncMock()
         mock_client.connect = AsyncMock()
@@ -224,15 +194,10 @@ class TestAgentHub:
             assert mock_client.query.called
             assert mock_client.query.call_args[0][0] == "Test task"
 
-    @patch('openhands.agent_hub.hub.create_jupyter_mcp_server')
-    @patch('openhands.agent_hub.hub.create_browser_mcp_server')
-    async def test_parallel_execute(self, mock_browser, mock_jupyter, temp_workspace):
+    async def test_parallel_execute(self, temp_workspace):
         """Test parallel task execution."""
         from openhands.agent_hub import AgentHub
 
-        mock_jupyter.return_value = Mock()
-        mock_browser.return_value = Mock()
-
         # Create mock client
         mock_client = AsyncMock()
         mock_client.connect = AsyncMock()
@@ -259,15 +224,73 @@ class TestAgentHub:
             assert len(results["code"]) >= 1
             assert len(results["analysis"]) >= 1
 
-    @patch('openhands.agent_hub.hub.create_jupyter_mcp_server')
-    @patch('openhands.agent_hub.hub.create_browser_mcp_server')
-    async def test_cleanup(self, mock_browser, mock_jupyter, temp_workspace):
+    async def test_lru_eviction_order(self, temp_workspace):
+        """Least recently used agent is evicted when the cache is full."""
+        from openhands.agent_hub import AgentHub, AgentPoolConfig
+
+        with patch(
+            'openhands.agent_hub.hub.ClaudeSDKClient',
+            side_effect=lambda **kwargs: AsyncMock(),
+        ):
+            hub = AgentHub(
+                workspace=str(temp_workspace),
+                api_key="test-key",
+                pool_config=AgentPoolConfig(max_size=2)
+            )
+
+            code_agent = await hub.get_agent("code")
+            await hub.get_agent("analysis")
+
+            # Touch code so analysis becomes the least recently used
+            assert await hub.get_agent("code") is code_agent
+
+            await hub.get_agent("testing")
+
+            assert "analysis" not in hub.agents
+            assert set(hub.agents) == {"code", "testing"}
+
+    async def test_eviction_skips_busy_agents(self, temp_workspace):
+        """An agent with a task in flight is never evicted."""
+        from openhands.agent_hub import AgentHub, AgentPoolConfig
+
+        release = asyncio.Event()
+
+        def make_client(**kwargs):
+            client = AsyncMock()
+
+            async def mock_receive():
+                await release.wait()
+                yield Mock(content=[Mock(text="done")])
+
+            client.receive_response = mock_receive
+            return client
+
+        with patch('openhands.agent_hub.hub.ClaudeSDKClient', side_effect=make_client):
+            hub = AgentHub(
+                workspace=str(temp_workspace),
+                api_key="test-key",
+                pool_config=AgentPoolConfig(max_size=1)
+            )
+
+            task = asyncio.create_task(hub.execute_task("code", "Long task"))
+            while not hub._active.get("code"):
+                await asyncio.sleep(0)
+
+            # Cache is full but its only agent is busy: the cache
+            # overflows instead of disconnecting code mid-task
+            await hub.get_agent("analysis")
+            assert "code" in hub.agents
+            assert "analysis" in hub.agents
+
+            release.set()
+            messages = await task
+            assert len(messages) == 1
+            assert hub._active["code"] == 0
+
+    async def test_cleanup(self, temp_workspace):
         """Test cleanup disconnects all agents."""
         from openhands.agent_hub import AgentHub
 
-        mock_jupyter.return_value = Mock()
-        mock_browser.return_value = Mock()
-
         # Create mock client
         mock_client = AsyncMock()
         mock_client.connect = AsyncMock()
@@ -292,15 +315,10 @@ class TestAgentHub:
             assert mock_client.disconnect.call_count == 2
             assert len(hub.agents) == 0
 
-    @patch('openhands.agent_hub.hub.create_jupyter_mcp_server')
-    @patch('openhands.agent_hub.hub.create_browser_mcp_server')
-    async def test_context_manager(self, mock_browser, mock_jupyter, temp_workspace):
+    async def test_context_manager(self, temp_workspace):
         """Test AgentHub as async context manager."""
         from openhands.agent_hub import AgentHub
 
-        mock_jupyter.return_value = Mock()
-        mock_browser.return_value = Mock()
-
         mock_client = AsyncMock()
         mock_client.connect = AsyncMock()
         mock_client.disconnect = AsyncMock()
@@ -313,15 +331,10 @@ class TestAgentHub:
             # Cleanup should be called automatically
             assert mock_client.disconnect.called
 
-    @patch('openhands.agent_hub.hub.create_jupyter_mcp_server')
-    @patch('openhands.agent_hub.hub.create_browser_mcp_server')
-    def test_load_prompt_existing(self, mock_browser, mock_jupyter, temp_workspace):
+    def test_load_prompt_existing(self, temp_workspace):
         """Test loading existing prompt file."""
         from openhands.agent_hub import AgentHub
 
-        mock_jupyter.return_value = Mock()
-        mock_browser.return_value = Mock()
-
         # Create a test prompt file
         prompts_dir = temp_workspace / "prompts"
         prompts_dir.mkdir(exist_ok=True)
@@ -337,15 +350,10 @@ class TestAgentHub:
         prompt = hub._load_prompt("test_agent.txt")
         assert prompt == "Test prompt content"
 
-    @patch('openhands.agent_hub.hub.create_jupyter_mcp_server')
-    @patch('openhands.agent_hub.hub.create_browser_mcp_server')
-    def test_load_prompt_missing(self, mock_browser, mock_jupyter, temp_workspace):
+    def test_load_prompt_missing(self, temp_workspace):
         """Test loading missing prompt file uses default."""
         from openhands.agent_hub import AgentHub
 
-        mock_jupyter.return_value = Mock()
-        mock_browser.return_value = Mock()
-
         prompts_dir = temp_workspace / "prompts"
         prompts_dir.mkdir(exist_ok=True)
 
@@ -5,6 +5,8 @@ Tests Jupyter and Browser MCP servers without requiring actual
 kernel or browser instances.
 """
 
+import json
+
 import pytest
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 
@@ -210,6 +212,94 @@ class TestBrowserMCP:
         assert mock_manager.get_page_info.called
 
 
+@pytest.mark.unit
+class TestBatchMCP:
+    """Test Batch MCP execute tool."""
+
+    @staticmethod
+    def _execute():
+        from openhands.mcp_servers.batch_mcp import batch_execute
+
+        # Unwrap the SDK tool decorator the same way _invoke does
+        return getattr(batch_execute, 'handler', None) or batch_execute
+
+    async def test_execute_runs_all_calls(self):
+        """All sub-calls run and results come back in request order."""
+        from openhands.mcp_servers import batch_mcp
+
+        async def echo(args):
+            return {"content": [{"type": "text", "text": args["value"]}]}
+
+        with patch.dict(batch_mcp._dispatch_table, {"echo": echo}, clear=True):
+            result = await self._execute()({
+                "calls": [
+                    {"tool": "mcp__fake__echo", "args": {"value": "a"}},
+                    {"tool": "echo", "args": {"value": "b"}},
+                ]
+            })
+
+        assert result["isError"] is False
+        payload = json.loads(result["content"][0]["text"])
+        assert [r["tool"] for r in payload] == ["mcp__fake__echo", "echo"]
+        assert all("result" in r for r in payload)
+
+    async def test_failure_without_stop_on_error(self):
+        """One failing sub-call doesn't prevent the others from running."""
+        from openhands.mcp_servers import batch_mcp
+
+        async def boom(args):
+            raise RuntimeError("boom")
+
+        async def echo(args):
+            return {"content": [{"type": "text", "text": "ok"}]}
+
+        targets = {"boom": boom, "echo": echo}
+        with patch.dict(batch_mcp._dispatch_table, targets, clear=True):
+            result = await self._execute()({
+                "calls": [
+                    {"tool": "boom", "args": {}},
+                    {"tool": "echo", "args": {}},
+                ]
+            })
+
+        assert result["isError"] is True
+        payload = json.loads(result["content"][0]["text"])
+        assert payload[0]["error"] == "boom"
+        assert "result" in payload[1]
+
+    async def test_stop_on_error_skips_remaining(self):
+        """With stopOnError, calls after the first failure are skipped."""
+        from openhands.mcp_servers import batch_mcp
+
+        async def boom(args):
+            raise RuntimeError("boom")
+
+        async def echo(args):
+            return {"content": [{"type": "text", "text": "ok"}]}
+
+        targets = {"boom": boom, "echo": echo}
+        with patch.dict(batch_mcp._dispatch_table, targets, clear=True):
+            result = await self._execute()({
+                "calls": [
+                    {"tool": "boom", "args": {}},
+                    {"tool": "echo", "args": {}},
+                ],
+                "stopOnError": True,
+            })
+
+        assert result["isError"] is True
+        payload = json.loads(result["content"][0]["text"])
+        assert payload[0]["error"] == "boom"
+        assert payload[1]["skipped"] is True
+
+    async def test_execute_no_calls(self):
+        """Empty call list is rejected."""
+        result = await self._execute()({"calls": []})
+
+        assert result["isError"] is True
+        assert "No calls provided" in result["content"][0]["text"]
+
+
 @pytest.mark.unit
 class TestMCPServerIntegration:
     """Test MCP server integration with agents."""